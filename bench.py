@@ -0,0 +1,553 @@
+#!/usr/bin/env python3
+"""
+Bench Design Command Line
+One entry point for drawings, viewers, sweeps, fabrication checks, nesting,
+DXF export and the gallery; each subcommand imports only the modules it needs
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Median wall time (ms) allowed for `bench [COMMAND] --help` in a fresh
+# interpreter, i.e. the fixed cost every scripted call pays before doing work
+STARTUP_BUDGET_MS = {
+    '': 80,          # bench --help: standard library only
+    'svg': 250,      # parsers list concepts statically; geometry loads on run
+    'check': 250,
+    'sweep': 250,
+    'viewer': 250,   # plotly itself is imported when the page is built
+    'gltf': 250,
+    'gallery': 250,
+    'nest': 250,
+    'dxf': 250,
+    'interference': 250,
+    'holes': 250,
+    'cost': 250,
+    'structure': 250,
+    'optimize': 250,
+    'benchmark': 250,
+    'startup': 80,
+}
+
+
+# Concept slugs in bench_model.CONCEPTS order, listed here so building a
+# parser never imports the geometry modules
+CONCEPT_SLUGS = ('concept-4', 'concept-2')
+
+
+def add_concept_arguments(parser: argparse.ArgumentParser):
+    """Concept selection shared by svg, viewer and check"""
+    parser.add_argument('concepts', nargs='*', metavar='CONCEPT',
+                        help=f"Concepts to process ({', '.join(sorted(CONCEPT_SLUGS))}; default: all)")
+    parser.add_argument('-p', '--param', action='append', default=[], metavar='NAME=VALUE',
+                        help="Factory parameter override, e.g. length=48 (single concept only)")
+
+
+def selected_concepts(args: argparse.Namespace) -> List[Tuple[str, Dict]]:
+    """(concept, params) pairs from the concept arguments"""
+    concepts = args.concepts or list(CONCEPT_SLUGS)
+    unknown = [c for c in concepts if c not in CONCEPT_SLUGS]
+    if unknown:
+        raise SystemExit(f"Unknown concept(s) {', '.join(unknown)}; "
+                         f"choose from {', '.join(sorted(CONCEPT_SLUGS))}")
+    params = {}
+    if args.param:
+        from bench_sweep import expand_variants, parse_params
+
+        if len(concepts) != 1:
+            raise SystemExit("--param needs exactly one concept")
+        variants = expand_variants(parse_params(args.param))
+        if len(variants) != 1:
+            raise SystemExit(f"--param values expand to {len(variants)} variants; "
+                             "give one value per parameter, or use `bench sweep` for ranges")
+        params = variants[0]
+    return [(concept, params) for concept in concepts]
+
+
+def render_cache(args: argparse.Namespace):
+    from render_cache import RenderCache
+    return None if args.no_cache else RenderCache()
+
+
+def configure_svg(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('-o', '--output-dir', default='.')
+    parser.add_argument('--compact', action='store_true',
+                        help="Merge same-style shapes into paths and reuse repeated geometry")
+    parser.add_argument('--precision', type=int, default=2,
+                        help="Decimal places for coordinates in compact output")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-render even if the render cache is up to date")
+    parser.add_argument('--profile', metavar='FILE',
+                        help="Print per-stage timings and write them to FILE as JSON")
+    parser.add_argument('--trace', metavar='FILE',
+                        help="Write per-stage timings as a Chrome trace (chrome://tracing, Perfetto)")
+    parser.add_argument('--profile-memory', action='store_true',
+                        help="Also record peak allocation per stage (slower)")
+
+
+def run_svg(args: argparse.Namespace) -> int:
+    from bench_model import build_model
+
+    profiler = None
+    if args.profile or args.trace or args.profile_memory:
+        from profiling import StageProfiler
+        profiler = StageProfiler(memory=args.profile_memory)
+
+    # A cached drawing would not be rendered, so there would be nothing to profile
+    cache = render_cache(args) if profiler is None else None
+    os.makedirs(args.output_dir, exist_ok=True)
+    for concept, params in selected_concepts(args):
+        filename = os.path.join(args.output_dir, f"{concept}-drawings.svg")
+        rendered = build_model(concept, **params).render_drawing(
+            filename, cache=cache, compact=args.compact, precision=args.precision,
+            profiler=profiler)
+        print(f"✓ Saved {filename}" if rendered else f"✓ {filename} up to date")
+
+    if profiler is not None:
+        print('\n'.join(profiler.summary()))
+        if args.profile:
+            profiler.write_json(args.profile)
+            print(f"✓ Saved {args.profile}")
+        if args.trace:
+            profiler.write_trace(args.trace)
+            print(f"✓ Saved {args.trace}")
+    return 0
+
+
+def configure_viewer(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('-o', '--output-dir', default='.')
+    parser.add_argument('--batched', action='store_true',
+                        help="Draw the model as a single mesh trace")
+    parser.add_argument('--explode-distance', type=float, default=None,
+                        help="Exploded-view spacing (default: half the median panel's longest side)")
+    parser.add_argument('--sequence', action='store_true',
+                        help="Animate the assembly step by step instead of assembled/exploded")
+    parser.add_argument('--frames', type=int, default=2,
+                        help="Animation frames per transition (1 = jump between states)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-render even if the render cache is up to date")
+
+
+def run_viewer(args: argparse.Namespace) -> int:
+    from bench_model import build_model
+
+    cache = render_cache(args)
+    os.makedirs(args.output_dir, exist_ok=True)
+    for concept, params in selected_concepts(args):
+        filename = os.path.join(args.output_dir, f"{concept}-3d.html")
+        model = build_model(concept, args.explode_distance, **params)
+        states = model.assembly_states() if args.sequence else None
+        rendered = model.write_viewer(filename, cache=cache, batched=args.batched,
+                                      states=states, transition_frames=args.frames)
+        print(f"✓ Saved {filename}" if rendered else f"✓ {filename} up to date")
+    return 0
+
+
+def configure_gltf(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('-o', '--output-dir', default='.')
+    parser.add_argument('--explode-distance', type=float, default=None,
+                        help="Exploded-scene spacing (default: half the median panel's longest side)")
+
+
+def run_gltf(args: argparse.Namespace) -> int:
+    from bench_model import build_model
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for concept, params in selected_concepts(args):
+        filename = os.path.join(args.output_dir, f"{concept}.glb")
+        model = build_model(concept, args.explode_distance, **params)
+        size = model.write_glb(filename)
+        print(f"✓ Saved {filename} ({len(model)} panels, {size / 1024:,.1f} KiB)")
+    return 0
+
+
+def configure_sweep(parser: argparse.ArgumentParser):
+    parser.add_argument('concept', choices=sorted(CONCEPT_SLUGS))
+    parser.add_argument('-p', '--param', action='append', default=[], metavar='NAME=RANGE',
+                        help="Parameter range as start:stop:step, a,b,c or a single value "
+                             "(e.g. length=48:72:6, leg_inset=3,5)")
+    parser.add_argument('-o', '--output-dir', default='sweep-output')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Worker processes (default: CPU count; 1 renders in-process)")
+    parser.add_argument('--chunk-size', type=int, default=8,
+                        help="Variants per scheduled work item")
+    parser.add_argument('--explode-distance', type=float, default=None,
+                        help="Exploded-view spacing (default: half the median panel's longest side)")
+    parser.add_argument('--no-svg', action='store_true', help="Skip SVG drawings")
+    parser.add_argument('--compact', action='store_true', help="Write compact SVG drawings")
+    parser.add_argument('--no-viewer', action='store_true', help="Skip 3D viewers")
+    parser.add_argument('--check', action='store_true',
+                        help="Skip variants that break SendCutSend fabrication limits")
+
+
+def run_sweep(args: argparse.Namespace) -> int:
+    from bench_sweep import main
+    main(args)
+    return 0
+
+
+def configure_check(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+
+
+def run_check(args: argparse.Namespace) -> int:
+    from bench_sweep import CONCEPT_TITLES, build_variant
+    from fabrication import check_panels, describe_violations
+
+    failed = False
+    for concept, params in selected_concepts(args):
+        panels = build_variant(concept, params)
+        table = check_panels(panels)
+        print(f"{CONCEPT_TITLES[concept]}: {int(table['ok'].sum())}/{len(panels)} panels within limits")
+        for line in describe_violations(panels, table):
+            print(f"  ✗ {line}")
+        failed |= not table['ok'].all()
+    return 1 if failed else 0
+
+
+def configure_interference(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('--max-gap', type=float, default=0.25,
+                        help="Report panels at most this far apart (inches)")
+    parser.add_argument('--all', action='store_true', help="List contacts and gaps, not just overlaps")
+
+
+def run_interference(args: argparse.Namespace) -> int:
+    import numpy as np
+    from bench_sweep import CONCEPT_TITLES, build_variant
+    from interference import CONTACT, GAP, OVERLAP, check_interference, describe_interference
+
+    failed = False
+    for concept, params in selected_concepts(args):
+        panels = build_variant(concept, params)
+        table = check_interference(panels, max_gap=args.max_gap)
+        counts = np.bincount(table['kind'], minlength=3)
+        print(f"{CONCEPT_TITLES[concept]}: {counts[OVERLAP]} overlaps, "
+              f"{counts[CONTACT]} contacts, {counts[GAP]} gaps")
+        shown = table if args.all else table[table['kind'] == OVERLAP]
+        for line in describe_interference(panels, shown):
+            print(f"  {line}")
+        failed |= bool(counts[OVERLAP])
+    return 1 if failed else 0
+
+
+def configure_holes(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('--tolerance', type=float, default=0.02,
+                        help="Largest off-axis error for a matched bolt hole (inches)")
+
+
+def run_holes(args: argparse.Namespace) -> int:
+    from bench_sweep import CONCEPT_TITLES, build_variant
+    from hole_alignment import MATCHED, check_hole_alignment, describe_alignment
+
+    failed = False
+    for concept, params in selected_concepts(args):
+        panels = build_variant(concept, params)
+        table = check_hole_alignment(panels, tolerance=args.tolerance)
+        matched = int((table['status'] == MATCHED).sum())
+        print(f"{CONCEPT_TITLES[concept]}: {matched}/{len(table)} holes aligned with a mating panel")
+        for line in describe_alignment(panels, table):
+            print(f"  ✗ {line}")
+        failed |= matched < len(table)
+    return 1 if failed else 0
+
+
+def configure_cost(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+
+
+def run_cost(args: argparse.Namespace) -> int:
+    from bench_sweep import CONCEPT_TITLES, build_variant
+    from costing import cost_panels, describe_costs
+
+    for concept, params in selected_concepts(args):
+        panels = build_variant(concept, params)
+        print(f"{CONCEPT_TITLES[concept]}:")
+        for line in describe_costs(panels, cost_panels(panels)):
+            print(f"  {line}")
+    return 0
+
+
+def configure_structure(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('--min-safety', type=float, default=2.0,
+                        help="Lowest acceptable safety factor against yield")
+
+
+def run_structure(args: argparse.Namespace) -> int:
+    from bench_sweep import CONCEPT_TITLES, build_variant
+    from structural import analyse_panels, describe_results
+
+    failed = False
+    for concept, params in selected_concepts(args):
+        panels = build_variant(concept, params)
+        spans, results = analyse_panels(panels)
+        print(f"{CONCEPT_TITLES[concept]}: {len(spans)} supported seat(s)")
+        for line in describe_results(panels, spans, results, min_safety=args.min_safety):
+            print(f"  {line}")
+        failed |= bool((results['safety_factor'] < args.min_safety).any())
+    return 1 if failed else 0
+
+
+def configure_optimize(parser: argparse.ArgumentParser):
+    parser.add_argument('concept', choices=sorted(CONCEPT_SLUGS))
+    parser.add_argument('--objective', nargs='+', default=['mass', 'cost'], choices=['mass', 'cost'],
+                        help="Quantities to minimise")
+    parser.add_argument('--population', type=int, default=64, help="Candidates per generation")
+    parser.add_argument('--generations', type=int, default=20)
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Worker processes (default: CPU count; 1 evaluates in-process)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--seat-height', type=float, default=17.0, help="Target seat top height (inches)")
+    parser.add_argument('--max-deflection', type=float, default=0.25,
+                        help="Largest seat sag in any load case (inches)")
+    parser.add_argument('--min-safety', type=float, default=2.0)
+    parser.add_argument('--memo', default=None, metavar='FILE',
+                        help="JSON file of evaluated designs, reused across runs")
+    parser.add_argument('--render', default=None, metavar='DIR',
+                        help="Write drawings of every Pareto-front design to DIR")
+
+
+def run_optimize(args: argparse.Namespace) -> int:
+    from bench_optimizer import SEARCH_SPACES, DesignTargets, Memo, describe_result, optimize
+
+    if args.concept not in SEARCH_SPACES:
+        raise SystemExit(f"No search space for {args.concept}; "
+                         f"choose from {', '.join(sorted(SEARCH_SPACES))}")
+    targets = DesignTargets(seat_height=args.seat_height, max_deflection=args.max_deflection,
+                            min_safety=args.min_safety)
+    result = optimize(args.concept, targets, args.objective, population=args.population,
+                      generations=args.generations, workers=args.workers, seed=args.seed,
+                      memo=Memo(args.memo))
+    lines = describe_result(result)
+    print(lines[0])
+    for line in lines[1:]:
+        print(f"  {line}")
+    if args.render:
+        from bench_model import build_model
+
+        os.makedirs(args.render, exist_ok=True)
+        for record in result.front:
+            filename = os.path.join(args.render, f"{record['id']}-drawings.svg")
+            model = build_model(args.concept, **record['params'])
+            model.render_drawing(filename, f"{model.title} ({record['id']})")
+            print(f"✓ Saved {filename}")
+    return 0 if result.front else 1
+
+
+def configure_nest(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('--copies', type=int, default=1, help="Benches per concept in the batch")
+    parser.add_argument('--spacing', type=float, default=0.25, help="Gap between parts (inches)")
+    parser.add_argument('-o', '--output-dir', default='nesting-output')
+
+
+def run_nest(args: argparse.Namespace) -> int:
+    from bench_model import build_model
+    from nesting import describe_nesting, nest_panels, write_sheet_layouts
+    from svg_bench_drawer import PanelSet
+
+    unplaced = False
+    for concept, params in selected_concepts(args):
+        model = build_model(concept, **params)
+        panels = PanelSet.concatenate([model.panels] * args.copies)
+        result = nest_panels(panels, spacing=args.spacing)
+        print(f"{model.title} × {args.copies}: {len(result.sheets)} sheets, "
+              f"{result.utilization:.1%} overall utilization")
+        for line in describe_nesting(panels, result):
+            print(f"  {line}")
+        for name in write_sheet_layouts(panels, result, args.output_dir, prefix=concept):
+            print(f"✓ Saved {os.path.join(args.output_dir, name)}")
+        unplaced |= len(result.unplaced) > 0
+    return 1 if unplaced else 0
+
+
+def configure_dxf(parser: argparse.ArgumentParser):
+    add_concept_arguments(parser)
+    parser.add_argument('--nest', action='store_true',
+                        help="Write one file per nested stock sheet instead of per panel")
+    parser.add_argument('--copies', type=int, default=1, help="Benches per concept in the batch")
+    parser.add_argument('--spacing', type=float, default=0.25,
+                        help="Gap between nested parts (inches)")
+    parser.add_argument('-o', '--output-dir', default='dxf-output')
+
+
+def run_dxf(args: argparse.Namespace) -> int:
+    from bench_model import build_model
+    from dxf_export import export_panels, export_sheets
+    from nesting import nest_panels
+    from svg_bench_drawer import PanelSet
+
+    unplaced = False
+    for concept, params in selected_concepts(args):
+        model = build_model(concept, **params)
+        panels = PanelSet.concatenate([model.panels] * args.copies)
+        if args.nest:
+            result = nest_panels(panels, spacing=args.spacing)
+            names = export_sheets(panels, result, args.output_dir, prefix=concept)
+            for part in result.unplaced.tolist():
+                print(f"  ✗ {panels.names[part]} does not fit a stock sheet")
+            unplaced |= len(result.unplaced) > 0
+        else:
+            names = export_panels(panels, args.output_dir, prefix=concept)
+        print(f"✓ Saved {len(names)} DXF files for {model.title} to {args.output_dir}")
+    return 1 if unplaced else 0
+
+
+def configure_gallery(parser: argparse.ArgumentParser):
+    from gallery import add_gallery_arguments
+    add_gallery_arguments(parser)
+
+
+def run_gallery(args: argparse.Namespace) -> int:
+    from gallery import main
+    main(args)
+    return 0
+
+
+def configure_benchmark(parser: argparse.ArgumentParser):
+    parser.add_argument('--sizes', type=int, nargs='+', default=[3, 30, 300, 3000],
+                        metavar='MODULES', help="Concept 2 module counts to benchmark")
+    parser.add_argument('--case', action='append', default=None, metavar='NAME',
+                        help="Run only this case (repeatable), e.g. SVGDrawing.to_svg")
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="Seconds each case is repeated for")
+    parser.add_argument('-o', '--output', default=None,
+                        help="Where to write this run's results (default: benchmark-results.json, "
+                             "or viewer-payload.json with --viewer-payload)")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="Compare against a baseline results file; exits 1 on regressions")
+    parser.add_argument('--results', metavar='FILE',
+                        help="With --compare, compare this results file instead of running")
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help="Relative slow-down (or memory growth) counted as a regression")
+    parser.add_argument('--viewer-payload', action='store_true',
+                        help="Instead of timing, compare viewer page size and parse time "
+                             "with and without typed arrays")
+
+
+def run_benchmark(args: argparse.Namespace) -> int:
+    from benchmarks import (compare_runs, compare_viewer_payloads, describe_comparison,
+                            describe_payload_savings, format_payload, format_record,
+                            load_results, run_benchmarks)
+
+    if args.viewer_payload:
+        if args.compare or args.results:
+            raise SystemExit("--viewer-payload cannot be combined with --compare or --results")
+        output = args.output or 'viewer-payload.json'
+        report = compare_viewer_payloads(args.sizes, progress=lambda r: print(format_payload(r)))
+        for line in describe_payload_savings(report['viewer_payloads']):
+            print(line)
+        with open(output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Saved {output}")
+        return 0
+
+    if args.results and not args.compare:
+        raise SystemExit("--results needs --compare")
+    if args.results:
+        current = load_results(args.results)
+    else:
+        current = run_benchmarks(args.sizes, args.case, args.min_time,
+                                 progress=lambda record: print(format_record(record)))
+        output = args.output or 'benchmark-results.json'
+        with open(output, 'w') as f:
+            json.dump(current, f, indent=2)
+        print(f"✓ Saved {output}")
+
+    if not args.compare:
+        return 0
+    try:
+        rows = compare_runs(load_results(args.compare), current, args.threshold)
+    except ValueError as exc:
+        raise SystemExit(f"{args.compare}: {exc}")
+    for line in describe_comparison(rows):
+        print(line)
+    regressions = sum(row['status'] == 'regression' for row in rows)
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%} in {len(rows)} cases")
+    return 1 if regressions else 0
+
+
+def configure_startup(parser: argparse.ArgumentParser):
+    parser.add_argument('--runs', type=int, default=5, help="Interpreter launches per command")
+
+
+def measure_startup(command: str, runs: int) -> float:
+    """Median wall time (ms) of `bench [command] --help` in fresh interpreters"""
+    argv = [sys.executable, os.path.abspath(__file__)] + ([command] if command else []) + ['--help']
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, stdout=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return sorted(times)[len(times) // 2]
+
+
+def run_startup(args: argparse.Namespace) -> int:
+    over = 0
+    for command, budget in STARTUP_BUDGET_MS.items():
+        elapsed = measure_startup(command, args.runs)
+        mark = '✓' if elapsed <= budget else '✗'
+        over += elapsed > budget
+        print(f"{mark} bench {command or '--help':<8} {elapsed:7.1f} ms  (budget {budget} ms)")
+    return 1 if over else 0
+
+
+# name -> (help, configure, run); configure may import heavy modules and is
+# only called for the command being run
+COMMANDS: Dict[str, Tuple[str, Callable[[argparse.ArgumentParser], None],
+                          Callable[[argparse.Namespace], int]]] = {
+    'svg': ("Render SVG technical drawings", configure_svg, run_svg),
+    'viewer': ("Render interactive 3D viewers", configure_viewer, run_viewer),
+    'gltf': ("Export assembled and exploded models as binary glTF", configure_gltf, run_gltf),
+    'sweep': ("Render variants over parameter ranges", configure_sweep, run_sweep),
+    'check': ("Check panels against fabrication limits", configure_check, run_check),
+    'interference': ("Find overlapping, touching and near panels",
+                     configure_interference, run_interference),
+    'holes': ("Check that bolt holes line up across mating panels", configure_holes, run_holes),
+    'cost': ("Estimate mass, material and fabrication cost", configure_cost, run_cost),
+    'structure': ("Seat deflection, stress and safety factor under load",
+                  configure_structure, run_structure),
+    'optimize': ("Search parameters for the lightest, cheapest feasible designs",
+                 configure_optimize, run_optimize),
+    'nest': ("Nest flat patterns onto stock sheets", configure_nest, run_nest),
+    'dxf': ("Export flat patterns as DXF cut files", configure_dxf, run_dxf),
+    'gallery': ("Build every concept and comparison.html", configure_gallery, run_gallery),
+    'benchmark': ("Time the pipeline on growing assemblies; compare runs",
+                  configure_benchmark, run_benchmark),
+    'startup': ("Measure command startup time against its budget", configure_startup, run_startup),
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """Parser with full arguments for command and stubs for the others"""
+    parser = argparse.ArgumentParser(prog='bench', description="Metal bench design tools")
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+    for name, (help_text, configure, run) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        if name == command:
+            configure(subparser)
+        subparser.set_defaults(run=run)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    # The command is the first positional; bench itself takes no option values
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    args = build_parser(command).parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
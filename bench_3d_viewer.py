@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """
 Interactive 3D Bench Visualizer using Plotly
-Creates browser-based 3D models with assembly/exploded view toggle
+Creates browser-based 3D models with animated assembly/exploded transitions
 """
 
-import plotly.graph_objects as go
+import base64
 import numpy as np
-from typing import List, Tuple, Dict
+from typing import TYPE_CHECKING, List, Tuple, Dict, Union, Callable, Optional, Sequence
 from dataclasses import dataclass
 
+from svg_bench_drawer import PanelSet, Panels, as_panel_set
+from bench_model import BOX_TRIANGLES, build_model
+
+if TYPE_CHECKING:
+    # plotly is slow to import; functions that build traces import it on use
+    import plotly.graph_objects as go
+
 
 @dataclass
 class Panel3D:
@@ -35,145 +42,193 @@ def create_box_mesh(x: float, y: float, z: float,
         [x, y + depth, z + thickness],
     ])
 
-    # Define 12 triangles (2 per face, 6 faces)
-    i = [0, 0, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5,  # Vertices for triangles
-         0, 0, 1, 1, 4, 4, 5, 5, 2, 2, 3, 3]
-    j = [1, 1, 2, 2, 3, 3, 0, 0, 5, 5, 6, 6,
-         4, 4, 5, 5, 7, 7, 6, 6, 6, 6, 7, 7]
-    k = [4, 2, 5, 6, 6, 7, 7, 4, 6, 7, 7, 4,
-         1, 3, 0, 2, 3, 0, 1, 4, 3, 7, 0, 4]
+    return box_mesh_from_vertices(vertices, color)
+
+
+# Triangle indices into the 8 box corners (corner order matches Panel.get_corners)
+BOX_I, BOX_J, BOX_K = BOX_TRIANGLES.T.tolist()
 
+
+def box_mesh_from_vertices(vertices: np.ndarray, color: str = '#b0b0b0') -> Dict:
+    """Create a box mesh from an 8x3 corner array"""
     return {
         'x': vertices[:, 0],
         'y': vertices[:, 1],
         'z': vertices[:, 2],
-        'i': i,
-        'j': j,
-        'k': k,
+        'i': list(BOX_I),
+        'j': list(BOX_J),
+        'k': list(BOX_K),
         'color': color,
         'vertices': vertices
     }
 
 
+def create_panel_meshes(panels: Panels, color: str = 'white') -> List[Dict]:
+    """Create one box mesh per panel of a PanelSet (or list of Panel)"""
+    panels = as_panel_set(panels)
+    meshes = []
+    for name, vertices in zip(panels.names, panels.corners):
+        mesh = box_mesh_from_vertices(vertices, color)
+        mesh['name'] = name
+        meshes.append(mesh)
+    return meshes
+
+
 def create_concept_4_assembled() -> List[Dict]:
     """Create Concept 4 in assembled state"""
-    panels = []
+    return build_model('concept-4').meshes()
 
-    # Seat: 60" x 11" x 0.125" at height 16"
-    seat = create_box_mesh(0, 0, 16.0, 60.0, 11.0, 0.125, 'white')
-    seat['name'] = 'Seat Panel'
-    panels.append(seat)
 
-    # Left leg: 0.25" thin x 11" deep x 16" tall (VERTICAL SLAB running front-to-back)
-    left_leg = create_box_mesh(5.0, 0, 0, 0.25, 11.0, 16.0, 'white')
-    left_leg['name'] = 'Left Leg'
-    panels.append(left_leg)
+def create_concept_4_exploded() -> List[Dict]:
+    """Create Concept 4 in exploded state (seat up, legs outwards)"""
+    return build_model('concept-4').meshes(exploded=True)
 
-    # Right leg: 0.25" thin x 11" deep x 16" tall (VERTICAL SLAB running front-to-back)
-    right_leg = create_box_mesh(54.75, 0, 0, 0.25, 11.0, 16.0, 'white')
-    right_leg['name'] = 'Right Leg'
-    panels.append(right_leg)
 
-    return panels
+def create_concept_2_assembled() -> List[Dict]:
+    """Create Concept 2 U-modules in assembled state"""
+    return build_model('concept-2').meshes()
 
 
-def create_concept_4_exploded() -> List[Dict]:
-    """Create Concept 4 in exploded state"""
-    panels = []
-    explode_offset = 8.0
+def create_concept_2_exploded() -> List[Dict]:
+    """Create Concept 2 U-modules in exploded state"""
+    return build_model('concept-2').meshes(exploded=True)
 
-    # Seat moved up
-    seat = create_box_mesh(0, 0, 16.0 + explode_offset, 60.0, 11.0, 0.125, 'white')
-    seat['name'] = 'Seat Panel'
-    panels.append(seat)
 
-    # Left leg moved left (VERTICAL SLAB running front-to-back)
-    left_leg = create_box_mesh(5.0 - explode_offset, 0, 0, 0.25, 11.0, 16.0, 'white')
-    left_leg['name'] = 'Left Leg'
-    panels.append(left_leg)
+# plotly.py (6+) writes numpy arrays into the page as base64 typed arrays;
+# float32 halves the coordinates, and lists are written as decimal JSON
+COORDINATE_DTYPE = np.float32
 
-    # Right leg moved right (VERTICAL SLAB running front-to-back)
-    right_leg = create_box_mesh(54.75 + explode_offset, 0, 0, 0.25, 11.0, 16.0, 'white')
-    right_leg['name'] = 'Right Leg'
-    panels.append(right_leg)
 
-    return panels
+def index_dtype(vertex_count: int) -> np.dtype:
+    """Narrowest unsigned integer type that indexes vertex_count vertices"""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if vertex_count <= np.iinfo(dtype).max + 1:
+            return np.dtype(dtype)
+    raise ValueError(f"{vertex_count} vertices is too many for one mesh trace")
 
 
-def create_concept_2_assembled() -> List[Dict]:
-    """Create Concept 2 U-modules in assembled state"""
-    panels = []
+# Arrays shorter than this are written as JSON lists: for a single box's
+# 8 corners or 12 triangles the base64 wrapper costs more than it saves
+TYPED_ARRAY_MIN_LENGTH = 16
 
-    for i in range(3):
-        x_offset = i * 21.0
-        module_color = 'white'
+# Decimal places of coordinates written as lists, about float32's resolution
+# at bench scale
+LIST_DECIMALS = 4
 
-        # Seat top of U: 21" x 12" x 0.1" at height 17"
-        seat = create_box_mesh(x_offset, 0, 17.0, 21.0, 12.0, 0.1, module_color)
-        seat['name'] = f'Module {i+1} Seat'
-        panels.append(seat)
 
-        # Left vertical wall: 0.1" thin x 12" deep x 14" tall (thin plate spanning full depth)
-        left_wall = create_box_mesh(x_offset, 0, 3.0, 0.1, 12.0, 14.0, module_color)
-        left_wall['name'] = f'Module {i+1} Left Wall'
-        panels.append(left_wall)
+def compact_values(values: np.ndarray) -> Union[np.ndarray, List]:
+    """values as written compactly: the array itself, or a short rounded list"""
+    values = np.asarray(values)
+    if len(values) >= TYPED_ARRAY_MIN_LENGTH:
+        return values
+    if values.dtype.kind != 'f':
+        return values.tolist()
+    return [None if v != v else v for v in np.round(values.astype(float), LIST_DECIMALS).tolist()]
 
-        # Right vertical wall: 0.1" thin x 12" deep x 14" tall (thin plate spanning full depth)
-        right_wall = create_box_mesh(x_offset + 20.9, 0, 3.0, 0.1, 12.0, 14.0, module_color)
-        right_wall['name'] = f'Module {i+1} Right Wall'
-        panels.append(right_wall)
 
-        # Left foot (base): 3" x 12" x 3" under left wall
-        left_foot = create_box_mesh(x_offset, 0, 0, 3.0, 12.0, 3.0, module_color)
-        left_foot['name'] = f'Module {i+1} Left Foot'
-        panels.append(left_foot)
+def mesh_arrays(mesh: Dict, typed_arrays: bool = True) -> Dict:
+    """x/y/z and i/j/k of a mesh for Mesh3d
 
-        # Right foot (base): 3" x 12" x 3" under right wall
-        right_foot = create_box_mesh(x_offset + 18.9, 0, 0, 3.0, 12.0, 3.0, module_color)
-        right_foot['name'] = f'Module {i+1} Right Foot'
-        panels.append(right_foot)
+    With typed_arrays, coordinates become float32 and indices the narrowest
+    unsigned type so both are embedded as compact base64, except arrays
+    below TYPED_ARRAY_MIN_LENGTH, which go as rounded lists; otherwise they
+    are passed through unchanged.
+    """
+    if not typed_arrays:
+        return {key: mesh[key] for key in ('x', 'y', 'z', 'i', 'j', 'k')}
+    arrays = {axis: np.asarray(mesh[axis], dtype=COORDINATE_DTYPE) for axis in ('x', 'y', 'z')}
+    dtype = index_dtype(len(arrays['x']))
+    arrays.update({key: np.asarray(mesh[key]).astype(dtype) for key in ('i', 'j', 'k')})
+    return {key: compact_values(values) for key, values in arrays.items()}
 
-    return panels
 
+def face_color_arguments(facecolor: np.ndarray) -> Dict:
+    """Mesh3d colour arguments for per-face colours, without a string per face
 
-def create_concept_2_exploded() -> List[Dict]:
-    """Create Concept 2 U-modules in exploded state"""
-    panels = []
-    spacing = 10.0
+    A single colour becomes color; several become per-cell intensity codes
+    on a colorscale with one stop per colour.
+    """
+    colors, codes = np.unique(np.asarray(facecolor), return_inverse=True)
+    if len(colors) == 1:
+        return {'color': str(colors[0])}
+    top = len(colors) - 1
+    return {
+        'intensity': codes.reshape(-1).astype(index_dtype(len(colors))),
+        'intensitymode': 'cell',
+        'colorscale': [[n / top, str(color)] for n, color in enumerate(colors)],
+        'cmin': 0,
+        'cmax': top,
+        'showscale': False,
+    }
 
-    for i in range(3):
-        x_offset = i * (21.0 + spacing)
-        module_color = 'white'
 
-        # Seat (exploded up and back)
-        seat = create_box_mesh(x_offset, -spacing, 17.0 + spacing, 21.0, 12.0, 0.1, module_color)
-        seat['name'] = f'Module {i+1} Seat'
-        panels.append(seat)
+def merge_box_meshes(panels: List[Dict]) -> Dict:
+    """Merge panel meshes into one vertex/index buffer
 
-        # Left vertical wall (exploded left) - thin plate spanning full depth
-        left_wall = create_box_mesh(x_offset - spacing/2, 0, 3.0, 0.1, 12.0, 14.0, module_color)
-        left_wall['name'] = f'Module {i+1} Left Wall'
-        panels.append(left_wall)
+    Triangle indices of each panel are offset by the number of vertices
+    that precede it, faces get the owning panel's colour, and every vertex
+    carries its panel name as customdata for hover.
+    """
+    vertex_counts = [len(panel['x']) for panel in panels]
+    face_counts = [len(panel['i']) for panel in panels]
+    vertex_offsets = np.repeat(np.cumsum([0] + vertex_counts[:-1]), face_counts)
 
-        # Right vertical wall (exploded right) - thin plate spanning full depth
-        right_wall = create_box_mesh(x_offset + 20.9 + spacing/2, 0, 3.0, 0.1, 12.0, 14.0, module_color)
-        right_wall['name'] = f'Module {i+1} Right Wall'
-        panels.append(right_wall)
+    def stack(key: str) -> np.ndarray:
+        return np.concatenate([np.asarray(panel[key]) for panel in panels])
 
-        # Bottom feet (exploded down)
-        left_foot = create_box_mesh(x_offset - spacing/2, 0, -spacing/2, 3.0, 12.0, 3.0, module_color)
-        left_foot['name'] = f'Module {i+1} Left Foot'
-        panels.append(left_foot)
+    return {
+        'x': stack('x'),
+        'y': stack('y'),
+        'z': stack('z'),
+        'i': stack('i') + vertex_offsets,
+        'j': stack('j') + vertex_offsets,
+        'k': stack('k') + vertex_offsets,
+        'facecolor': np.repeat([panel['color'] for panel in panels], face_counts),
+        'customdata': np.repeat([panel['name'] for panel in panels], vertex_counts),
+        'panel_index': np.repeat(np.arange(len(panels)), vertex_counts),
+    }
 
-        right_foot = create_box_mesh(x_offset + 18.9 + spacing/2, 0, -spacing/2, 3.0, 12.0, 3.0, module_color)
-        right_foot['name'] = f'Module {i+1} Right Foot'
-        panels.append(right_foot)
 
-    return panels
+def group_panels(panels: List[Dict], name: str,
+                 group_key: Optional[Callable[[Dict], str]] = None) -> Dict[str, List[int]]:
+    """Panel indices per batched trace, keyed by trace name"""
+    groups: Dict[str, List[int]] = {}
+    for index, panel in enumerate(panels):
+        groups.setdefault(group_key(panel) if group_key else name, []).append(index)
+    return groups
+
+
+def batched_mesh_traces(panels: List[Dict], name: str, visible: bool,
+                        group_key: Optional[Callable[[Dict], str]] = None,
+                        typed_arrays: bool = True) -> List['go.Mesh3d']:
+    """Create one Mesh3d per panel group (one for all panels by default)"""
+    import plotly.graph_objects as go
+
+    traces = []
+    for group_name, indices in group_panels(panels, name, group_key).items():
+        merged = merge_box_meshes([panels[index] for index in indices])
+        colors = (face_color_arguments(merged['facecolor']) if typed_arrays
+                  else {'facecolor': merged['facecolor']})
+        traces.append(go.Mesh3d(
+            **mesh_arrays(merged, typed_arrays),
+            **colors,
+            customdata=merged['customdata'],
+            hovertemplate='%{customdata}<extra></extra>',
+            opacity=1.0,
+            name=group_name,
+            visible=visible,
+            flatshading=False,
+            lighting=dict(ambient=0.8, diffuse=0.5, specular=0.1, roughness=0.8),
+            lightposition=dict(x=100, y=200, z=300),
+            contour=dict(show=True, color='black', width=1)
+        ))
+    return traces
 
 
-def add_connection_lines(fig: go.Figure, panels: List[Dict], connections: List[Tuple[int, int]]):
+def add_connection_lines(fig: 'go.Figure', panels: List[Dict], connections: List[Tuple[int, int]]):
     """Add dashed lines showing connections between panels"""
+    import plotly.graph_objects as go
+
     for idx1, idx2 in connections:
         p1_center = np.mean(panels[idx1]['vertices'], axis=0)
         p2_center = np.mean(panels[idx2]['vertices'], axis=0)
@@ -189,79 +244,287 @@ def add_connection_lines(fig: go.Figure, panels: List[Dict], connections: List[T
         ))
 
 
-def create_interactive_viewer(concept_name: str, assembled_panels: List[Dict],
-                              exploded_panels: List[Dict], output_file: str):
-    """Create interactive 3D viewer with assembly/exploded toggle"""
+MeshPanels = Union[List[Dict], PanelSet]
+
+# Above this many contacts the connection lines are left out; they would
+# add a large share of every frame and hide the model
+MAX_CONNECTION_LINES = 2000
+
+# (label, (panels, 3) offsets from the assembled positions)
+ViewerState = Tuple[str, np.ndarray]
+
+# plotly.js typed-array codes by numpy dtype
+PLOTLYJS_DTYPES = {'float32': 'f4', 'float64': 'f8', 'uint8': 'u1', 'uint16': 'u2',
+                   'uint32': 'u4', 'int8': 'i1', 'int16': 'i2', 'int32': 'i4'}
+
+
+def typed_array_spec(values: np.ndarray) -> Union[Dict[str, str], List]:
+    """plotly.js typed-array spec for figure data that skips plotly.py validation
+
+    Arrays below TYPED_ARRAY_MIN_LENGTH are returned as rounded lists.
+    """
+    values = compact_values(values)
+    if isinstance(values, list):
+        return values
+    values = np.ascontiguousarray(values)
+    return {'dtype': PLOTLYJS_DTYPES[values.dtype.name],
+            'bdata': base64.b64encode(values.astype(values.dtype.newbyteorder('<'))).decode('ascii')}
+
+
+def panel_displacements(assembled_panels: List[Dict], exploded_panels: List[Dict]) -> np.ndarray:
+    """(panels, 3) shift of each panel's centre from one mesh list to another"""
+    return np.array([np.mean(moved['vertices'], axis=0) - np.mean(panel['vertices'], axis=0)
+                     for panel, moved in zip(assembled_panels, exploded_panels)]).reshape(-1, 3)
+
+
+def interpolate_states(states: Sequence[ViewerState],
+                       steps: int) -> Tuple[List[ViewerState], List[int]]:
+    """Animation frames through a sequence of states, and the frame of each state
+
+    The first frame is the first state; each transition adds steps - 1
+    eased intermediate frames and ends on the next state. A state's frame
+    is named after its label, numbered when the label repeats (a sequence
+    returning to 'Assembled' ends on 'Assembled 2'), so frame names stay
+    unique.
+    """
+    names: List[str] = []
+    for label, _ in states:
+        name, count = label, 1
+        while name in names:
+            count += 1
+            name = f"{label} {count}"
+        names.append(name)
+    offsets = [np.asarray(state, dtype=float) for _, state in states]
+    frames = [(names[0], offsets[0])]
+    keyframes = [0]
+    for name, next_name, start, end in zip(names, names[1:], offsets, offsets[1:]):
+        for step in range(1, steps):
+            t = step / steps
+            t = t * t * (3 - 2 * t)  # Ease in and out
+            frames.append((f"{name} → {next_name} {step}", start + (end - start) * t))
+        keyframes.append(len(frames))
+        frames.append((next_name, end))
+    return frames, keyframes
+
+
+def _animate(frames: List[str], frame_duration: int) -> Dict:
+    """Button/slider method call playing frames in order"""
+    return dict(method='animate', args=[frames, {
+        'frame': {'duration': frame_duration, 'redraw': True},
+        'transition': {'duration': 0},
+        'mode': 'immediate',
+    }])
+
+
+def connection_line_arrays(pairs: np.ndarray, centres: np.ndarray, offsets: Optional[np.ndarray],
+                           typed_arrays: bool = True) -> Dict:
+    """Line trace arguments joining the (a, b) pairs that are apart in a state
+
+    offsets is None while panels move, which hides the lines.
+    """
+    if offsets is None:
+        return {'visible': False}
+    a, b = pairs[:, 0], pairs[:, 1]
+    apart = np.abs(offsets[a] - offsets[b]).max(axis=1) > 1e-9
+    if not apart.any():
+        return {'visible': False}
+    a, b = a[apart], b[apart]
+    points = np.full((len(a), 3, 3), np.nan)  # Start, end, gap
+    points[:, 0] = centres[a] + offsets[a]
+    points[:, 1] = centres[b] + offsets[b]
+    points = points.reshape(-1, 3)
+    if typed_arrays:
+        points = points.astype(COORDINATE_DTYPE)
+    return dict(visible=True, **{key: points[:, axis] for axis, key in enumerate(('x', 'y', 'z'))})
+
+
+def viewer_frames(panels: List[Dict], groups: List[List[int]], frames: List[ViewerState],
+                  keyframes: List[int], pairs: np.ndarray, centres: np.ndarray,
+                  typed_arrays: bool = True) -> List[Dict]:
+    """Plotly frame dicts for frames from interpolate_states
+
+    groups lists the panels of each mesh trace, which are followed by the
+    connection line trace when there are pairs. A frame carries only the
+    traces, and only the axes of them, that move; plotly.js merges each
+    entry into its trace, so type and styling stay. Frames inside a
+    transition are played from its start state, so they carry what moves
+    between its two states. A state's own frame can be jumped to from any
+    state (buttons, slider): the first state's carries every axis that ever
+    moves, and each later one names the state before as its baseframe and
+    adds what moved since, so plotly.js assembles the full state without
+    the page repeating it per state.
+    """
+    counts = np.array([len(panel['x']) for panel in panels])
+    order = np.concatenate([np.asarray(g, dtype=np.int64) for g in groups]) if groups else np.zeros(0, np.int64)
+    vertex_panel = np.repeat(order, counts[order])
+    base = np.column_stack([np.concatenate([np.asarray(panels[i][axis], dtype=float)
+                                            for i in order]) if len(order) else np.zeros(0)
+                            for axis in ('x', 'y', 'z')])
+    splits = np.cumsum([counts[g].sum() for g in groups])[:-1]
+    trace_of_panel = np.zeros(len(panels), dtype=np.int64)
+    for trace, indices in enumerate(groups):
+        trace_of_panel[indices] = trace
+
+    def moved_axes(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        """(panels, 3) whether each panel's offset differs along each axis"""
+        return np.abs(end - start) > 1e-9
+
+    def trace_axes(moved: np.ndarray) -> np.ndarray:
+        """(traces, 3) whether any panel of each trace moves along each axis"""
+        counts = np.zeros((len(groups), 3))
+        np.add.at(counts, trace_of_panel, moved)
+        return counts > 0
+
+    def encode_lines(lines: Dict) -> Dict:
+        encode = typed_array_spec if typed_arrays else (
+            lambda value: [None if np.isnan(v) else v for v in value.tolist()])
+        return {key: value if key == 'visible' else encode(value) for key, value in lines.items()}
+
+    state_offsets = [frames[k][1] for k in keyframes]
+    ever_moved = np.zeros((len(panels), 3), dtype=bool)
+    for offsets in state_offsets[1:]:
+        ever_moved |= moved_axes(state_offsets[0], offsets)
+    transition_moved = [moved_axes(a, b) for a, b in zip(state_offsets, state_offsets[1:])]
+
+    state_of_frame = {frame: state for state, frame in enumerate(keyframes)}
+    frame_dicts = []
+    for n, (name, offsets) in enumerate(frames):
+        frame = {'name': name}
+        state = state_of_frame.get(n)
+        if state == 0:
+            moved = ever_moved
+        elif state is not None:
+            moved = transition_moved[state - 1]
+            frame['baseframe'] = frames[keyframes[state - 1]][0]
+        else:
+            moved = transition_moved[np.searchsorted(keyframes, n) - 1]
+        axes = trace_axes(moved)
+        vertices = base + offsets[vertex_panel]
+        if typed_arrays:
+            vertices = vertices.astype(COORDINATE_DTYPE)
+        data, traces = [], []
+        for trace, trace_vertices in enumerate(np.split(vertices, splits)):
+            if not axes[trace].any():
+                continue
+            coordinates = {key: trace_vertices[:, axis] for axis, key in enumerate(('x', 'y', 'z'))
+                           if axes[trace, axis]}
+            if typed_arrays:
+                coordinates = {key: typed_array_spec(value) for key, value in coordinates.items()}
+            data.append(coordinates)
+            traces.append(trace)
+        if len(pairs):
+            data.append(encode_lines(connection_line_arrays(
+                pairs, centres, None if state is None else offsets, typed_arrays)))
+            traces.append(len(groups))
+        frame_dicts.append(dict(frame, data=data, traces=traces))
+    return frame_dicts
+
+
+def create_viewer_figure(concept_name: str, assembled_panels: MeshPanels,
+                         exploded_panels: Optional[MeshPanels],
+                         batched: bool = False,
+                         group_key: Optional[Callable[[Dict], str]] = None,
+                         typed_arrays: bool = True,
+                         states: Optional[Sequence[ViewerState]] = None,
+                         transition_frames: int = 2,
+                         frame_duration: int = 40,
+                         connections: Optional[Sequence[Tuple[int, int]]] = None
+                         ) -> Tuple['go.Figure', List[Dict]]:
+    """Viewer figure and its animation frames; see create_interactive_viewer
+
+    The frames are plain dicts from viewer_frames, kept out of the figure:
+    plotly.py validation is slow for thousands of frame traces.
+    """
+    import plotly.graph_objects as go
+
+    if isinstance(assembled_panels, PanelSet):
+        assembled_panels = create_panel_meshes(assembled_panels)
+    if isinstance(exploded_panels, PanelSet):
+        exploded_panels = create_panel_meshes(exploded_panels)
+    if states is None:
+        states = [('Assembled', np.zeros((len(assembled_panels), 3))),
+                  ('Exploded', panel_displacements(assembled_panels, exploded_panels))]
+    frames, keyframes = interpolate_states(states, max(transition_frames, 1))
+    if batched:
+        groups = list(group_panels(assembled_panels, 'Model', group_key).values())
+    else:
+        groups = [[index] for index in range(len(assembled_panels))]
+
+    # Start in the first state
+    first = frames[0][1]
+    start_panels = [dict(panel, x=np.asarray(panel['x']) + first[index, 0],
+                         y=np.asarray(panel['y']) + first[index, 1],
+                         z=np.asarray(panel['z']) + first[index, 2])
+                    for index, panel in enumerate(assembled_panels)]
 
     fig = go.Figure()
+    if batched:
+        fig.add_traces(batched_mesh_traces(start_panels, 'Model', True, group_key, typed_arrays))
+    else:
+        for panel in start_panels:
+            fig.add_trace(go.Mesh3d(
+                **mesh_arrays(panel, typed_arrays),
+                color=panel['color'],
+                opacity=1.0,
+                name=panel['name'],
+                visible=True,
+                flatshading=False,
+                lighting=dict(ambient=0.8, diffuse=0.5, specular=0.1, roughness=0.8),
+                lightposition=dict(x=100, y=200, z=300),
+                contour=dict(show=True, color='black', width=1)
+            ))
 
-    # Add assembled state (visible by default)
-    for panel in assembled_panels:
-        fig.add_trace(go.Mesh3d(
-            x=panel['x'],
-            y=panel['y'],
-            z=panel['z'],
-            i=panel['i'],
-            j=panel['j'],
-            k=panel['k'],
-            color=panel['color'],
-            opacity=1.0,
-            name=panel['name'],
-            visible=True,
-            flatshading=False,
-            lighting=dict(ambient=0.8, diffuse=0.5, specular=0.1, roughness=0.8),
-            lightposition=dict(x=100, y=200, z=300),
-            contour=dict(show=True, color='black', width=1)
+    # Connection lines between contacting panels, drawn in each state for
+    # the pairs that are apart and hidden while panels move
+    bounds = np.array([[np.min(panel['vertices'], axis=0), np.max(panel['vertices'], axis=0)]
+                       for panel in assembled_panels]).reshape(-1, 2, 3)
+    if connections is None:
+        from contact_graph import connection_pairs, contact_graph
+
+        connections = connection_pairs(contact_graph(bounds[:, 0], bounds[:, 1] - bounds[:, 0]))
+    pairs = np.asarray(connections, dtype=np.int64).reshape(-1, 2)
+    if len(pairs) > MAX_CONNECTION_LINES:
+        pairs = pairs[:0]
+    centres = bounds.mean(axis=1)
+    if len(pairs):
+        lines = connection_line_arrays(pairs, centres, first, typed_arrays)
+        fig.add_trace(go.Scatter3d(
+            **{key: value if key == 'visible' or not typed_arrays else compact_values(value)
+               for key, value in lines.items()},
+            mode='lines',
+            line=dict(color='black', width=1, dash='dash'),
+            showlegend=False,
+            hoverinfo='skip'
         ))
 
-    # Add exploded state (hidden by default)
-    for panel in exploded_panels:
-        fig.add_trace(go.Mesh3d(
-            x=panel['x'],
-            y=panel['y'],
-            z=panel['z'],
-            i=panel['i'],
-            j=panel['j'],
-            k=panel['k'],
-            color=panel['color'],
-            opacity=1.0,
-            name=panel['name'] + ' (Exploded)',
-            visible=False,
-            flatshading=False,
-            lighting=dict(ambient=0.8, diffuse=0.5, specular=0.1, roughness=0.8),
-            lightposition=dict(x=100, y=200, z=300),
-            contour=dict(show=True, color='black', width=1)
+    frame_dicts = viewer_frames(assembled_panels, groups, frames, keyframes, pairs, centres,
+                                typed_arrays)
+
+    # A button per state animates the transition into it (into the first
+    # state, back from the second)
+    names = [name for name, _ in frames]
+    buttons = []
+    if len(states) > 2:
+        buttons.append(dict(label="▶ Play", **_animate(names, frame_duration)))
+    for n, (label, _) in enumerate(states):
+        if n == 0:
+            path = names[keyframes[0]:keyframes[1] + 1][::-1] if len(states) > 1 else names[:1]
+        else:
+            path = names[keyframes[n - 1] + 1:keyframes[n] + 1]
+        buttons.append(dict(label=label, **_animate(path, frame_duration)))
+    sliders = []
+    if len(states) > 2:
+        sliders.append(dict(
+            active=0,
+            x=0.1,
+            len=0.8,
+            y=0,
+            currentvalue=dict(visible=False),
+            steps=[dict(label=label, **_animate([names[frame]], 0))
+                   for (label, _), frame in zip(states, keyframes)],
+            font=dict(size=10, family='Arial, sans-serif', color='black')
         ))
 
-    # Add connection lines for exploded view
-    if len(exploded_panels) == 3:  # Concept 4
-        connections = [(0, 1), (0, 2)]  # Seat to legs
-        for idx1, idx2 in connections:
-            p1_center = np.mean(exploded_panels[idx1]['vertices'], axis=0)
-            p2_center = np.mean(exploded_panels[idx2]['vertices'], axis=0)
-
-            fig.add_trace(go.Scatter3d(
-                x=[p1_center[0], p2_center[0]],
-                y=[p1_center[1], p2_center[1]],
-                z=[p1_center[2], p2_center[2]],
-                mode='lines',
-                line=dict(color='black', width=1, dash='dash'),
-                showlegend=False,
-                hoverinfo='skip',
-                visible=False
-            ))
-
-    # Create toggle buttons
-    n_assembled = len(assembled_panels)
-    n_exploded = len(exploded_panels)
-    n_lines = len(fig.data) - n_assembled - n_exploded
-
-    # Visibility for assembled state
-    assembled_visible = [True] * n_assembled + [False] * n_exploded + [False] * n_lines
-
-    # Visibility for exploded state
-    exploded_visible = [False] * n_assembled + [True] * n_exploded + [True] * n_lines
-
     # Update layout with buttons
     fig.update_layout(
         title=dict(
@@ -289,24 +552,14 @@ def create_interactive_viewer(concept_name: str, assembled_panels: List[Dict],
                 direction="right",
                 x=0.7,
                 y=1.12,
-                buttons=[
-                    dict(
-                        label="Assembled",
-                        method="update",
-                        args=[{"visible": assembled_visible}]
-                    ),
-                    dict(
-                        label="Exploded",
-                        method="update",
-                        args=[{"visible": exploded_visible}]
-                    )
-                ],
+                buttons=buttons,
                 bgcolor='white',
                 bordercolor='black',
                 borderwidth=0.5,
                 font=dict(size=11, family='Arial, sans-serif', color='black')
             )
         ],
+        sliders=sliders,
         annotations=[
             dict(
                 text="Left-drag: Rotate / Right-drag: Pan / Scroll: Zoom",
@@ -334,18 +587,98 @@ def create_interactive_viewer(concept_name: str, assembled_panels: List[Dict],
         plot_bgcolor='white'
     )
 
-    # Save to HTML
-    fig.write_html(output_file, config={
-        'displayModeBar': True,
-        'displaylogo': False,
-        'modeBarButtonsToRemove': ['toImage'],
-        'modeBarButtonsToAdd': ['hoverclosest', 'hovercompare']
-    })
+    return fig, frame_dicts
+
+
+def create_interactive_viewer(concept_name: str, assembled_panels: MeshPanels,
+                              exploded_panels: Optional[MeshPanels], output_file: str,
+                              batched: bool = False,
+                              group_key: Optional[Callable[[Dict], str]] = None,
+                              include_plotlyjs: Union[bool, str] = True,
+                              typed_arrays: bool = True,
+                              states: Optional[Sequence[ViewerState]] = None,
+                              transition_frames: int = 2,
+                              frame_duration: int = 40,
+                              connections: Optional[Sequence[Tuple[int, int]]] = None) -> 'go.Figure':
+    """Create interactive 3D viewer animating between assembly states
+
+    Panels may be given as mesh dicts from create_box_mesh or as a PanelSet.
+    The model is drawn once, in its first state; every other state is a set
+    of per-panel offsets from the assembled positions, played as Plotly
+    frames with transition_frames - 1 interpolated frames between states.
+    Frames only carry the coordinate axes of the traces that move, so
+    indices, colours, hover names and still panels are not repeated; the
+    default single midpoint frame keeps the page no larger than one holding
+    a full trace set per state. states defaults to assembled and exploded
+    (the offsets between the two mesh lists); a button per state animates
+    to it, and longer sequences (e.g. BenchModel.assembly_states) add Play
+    and a slider. Dashed lines join the (a, b) panel pairs in connections
+    (by default the contact graph of the assembled panels) in each state
+    where the two are apart, and are hidden while panels move.
+
+    With batched=True the model is a single Mesh3d (or one per group_key
+    value) instead of one trace per panel; panel names remain available on
+    hover. include_plotlyjs is passed to write_html; give a script URL to
+    reference a shared plotly.js instead of embedding it. typed_arrays=False
+    keeps float64 coordinates, list indices and per-face colour strings (the
+    older, larger encoding); otherwise arrays as short as one box's are
+    written as rounded lists, which beat base64 at that length. Returns the
+    figure without its frames, which are only added to the written page.
+    """
+    import plotly.io as pio
+
+    fig, frames = create_viewer_figure(concept_name, assembled_panels, exploded_panels,
+                                       batched=batched, group_key=group_key,
+                                       typed_arrays=typed_arrays, states=states,
+                                       transition_frames=transition_frames,
+                                       frame_duration=frame_duration, connections=connections)
+
+    # Save to HTML; frames skip plotly.py validation
+    pio.write_html(dict(fig.to_dict(), frames=frames), output_file, validate=False, auto_play=False,
+                   include_plotlyjs=include_plotlyjs, config={
+                       'displayModeBar': True,
+                       'displaylogo': False,
+                       'modeBarButtonsToRemove': ['toImage'],
+                       'modeBarButtonsToAdd': ['hoverclosest', 'hovercompare']
+                   })
 
     return fig
 
 
-def add_dimension_annotations(fig: go.Figure, concept_name: str):
+def write_viewer(concept_name: str, assembled_panels: MeshPanels,
+                 exploded_panels: Optional[MeshPanels], output_file: str,
+                 cache=None, **viewer_options) -> bool:
+    """Write a viewer page, skipping it when the render cache is current
+
+    viewer_options are passed to create_interactive_viewer. Returns True if
+    the page was rendered.
+    """
+    if isinstance(assembled_panels, PanelSet):
+        assembled_panels = create_panel_meshes(assembled_panels)
+    if isinstance(exploded_panels, PanelSet):
+        exploded_panels = create_panel_meshes(exploded_panels)
+
+    def render():
+        create_interactive_viewer(concept_name, assembled_panels, exploded_panels,
+                                  output_file, **viewer_options)
+
+    if cache is None:
+        render()
+        return True
+
+    from render_cache import viewer_cache_key
+    params = {key: value for key, value in viewer_options.items()
+              if key not in ('group_key', 'states')}
+    if 'group_key' in viewer_options:
+        params['group_key'] = getattr(viewer_options['group_key'], '__qualname__', None)
+    if viewer_options.get('states') is not None:
+        params['states'] = [[label, np.asarray(offsets, dtype=float).tolist()]
+                            for label, offsets in viewer_options['states']]
+    key = viewer_cache_key(concept_name, assembled_panels, exploded_panels or [], params)
+    return cache.render(key, output_file, render)
+
+
+def add_dimension_annotations(fig: 'go.Figure', concept_name: str):
     """Add dimension annotations to the 3D view"""
     if "Concept 4" in concept_name:
         # Add dimension lines for Concept 4
@@ -354,31 +687,26 @@ def add_dimension_annotations(fig: go.Figure, concept_name: str):
 
 
 if __name__ == "__main__":
+    import argparse
+    from render_cache import RenderCache
+
+    parser = argparse.ArgumentParser(description="Generate interactive 3D viewers")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-render even if the render cache is up to date")
+    args = parser.parse_args()
+    cache = None if args.no_cache else RenderCache()
+
     print("Generating 3D interactive visualizations...\n")
 
     # Concept 4
     print("Creating Concept 4 (Slab Legs) 3D viewer...")
-    c4_assembled = create_concept_4_assembled()
-    c4_exploded = create_concept_4_exploded()
-    create_interactive_viewer(
-        "Concept 4: Thin Slab Legs",
-        c4_assembled,
-        c4_exploded,
-        "concept-4-3d.html"
-    )
-    print("✓ Saved concept-4-3d.html")
+    rendered = build_model('concept-4').write_viewer("concept-4-3d.html", cache=cache)
+    print("✓ Saved concept-4-3d.html" if rendered else "✓ concept-4-3d.html up to date")
 
     # Concept 2
     print("\nCreating Concept 2 (U-Modules) 3D viewer...")
-    c2_assembled = create_concept_2_assembled()
-    c2_exploded = create_concept_2_exploded()
-    create_interactive_viewer(
-        "Concept 2: Interlocking U-Modules",
-        c2_assembled,
-        c2_exploded,
-        "concept-2-3d.html"
-    )
-    print("✓ Saved concept-2-3d.html")
+    rendered = build_model('concept-2').write_viewer("concept-2-3d.html", cache=cache)
+    print("✓ Saved concept-2-3d.html" if rendered else "✓ concept-2-3d.html up to date")
 
     print("\n✓ 3D visualizations complete!")
     print("\nOpen the HTML files in your browser to interact with the 3D models:")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Canonical Bench Geometry Model
+Builds each concept once as a panel table, a box mesh buffer and exploded
+offsets, which the SVG drawings and 3D viewers both render from
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from svg_bench_drawer import (
+    Panel, PanelSet, render_bench_drawing,
+    create_concept_4_slab_legs, create_concept_2_u_modules,
+)
+from contact_graph import connection_pairs, contact_graph, explode_layout
+
+
+# Triangle corner indices (12 per box) into the 8 box corners, matching
+# Panel.get_corners order
+BOX_TRIANGLES = np.array([
+    [0, 1, 4], [0, 1, 2], [1, 2, 5], [1, 2, 6], [2, 3, 6], [2, 3, 7],
+    [3, 0, 7], [3, 0, 4], [4, 5, 6], [4, 5, 7], [5, 6, 7], [5, 6, 4],
+    [0, 4, 1], [0, 4, 3], [1, 5, 0], [1, 5, 2], [4, 7, 3], [4, 7, 0],
+    [5, 6, 1], [5, 6, 4], [2, 6, 3], [2, 6, 7], [3, 7, 0], [3, 7, 4],
+])
+
+
+def assembly_steps_concept_4(panels: PanelSet) -> np.ndarray:
+    """Legs stand first, then the seat goes on"""
+    steps = np.zeros(len(panels), dtype=np.int64)
+    steps[0] = 1
+    return steps
+
+
+# Panels per U-module, in factory order: seat, left wall, right wall,
+# left foot, right foot
+U_MODULE_PANELS = 5
+
+
+def assembly_steps_concept_2(panels: PanelSet) -> np.ndarray:
+    """One module at a time"""
+    return np.arange(len(panels)) // U_MODULE_PANELS
+
+
+@dataclass
+class ConceptSpec:
+    """Registry entry: how to build and assemble one concept"""
+    slug: str  # Output file prefix, e.g. "concept-4"
+    title: str
+    factory: Callable[..., List[Panel]]
+    assembly_steps: Optional[Callable[[PanelSet], np.ndarray]] = None  # Step per panel
+
+
+CONCEPTS: Dict[str, ConceptSpec] = {
+    'concept-4': ConceptSpec('concept-4', "Concept 4: Thin Slab Legs",
+                             create_concept_4_slab_legs, assembly_steps_concept_4),
+    'concept-2': ConceptSpec('concept-2', "Concept 2: Interlocking U-Modules",
+                             create_concept_2_u_modules, assembly_steps_concept_2),
+}
+
+
+class BenchModel:
+    """Compiled geometry of one concept
+
+    panels is the assembled panel table, contacts its contact graph
+    (contact_graph.EDGE_DTYPE) and explode its (N, 3) exploded offsets. The
+    exploded table and the mesh buffers are derived on first use and
+    cached, so rendering several outputs does the work once.
+    """
+
+    def __init__(self, slug: str, title: str, panels: PanelSet, explode: np.ndarray,
+                 params: Dict[str, Any] = None, assembly_steps: np.ndarray = None,
+                 contacts: np.ndarray = None):
+        self.slug = slug
+        self.title = title
+        self.panels = panels
+        self.explode = np.asarray(explode, dtype=float).reshape(-1, 3)
+        self.params = dict(params or {})
+        self.contacts = contacts if contacts is not None else contact_graph(panels.positions, panels.sizes)
+        # Step at which each panel is fitted; one panel per step by default
+        self.assembly_steps = (np.arange(len(panels)) if assembly_steps is None
+                               else np.asarray(assembly_steps, dtype=np.int64))
+        self._exploded: Optional[PanelSet] = None
+        self._buffers: Dict[bool, Dict[str, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.panels)
+
+    @property
+    def exploded(self) -> PanelSet:
+        """Panel table in the exploded state"""
+        if self._exploded is None:
+            self._exploded = self.panels.translated(self.explode)
+        return self._exploded
+
+    def assembly_states(self) -> List[Tuple[str, np.ndarray]]:
+        """Viewer states from exploded through each assembly step
+
+        Each state is (label, (N, 3) offsets); panels fitted at or before a
+        step sit in place, the rest stay exploded.
+        """
+        steps = np.unique(self.assembly_steps)
+        states = [("Exploded", self.explode)]
+        for number, step in enumerate(steps.tolist(), start=1):
+            waiting = (self.assembly_steps > step)[:, None]
+            states.append((f"Step {number}", self.explode * waiting))
+        return states
+
+    def mesh_buffer(self, exploded: bool = False) -> Dict[str, np.ndarray]:
+        """Box meshes of every panel as one vertex/triangle buffer
+
+        Returns vertices (8N, 3), triangles (12N, 3) indexing into vertices
+        and panel_index (8N,) giving the panel of each vertex.
+        """
+        if exploded not in self._buffers:
+            panels = self.exploded if exploded else self.panels
+            n = len(panels)
+            self._buffers[exploded] = {
+                'vertices': panels.corners.reshape(-1, 3),
+                'triangles': (BOX_TRIANGLES + 8 * np.arange(n)[:, None, None]).reshape(-1, 3),
+                'panel_index': np.repeat(np.arange(n), 8),
+            }
+        return self._buffers[exploded]
+
+    def meshes(self, exploded: bool = False, color: str = 'white') -> List[Dict]:
+        """Per-panel mesh dicts (as create_box_mesh) viewing the mesh buffer"""
+        vertices = self.mesh_buffer(exploded)['vertices'].reshape(-1, 8, 3)
+        i, j, k = BOX_TRIANGLES.T.tolist()
+        return [{
+            'x': corners[:, 0],
+            'y': corners[:, 1],
+            'z': corners[:, 2],
+            'i': list(i),
+            'j': list(j),
+            'k': list(k),
+            'color': color,
+            'vertices': corners,
+            'name': name,
+        } for name, corners in zip(self.panels.names, vertices)]
+
+    def render_drawing(self, filename: str, concept_name: str = None, **drawing_options) -> bool:
+        """Render the SVG drawing sheet; options go to render_bench_drawing"""
+        return render_bench_drawing(concept_name or self.title, self.panels, filename,
+                                    exploded_offsets=self.explode,
+                                    exploded_connections=connection_pairs(self.contacts),
+                                    **drawing_options)
+
+    def write_viewer(self, filename: str, concept_name: str = None, **viewer_options) -> bool:
+        """Write the 3D viewer page; options go to bench_3d_viewer.write_viewer"""
+        from bench_3d_viewer import write_viewer
+
+        viewer_options.setdefault('connections', connection_pairs(self.contacts))
+        return write_viewer(concept_name or self.title, self.meshes(), self.meshes(exploded=True),
+                            filename, **viewer_options)
+
+    def write_glb(self, filename: str, concept_name: str = None) -> int:
+        """Write assembled and exploded scenes as binary glTF; returns bytes written"""
+        from gltf_export import write_glb
+
+        return write_glb(filename, self.panels, self.explode, concept_name or self.title)
+
+
+def build_model(slug: str, explode_distance: float = None, **params) -> BenchModel:
+    """Build a concept's model; params go to its panel factory
+
+    The exploded layout comes from the panels' contact graph; explode_distance
+    overrides its step (by default half the median panel's longest side).
+    """
+    try:
+        spec = CONCEPTS[slug]
+    except KeyError:
+        raise ValueError(f"Unknown concept {slug!r}; choose from {sorted(CONCEPTS)}")
+    panels = PanelSet.from_panels(spec.factory(**params))
+    contacts = contact_graph(panels.positions, panels.sizes)
+    explode = explode_layout(panels.positions, panels.sizes, contacts, explode_distance)
+    steps = spec.assembly_steps(panels) if spec.assembly_steps else None
+    return BenchModel(slug, spec.title, panels, explode, params, steps, contacts)
+
+
+if __name__ == "__main__":
+    for slug in CONCEPTS:
+        model = build_model(slug)
+        drawing_file = f"{slug}-drawings.svg"
+        viewer_file = f"{slug}-3d.html"
+        print(f"Building {model.title} ({len(model)} panels)...")
+        model.render_drawing(drawing_file)
+        print(f"✓ Saved {drawing_file}")
+        model.write_viewer(viewer_file)
+        print(f"✓ Saved {viewer_file}")
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Constraint-Aware Bench Design Optimizer
+Evolves concept parameters towards the lightest and cheapest designs that
+pass fabrication limits, the seat-height target and deflection limits,
+evaluating candidates in worker processes with memoized results
+"""
+
+import json
+import os
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from bench_sweep import CONCEPT_FACTORIES, build_variant, variant_id
+from costing import cost_panels
+from fabrication import check_panels
+from structural import analyse_panels
+from svg_bench_drawer import Panel
+
+
+# 304 stainless sheet thicknesses stocked by SendCutSend
+STOCK_THICKNESSES = [0.030, 0.048, 0.060, 0.075, 0.090, 0.120, 0.187, 0.250, 0.375, 0.500]
+
+
+def _grid(start: float, stop: float, step: float) -> List[float]:
+    return [round(v, 6) for v in np.arange(start, stop + step / 2, step).tolist()]
+
+
+@dataclass
+class SearchSpace:
+    """Candidate values per factory parameter
+
+    depends lists, per constraint, the parameters it is a function of. When
+    a candidate fails that constraint every other candidate sharing those
+    values fails too, so the whole region is pruned without evaluation.
+    """
+    values: Dict[str, List[Any]]
+    depends: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+
+
+SEARCH_SPACES: Dict[str, SearchSpace] = {
+    'concept-4': SearchSpace(
+        values={
+            'length': _grid(36, 72, 2),
+            'depth': _grid(10, 16, 1),
+            'height': _grid(15, 17.5, 0.5),
+            'seat_thickness': STOCK_THICKNESSES,
+            'leg_thickness': [0.187, 0.250, 0.375, 0.500],
+            'leg_inset': _grid(2, 16, 1),
+        },
+        depends={
+            'seat_height': ('height', 'seat_thickness'),
+            'fabrication': ('length', 'depth', 'height', 'seat_thickness', 'leg_thickness'),
+        }),
+    'concept-2': SearchSpace(
+        values={
+            'module_count': [2, 3, 4],
+            'module_width': _grid(14, 28, 1),
+            'depth': _grid(10, 16, 1),
+            'height': _grid(15, 17.5, 0.5),
+            'thickness': STOCK_THICKNESSES,
+            'foot_height': [2.0, 3.0, 4.0],
+        },
+        depends={
+            'seat_height': ('height', 'thickness'),
+            'fabrication': ('module_width', 'depth', 'height', 'thickness', 'foot_height'),
+        }),
+}
+
+
+@dataclass
+class DesignTargets:
+    """Constraints every accepted design must meet"""
+    seat_height: float = 17.0            # Top of seat (inches)
+    seat_height_tolerance: float = 0.5
+    max_deflection: float = 0.25         # Worst load case, inches
+    min_safety: float = 2.0              # Against yield, worst load case
+
+
+def evaluate_params(concept: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Build one design and measure it; the record does not depend on targets"""
+    record: Dict[str, Any] = {'id': variant_id(concept, params), 'params': params}
+    try:
+        panels = build_variant(concept, params)
+        costs = cost_panels(panels)
+        spans, results = analyse_panels(panels)
+        record['fabrication_ok'] = bool(check_panels(panels)['ok'].all())
+        record['mass'] = float(costs['mass'].sum())
+        record['cost'] = float(costs['cost'].sum())
+        if len(spans):
+            seats = spans['seat']
+            record['seat_height'] = float((panels.positions[seats, 2] + panels.sizes[seats, 2]).max())
+            record['deflection'] = float(results['deflection'].max())
+            record['safety_factor'] = float(results['safety_factor'].min())
+    except Exception as exc:  # Recorded as infeasible; the search carries on
+        record['error'] = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+def evaluate_chunk(tasks: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Evaluate a chunk of candidates in one worker call"""
+    return [evaluate_params(concept, params) for concept, params in tasks]
+
+
+def violations(record: Dict[str, Any], targets: DesignTargets) -> List[str]:
+    """Names of the constraints a measured design breaks"""
+    if 'error' in record:
+        return ['error']
+    failed = []
+    if not record['fabrication_ok']:
+        failed.append('fabrication')
+    if 'seat_height' not in record:
+        return failed + ['seat']
+    if abs(record['seat_height'] - targets.seat_height) > targets.seat_height_tolerance:
+        failed.append('seat_height')
+    if record['deflection'] > targets.max_deflection:
+        failed.append('deflection')
+    if record['safety_factor'] < targets.min_safety:
+        failed.append('strength')
+    return failed
+
+
+def pareto_front(records: List[Dict[str, Any]], objectives: Sequence[str]) -> List[Dict[str, Any]]:
+    """Records not dominated on the (minimised) objectives, best first objective first"""
+    if not records:
+        return []
+    scores = np.array([[r[name] for name in objectives] for r in records])
+    front = []
+    for start in range(0, len(scores), 1024):
+        block = scores[start:start + 1024]
+        no_worse = (scores[:, None, :] <= block[None, :, :]).all(axis=2)
+        better = (scores[:, None, :] < block[None, :, :]).any(axis=2)
+        dominated = (no_worse & better).any(axis=0)
+        front.extend(start + np.flatnonzero(~dominated))
+    front.sort(key=lambda i: tuple(scores[i]))
+    return [records[i] for i in front]
+
+
+@dataclass
+class OptimizationResult:
+    """Pareto front and search statistics"""
+    concept: str
+    objectives: Tuple[str, ...]
+    front: List[Dict[str, Any]]
+    records: List[Dict[str, Any]]  # Every design evaluated or recalled this run
+    evaluated: int = 0             # Sent to workers
+    cached: int = 0                # Answered from the memo
+    pruned: int = 0                # Skipped as inside a failed region
+
+    def front_panels(self) -> List[Tuple[Dict[str, Any], List[Panel]]]:
+        """(params, panels) for each front design, ready for BenchDrawing"""
+        factory = CONCEPT_FACTORIES[self.concept]
+        return [(record['params'], factory(**record['params'])) for record in self.front]
+
+
+class Memo:
+    """Design records keyed by parameter hash, optionally persisted as JSON"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.records: Dict[str, Dict[str, Any]] = {}
+        if path and os.path.exists(path):
+            with open(path) as f:
+                self.records = json.load(f)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.records
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self.records[key]
+
+    def add(self, record: Dict[str, Any]):
+        self.records[record['id']] = record
+
+    def save(self):
+        if self.path:
+            with open(self.path, 'w') as f:
+                json.dump(self.records, f)
+
+
+def _mutate(params: Dict[str, Any], space: SearchSpace, rng: random.Random) -> Dict[str, Any]:
+    """Move one or two parameters a step or two along their value grids"""
+    child = dict(params)
+    for name in rng.sample(sorted(space.values), k=rng.choice((1, 1, 2))):
+        values = space.values[name]
+        index = values.index(child[name]) + rng.choice((-2, -1, 1, 2))
+        child[name] = values[min(max(index, 0), len(values) - 1)]
+    return child
+
+
+def _sample(space: SearchSpace, rng: random.Random) -> Dict[str, Any]:
+    return {name: rng.choice(values) for name, values in sorted(space.values.items())}
+
+
+def optimize(concept: str, targets: DesignTargets = DesignTargets(),
+             objectives: Sequence[str] = ('mass', 'cost'), population: int = 64,
+             generations: int = 20, workers: Optional[int] = None, chunk_size: int = 16,
+             seed: int = 0, memo: Optional[Memo] = None,
+             space: Optional[SearchSpace] = None) -> OptimizationResult:
+    """Evolutionary search for the Pareto front of feasible designs
+
+    Each generation mutates the current front (plus a few random
+    newcomers), drops candidates already in the memo or inside a pruned
+    region, and evaluates the rest across worker processes in chunks.
+    workers=1 evaluates in-process.
+    """
+    if concept not in SEARCH_SPACES:
+        raise ValueError(f"No search space for {concept!r}; choose from {sorted(SEARCH_SPACES)}")
+    space = space or SEARCH_SPACES[concept]
+    memo = memo if memo is not None else Memo()
+    rng = random.Random(seed)
+    objectives = tuple(objectives)
+
+    seen: Dict[str, Dict[str, Any]] = {}
+    failed_regions: Set[Tuple[str, Tuple[Any, ...]]] = set()
+    result = OptimizationResult(concept, objectives, [], [])
+
+    def region(constraint: str, params: Dict[str, Any]) -> Tuple[str, Tuple[Any, ...]]:
+        return constraint, tuple(params[name] for name in space.depends[constraint])
+
+    def pruned(params: Dict[str, Any]) -> bool:
+        return any(region(c, params) in failed_regions for c in space.depends)
+
+    def accept(record: Dict[str, Any]):
+        seen[record['id']] = record
+        record['violations'] = violations(record, targets)
+        for constraint in record['violations']:
+            if constraint in space.depends:
+                failed_regions.add(region(constraint, record['params']))
+
+    executor: Optional[Executor] = None if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+    try:
+        candidates = [_sample(space, rng) for _ in range(population)]
+        for _ in range(generations):
+            tasks = []
+            for params in candidates:
+                key = variant_id(concept, params)
+                if key in seen:
+                    continue
+                if key in memo:
+                    accept(memo[key])
+                    result.cached += 1
+                elif pruned(params):
+                    result.pruned += 1
+                else:
+                    seen[key] = {}  # Reserve so duplicates in this batch are skipped
+                    tasks.append((concept, params))
+
+            chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+            batches = map(evaluate_chunk, chunks) if executor is None else executor.map(evaluate_chunk, chunks)
+            for batch in batches:
+                for record in batch:
+                    memo.add(record)
+                    accept(record)
+            result.evaluated += len(tasks)
+
+            feasible = [r for r in seen.values() if r and not r['violations']]
+            front = pareto_front(feasible, objectives)
+            # Breed from the front; without one yet, from the least-violating designs
+            parents = front or sorted((r for r in seen.values() if r),
+                                      key=lambda r: len(r['violations']))[:max(population // 4, 1)]
+            candidates = [_mutate(rng.choice(parents)['params'], space, rng)
+                          for _ in range(population - population // 8)]
+            candidates += [_sample(space, rng) for _ in range(population // 8)]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    memo.save()
+
+    result.records = [r for r in seen.values() if r]
+    result.front = pareto_front([r for r in result.records if not r['violations']], objectives)
+    return result
+
+
+def describe_result(result: OptimizationResult) -> List[str]:
+    """Search statistics and one line per front design"""
+    lines = [f"{len(result.records)} designs: {result.evaluated} evaluated, "
+             f"{result.cached} from memo, {result.pruned} pruned; "
+             f"{len(result.front)} on the Pareto front ({' vs '.join(result.objectives)})"]
+    for record in result.front:
+        params = ', '.join(f"{name}={value}" for name, value in sorted(record['params'].items()))
+        lines.append(f"{record['mass']:.1f} lb, ${record['cost']:.2f}, "
+                     f"{record['deflection']:.3f}\" sag, SF {record['safety_factor']:.1f}: {params}")
+    return lines
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['optimize'] + sys.argv[1:]))
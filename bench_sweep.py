@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Parametric Sweep Engine for Bench Variants
+Expands parameter ranges into concept variants and renders their SVG
+drawings and 3D viewers across a process pool
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from bench_model import CONCEPTS, build_model
+from costing import cost_panels
+from svg_bench_drawer import Panel, PanelSet
+
+if TYPE_CHECKING:
+    from fabrication import FabricationLimits
+
+
+CONCEPT_FACTORIES: Dict[str, Callable[..., List[Panel]]] = {
+    slug: spec.factory for slug, spec in CONCEPTS.items()
+}
+
+CONCEPT_TITLES = {slug: spec.title for slug, spec in CONCEPTS.items()}
+
+# Parameters that must be whole numbers
+INTEGER_PARAMS = {'module_count'}
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def parse_range(text: str) -> List[float]:
+    """Parse "start:stop:step" (stop inclusive), "a,b,c" or a single value"""
+    if ':' in text:
+        start, stop, step = (float(v) for v in text.split(':'))
+        if step <= 0:
+            raise ValueError(f"Range step must be positive: {text!r}")
+        count = int(np.floor((stop - start) / step + 1e-9)) + 1
+        return [round(start + i * step, 9) for i in range(count)]
+    return [float(v) for v in text.split(',')]
+
+
+def expand_variants(ranges: Dict[str, Sequence[float]]) -> List[Dict[str, Any]]:
+    """Cartesian product of parameter ranges as a list of parameter dicts"""
+    names = sorted(ranges)
+    variants = []
+    for values in itertools.product(*(ranges[name] for name in names)):
+        params = {}
+        for name, value in zip(names, values):
+            params[name] = int(value) if name in INTEGER_PARAMS else float(value)
+        variants.append(params)
+    return variants
+
+
+def variant_id(concept: str, params: Dict[str, Any]) -> str:
+    """Stable identifier for one variant"""
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    return f"{concept}-{digest[:10]}"
+
+
+def build_variant(concept: str, params: Dict[str, Any]) -> PanelSet:
+    """Build the panel table for one variant"""
+    return PanelSet.from_panels(CONCEPT_FACTORIES[concept](**params))
+
+
+def render_variant(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Build and render one variant; returns its manifest record"""
+    concept, params, output_dir = task['concept'], task['params'], task['output_dir']
+    vid = variant_id(concept, params)
+    record = {'id': vid, 'concept': concept, 'params': params, 'outputs': []}
+    start = time.perf_counter()
+
+    try:
+        model = build_model(concept, task['explode_distance'], **params)
+        record['panel_count'] = len(model)
+        record['hole_count'] = int(model.panels.hole_counts.sum())
+        costs = cost_panels(model.panels)
+        record['mass'] = round(float(costs['mass'].sum()), 3)
+        record['cost'] = round(float(costs['cost'].sum()), 2)
+        title = f"{model.title} ({vid})"
+
+        if task['svg']:
+            name = f"{vid}-drawings.svg"
+            model.render_drawing(os.path.join(output_dir, name), title, compact=task['compact'])
+            record['outputs'].append(name)
+
+        if task['viewer']:
+            name = f"{vid}-3d.html"
+            model.write_viewer(os.path.join(output_dir, name), title,
+                               batched=True, include_plotlyjs=task['plotlyjs'])
+            record['outputs'].append(name)
+
+        record['status'] = 'ok'
+    except Exception as exc:  # Keep the sweep going; the manifest records the failure
+        record['status'] = 'error'
+        record['error'] = f"{type(exc).__name__}: {exc}"
+
+    record['seconds'] = round(time.perf_counter() - start, 6)
+    return record
+
+
+def render_chunk(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Render a chunk of variants in one worker call"""
+    return [render_variant(task) for task in tasks]
+
+
+def run_sweep(concept: str, ranges: Dict[str, Sequence[float]], output_dir: str,
+              workers: int = None, chunk_size: int = 8,
+              svg: bool = True, viewer: bool = True,
+              explode_distance: float = None,
+              limits: 'FabricationLimits' = None,
+              compact: bool = False) -> Dict[str, Any]:
+    """Render every variant of a concept and write a results manifest
+
+    Variants are scheduled in chunks of chunk_size so each worker process
+    amortises its imports and IPC over several renders. workers=1 renders
+    in-process. With fabrication limits, all variants are checked in one
+    pass first and only passing ones are rendered; the rest are recorded
+    as rejected. Returns the manifest, which is also written to
+    output_dir/manifest.json.
+    """
+    if concept not in CONCEPT_FACTORIES:
+        raise ValueError(f"Unknown concept {concept!r}; choose from {sorted(CONCEPT_FACTORIES)}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    plotlyjs = None
+    if viewer:
+        from gallery import write_plotlyjs_asset
+        plotlyjs = write_plotlyjs_asset(output_dir)
+
+    variants = expand_variants(ranges)
+    rejected = []
+    if limits is not None:
+        variants, rejected = filter_variants(concept, variants, limits)
+
+    tasks = [
+        {'concept': concept, 'params': params, 'output_dir': output_dir,
+         'svg': svg, 'viewer': viewer, 'plotlyjs': plotlyjs,
+         'explode_distance': explode_distance, 'compact': compact}
+        for params in variants
+    ]
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [render_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(render_chunk, chunks))
+    records = [record for chunk in results for record in chunk] + rejected
+
+    manifest = {
+        'concept': concept,
+        'ranges': {name: list(values) for name, values in ranges.items()},
+        'variant_count': len(records),
+        'rejected': len(rejected),
+        'failed': sum(1 for r in records if r['status'] == 'error'),
+        'seconds': round(time.perf_counter() - start, 3),
+        'plotlyjs': plotlyjs,
+        'variants': records,
+    }
+    with open(os.path.join(output_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def filter_variants(concept: str, variants: List[Dict[str, Any]],
+                    limits: 'FabricationLimits') -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split variants into those within fabrication limits and rejected records"""
+    from fabrication import check_variants, describe_violations
+
+    panel_sets = [build_variant(concept, params) for params in variants]
+    table, passing = check_variants(panel_sets, limits)
+
+    accepted, rejected = [], []
+    start = 0
+    for params, panels, ok in zip(variants, panel_sets, passing.tolist()):
+        rows = table[start:start + len(panels)].copy()
+        rows['panel'] -= start
+        start += len(panels)
+        if ok:
+            accepted.append(params)
+        else:
+            rejected.append({
+                'id': variant_id(concept, params), 'concept': concept, 'params': params,
+                'outputs': [], 'panel_count': len(panels), 'status': 'rejected',
+                'violations': describe_violations(panels, rows, limits),
+            })
+    return accepted, rejected
+
+
+def parse_params(values: List[str]) -> Dict[str, List[float]]:
+    """Parse repeated NAME=RANGE arguments"""
+    ranges = {}
+    for item in values:
+        name, _, text = item.partition('=')
+        if not text:
+            raise argparse.ArgumentTypeError(f"Expected NAME=RANGE, got {item!r}")
+        ranges[name.strip()] = parse_range(text)
+    return ranges
+
+
+def main(args: argparse.Namespace):
+    ranges = parse_params(args.param)
+    limits = None
+    if args.check:
+        from fabrication import FabricationLimits
+        limits = FabricationLimits()
+
+    print(f"Sweeping {args.concept} over {len(expand_variants(ranges))} variants...")
+    manifest = run_sweep(args.concept, ranges, args.output_dir,
+                         workers=args.workers, chunk_size=args.chunk_size,
+                         svg=not args.no_svg, viewer=not args.no_viewer,
+                         explode_distance=args.explode_distance,
+                         limits=limits, compact=args.compact)
+    rendered = manifest['variant_count'] - manifest['failed'] - manifest['rejected']
+    print(f"✓ Rendered {rendered} variants in {manifest['seconds']}s")
+    if manifest['rejected']:
+        print(f"✓ Skipped {manifest['rejected']} variants outside fabrication limits")
+    if manifest['failed']:
+        print(f"✗ {manifest['failed']} variants failed (see {MANIFEST_NAME})")
+    print(f"✓ Saved {os.path.join(args.output_dir, MANIFEST_NAME)}")
+
+
+if __name__ == "__main__":
+    import sys
+    import bench
+
+    sys.exit(bench.main(['sweep'] + sys.argv[1:]))
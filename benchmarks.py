@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for Geometry, SVG and Viewer Export
+Times the drawing and viewer pipeline on Concept 2 assemblies of growing
+module counts, writes a JSON baseline and compares two runs for regressions
+"""
+
+import base64
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from bench_model import build_model
+from contact_graph import connection_pairs, exploded_offsets
+from svg_bench_drawer import BenchDrawing, SVGDrawing
+
+
+DEFAULT_SIZES = [3, 30, 300, 3000]
+
+# Each case repeats until it has run this long (and at least MIN_RUNS times)
+MIN_TIME = 0.2
+MIN_RUNS = 3
+MAX_RUNS = 50
+
+
+class Fixture:
+    """One synthetic assembly and everything the cases draw from it"""
+
+    def __init__(self, modules: int):
+        self.modules = modules
+        self.model = build_model('concept-2', module_count=modules)
+        self.panel_set = self.model.panels
+        self.panels = self.panel_set.to_panels()
+        self.corners = [corner for panel in self.panels for corner in panel.get_corners()]
+        self.connections = connection_pairs(self.model.contacts)
+        self.output_dir = tempfile.mkdtemp(prefix='bench-benchmarks-')
+        self._drawing: Optional[BenchDrawing] = None
+        self._meshes = None
+
+    def __len__(self) -> int:
+        return len(self.panels)
+
+    def close(self):
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def drawing(self) -> BenchDrawing:
+        """Fresh buffered drawing"""
+        return BenchDrawing(f"Concept 2 × {self.modules}")
+
+    def full_drawing(self) -> SVGDrawing:
+        """Buffered drawing with every view drawn (built once)"""
+        if self._drawing is None:
+            drawing = self.drawing()
+            y = drawing.draw_title_block()
+            y = drawing.draw_orthographic_views(self.panel_set, y)
+            y = drawing.draw_isometric_view(self.panel_set, y)
+            y = drawing.draw_exploded_view(self.panel_set, y, offsets=self.model.explode,
+                                               connections=self.connections)
+            drawing.draw_flat_patterns(self.panel_set, y)
+            self._drawing = drawing
+        return self._drawing.svg
+
+    def meshes(self):
+        if self._meshes is None:
+            self._meshes = (self.model.meshes(), self.model.meshes(exploded=True))
+        return self._meshes
+
+
+@dataclass
+class Case:
+    """One timed operation; items counts its units of work for throughput"""
+    name: str
+    run: Callable[[Fixture], Any]
+    items: Callable[[Fixture], int]
+    unit: str = 'panels'
+    max_panels: Optional[int] = None  # Skip larger assemblies (too slow to repeat)
+
+
+def _box_meshes(fixture: Fixture):
+    from bench_3d_viewer import create_box_mesh
+
+    for p in fixture.panels:
+        create_box_mesh(p.position.x, p.position.y, p.position.z, p.width, p.depth, p.thickness)
+
+
+def _viewer(fixture: Fixture, batched: bool):
+    from bench_3d_viewer import create_interactive_viewer
+
+    assembled, exploded = fixture.meshes()
+    create_interactive_viewer(f"Concept 2 × {fixture.modules}", assembled, exploded,
+                              os.path.join(fixture.output_dir, 'viewer.html'),
+                              batched=batched, include_plotlyjs='cdn')
+
+
+CASES: List[Case] = [
+    Case('Panel.get_corners', lambda f: [p.get_corners() for p in f.panels], len),
+    Case('Point3D.to_isometric', lambda f: [c.to_isometric(2.5) for c in f.corners],
+         lambda f: len(f.corners), unit='points'),
+    Case('BenchDrawing.draw_title_block', lambda f: f.drawing().draw_title_block(), lambda f: 1,
+         unit='calls'),
+    Case('BenchDrawing.draw_orthographic_views',
+         lambda f: f.drawing().draw_orthographic_views(f.panel_set, 100), len),
+    Case('BenchDrawing.draw_isometric_view',
+         lambda f: f.drawing().draw_isometric_view(f.panel_set, 100), len),
+    Case('BenchDrawing.draw_exploded_view',
+         lambda f: f.drawing().draw_exploded_view(f.panel_set, 100, offsets=f.model.explode,
+                                                        connections=f.connections), len),
+    Case('BenchDrawing.draw_flat_patterns',
+         lambda f: f.drawing().draw_flat_patterns(f.panel_set, 100), len),
+    Case('SVGDrawing.to_svg', lambda f: f.full_drawing().to_svg(),
+         lambda f: len(f.full_drawing().elements), unit='elements'),
+    Case('explode_layout', lambda f: exploded_offsets(f.panel_set), len),
+    Case('create_box_mesh', _box_meshes, len),
+    Case('create_interactive_viewer', lambda f: _viewer(f, batched=False), len, max_panels=1500),
+    Case('create_interactive_viewer(batched)', lambda f: _viewer(f, batched=True), len),
+    Case('write_glb', lambda f: f.model.write_glb(os.path.join(f.output_dir, 'model.glb')), len),
+]
+
+
+def time_case(case: Case, fixture: Fixture, min_time: float = MIN_TIME) -> Dict[str, Any]:
+    """Best/median wall time, throughput and peak allocation of one case"""
+    case.run(fixture)  # Warm up imports and caches
+    times: List[float] = []
+    while len(times) < MIN_RUNS or (sum(times) < min_time and len(times) < MAX_RUNS):
+        start = time.perf_counter()
+        case.run(fixture)
+        times.append(time.perf_counter() - start)
+
+    # Separate traced run: tracemalloc slows allocation too much to time with it on
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        case.run(fixture)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    items = case.items(fixture)
+    return {
+        'name': case.name,
+        'modules': fixture.modules,
+        'panels': len(fixture),
+        'items': items,
+        'unit': case.unit,
+        'runs': len(times),
+        'best_s': best,
+        'median_s': statistics.median(times),
+        'throughput': items / best if best > 0 else None,
+        'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def _run_cases(cases: List[Case], fixture: Fixture, min_time: float,
+               progress: Callable[[Dict[str, Any]], None] = None) -> List[Dict[str, Any]]:
+    results = []
+    for case in cases:
+        if case.max_panels is not None and len(fixture) > case.max_panels:
+            record = {'name': case.name, 'modules': fixture.modules, 'panels': len(fixture),
+                      'skipped': f"more than {case.max_panels} panels"}
+        else:
+            try:
+                record = time_case(case, fixture, min_time)
+            except ImportError as exc:  # e.g. plotly not installed
+                record = {'name': case.name, 'modules': fixture.modules, 'panels': len(fixture),
+                          'skipped': str(exc)}
+        results.append(record)
+        if progress:
+            progress(record)
+    return results
+
+
+def run_benchmarks(sizes: Sequence[int] = DEFAULT_SIZES, names: Optional[Sequence[str]] = None,
+                   min_time: float = MIN_TIME,
+                   progress: Callable[[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+    """Run every case (or those named) at each assembly size"""
+    cases = [c for c in CASES if names is None or c.name in names]
+    results = []
+    for modules in sizes:
+        fixture = Fixture(modules)
+        try:
+            results.extend(_run_cases(cases, fixture, min_time, progress))
+        finally:
+            fixture.close()
+    return dict(_environment(), results=results)
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def _decode_typed_arrays(value: Any) -> int:
+    """Decode every base64 typed array in parsed figure JSON; returns the count"""
+    if isinstance(value, dict):
+        if 'bdata' in value and 'dtype' in value:
+            np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+            return 1
+        return sum(_decode_typed_arrays(v) for v in value.values())
+    if isinstance(value, list) and value and isinstance(value[0], (dict, list)):
+        return sum(_decode_typed_arrays(v) for v in value)
+    return 0
+
+
+def measure_viewer_payload(fixture: Fixture, batched: bool, typed_arrays: bool,
+                           runs: int = MIN_RUNS) -> Dict[str, Any]:
+    """Page size and figure parse time of one viewer encoding
+
+    The page is written without plotly.js so only the figure counts. Parse
+    time is the best of runs of json.loads plus decoding the base64 typed
+    arrays, a stand-in for the browser's JSON.parse and atob.
+    """
+    from bench_3d_viewer import create_interactive_viewer, create_viewer_figure
+    import plotly.io as pio
+
+    assembled, exploded = fixture.meshes()
+    filename = os.path.join(fixture.output_dir, 'payload.html')
+    name = f"Concept 2 × {fixture.modules}"
+    create_interactive_viewer(name, assembled, exploded, filename, batched=batched,
+                              include_plotlyjs=False, typed_arrays=typed_arrays)
+    fig, frames = create_viewer_figure(name, assembled, exploded, batched=batched,
+                                       typed_arrays=typed_arrays)
+    payload = pio.to_json(dict(fig.to_dict(), frames=frames), validate=False)
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        _decode_typed_arrays(json.loads(payload))
+        times.append(time.perf_counter() - start)
+    return {'modules': fixture.modules, 'panels': len(fixture), 'batched': batched,
+            'typed_arrays': typed_arrays, 'html_bytes': os.path.getsize(filename),
+            'figure_bytes': len(payload), 'parse_ms': min(times) * 1e3}
+
+
+def compare_viewer_payloads(sizes: Sequence[int] = DEFAULT_SIZES,
+                            progress: Callable[[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+    """Viewer page size and parse time with and without typed arrays
+
+    Unbatched pages are skipped above the viewer case's max_panels, as in
+    the timing suite.
+    """
+    max_panels = next(c.max_panels for c in CASES if c.name == 'create_interactive_viewer')
+    records = []
+    for modules in sizes:
+        fixture = Fixture(modules)
+        try:
+            for batched in (False, True):
+                if not batched and len(fixture) > max_panels:
+                    continue
+                for typed_arrays in (False, True):
+                    record = measure_viewer_payload(fixture, batched, typed_arrays)
+                    records.append(record)
+                    if progress:
+                        progress(record)
+        finally:
+            fixture.close()
+    return dict(_environment(), viewer_payloads=records)
+
+
+def format_payload(record: Dict[str, Any]) -> str:
+    label = (f"{'batched' if record['batched'] else 'per-panel'} "
+             f"{'compact' if record['typed_arrays'] else 'wide'} "
+             f"[{record['modules']} modules]")
+    return f"{label:<44} {record['html_bytes'] / 1024:12,.1f} KiB  {record['parse_ms']:10.2f} ms parse"
+
+
+def describe_payload_savings(records: List[Dict[str, Any]]) -> List[str]:
+    """Compact page size and parse time relative to the wide (typed_arrays=False) page"""
+    old = {(r['modules'], r['batched']): r for r in records if not r['typed_arrays']}
+    lines = []
+    for record in records:
+        key = (record['modules'], record['batched'])
+        if record['typed_arrays'] and key in old:
+            lines.append(f"{'batched' if record['batched'] else 'per-panel'} "
+                         f"[{record['modules']} modules]: size "
+                         f"×{record['html_bytes'] / old[key]['html_bytes']:.2f}, parse "
+                         f"×{record['parse_ms'] / old[key]['parse_ms']:.2f}")
+    return lines
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    label = f"{record['name']} [{record['modules']} modules]"
+    if 'skipped' in record:
+        return f"{label:<58} skipped ({record['skipped']})"
+    return (f"{label:<58} {record['best_s'] * 1e3:10.2f} ms  "
+            f"{record['throughput']:12,.0f} {record['unit']}/s  {record['peak_kib']:10,.1f} KiB")
+
+
+def compare_runs(baseline: Dict[str, Any], current: Dict[str, Any],
+                 threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Pair up cases by name and size; flag time or peak-memory changes beyond threshold
+
+    Returns one dict per case present in both runs with the new/old ratios
+    and a status of 'regression', 'improvement' or 'same'.
+    """
+    for label, run in (('baseline', baseline), ('current', current)):
+        if 'results' not in run:
+            found = ', '.join(sorted(run)) or 'nothing'
+            raise ValueError(f"The {label} file holds no timing results (found {found}); "
+                             f"--viewer-payload reports cannot be compared")
+    old = {(r['name'], r['modules']): r for r in baseline['results'] if 'skipped' not in r}
+    rows = []
+    for record in current['results']:
+        key = (record['name'], record['modules'])
+        if 'skipped' in record or key not in old:
+            continue
+        time_ratio = record['best_s'] / old[key]['best_s']
+        memory_ratio = (record['peak_kib'] + 1) / (old[key]['peak_kib'] + 1)
+        if time_ratio > 1 + threshold or memory_ratio > 1 + threshold:
+            status = 'regression'
+        elif time_ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'same'
+        rows.append({'name': record['name'], 'modules': record['modules'],
+                     'time_ratio': time_ratio, 'memory_ratio': memory_ratio, 'status': status})
+    return rows
+
+
+def describe_comparison(rows: List[Dict[str, Any]]) -> List[str]:
+    marks = {'regression': '✗', 'improvement': '✓', 'same': ' '}
+    return [f"{marks[row['status']]} {row['name'] + ' [' + str(row['modules']) + ' modules]':<58} "
+            f"time ×{row['time_ratio']:.2f}  memory ×{row['memory_ratio']:.2f}  {row['status']}"
+            for row in rows]
+
+
+def load_results(filename: str) -> Dict[str, Any]:
+    with open(filename) as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['benchmark'] + sys.argv[1:]))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Mass, Material and Cost Estimates for Panel Tables
+Computes per-panel and per-assembly mass, sheet area, cut length, hole
+count and fabrication cost from a price table in single NumPy passes
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from svg_bench_drawer import Panels, PanelSet, as_panel_set
+from fabrication import FabricationLimits, flat_dimensions
+
+
+@dataclass
+class MaterialPrice:
+    """Stock density and raw material price"""
+    density: float       # lb/in³
+    price_per_lb: float  # $/lb
+
+
+# Rough list prices for the materials in bench-design-concepts.md
+DEFAULT_MATERIALS = {
+    '304 Stainless Steel': MaterialPrice(0.289, 3.50),
+    '5052 Aluminum': MaterialPrice(0.097, 4.00),
+    'Cold Rolled Steel': MaterialPrice(0.284, 1.00),
+}
+
+
+@dataclass
+class PriceTable:
+    """Laser-cut part pricing: material by sheet area used, plus cutting and fees
+
+    Estimates only; replace the rates with real quotes to compare concepts
+    in dollars rather than relative terms.
+    """
+    materials: Dict[str, MaterialPrice] = field(default_factory=lambda: dict(DEFAULT_MATERIALS))
+    cut_per_inch: float = 0.01          # $/in of cut path up to reference_thickness
+    reference_thickness: float = 0.125  # Cutting slows (costs more) linearly above this
+    pierce: float = 0.02                # $ per pierce: the outline and each hole
+    part_fee: float = 1.00              # $ handling per part
+
+    def material_arrays(self, names: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Density and $/lb for each material name, in order"""
+        missing = [name for name in names if name not in self.materials]
+        if missing:
+            raise ValueError(f"No price for material(s) {', '.join(missing)}; "
+                             f"known: {', '.join(sorted(self.materials))}")
+        rows = [self.materials[name] for name in names]
+        return (np.array([r.density for r in rows], dtype=float),
+                np.array([r.price_per_lb for r in rows], dtype=float))
+
+
+COST_DTYPE = np.dtype([
+    ('panel', np.int64),
+    ('material_thickness', np.float64),
+    ('sheet_area', np.float64),     # Flat length x width (in²), what the stock is billed on
+    ('mass', np.float64),           # lb, net of holes
+    ('cut_length', np.float64),     # Outline plus hole circumferences (in)
+    ('holes', np.int64),
+    ('material_cost', np.float64),
+    ('cut_cost', np.float64),       # Cutting, pierces and part fee
+    ('cost', np.float64),
+])
+
+ASSEMBLY_COST_DTYPE = np.dtype([
+    ('assembly', np.int64),
+    ('panels', np.int64),
+    ('sheet_area', np.float64),
+    ('mass', np.float64),
+    ('cut_length', np.float64),
+    ('holes', np.int64),
+    ('material_cost', np.float64),
+    ('cut_cost', np.float64),
+    ('cost', np.float64),
+])
+
+# Fields summed from panels into their assembly
+_SUMMED = ('sheet_area', 'mass', 'cut_length', 'holes', 'material_cost', 'cut_cost', 'cost')
+
+
+def cost_arrays(sizes: np.ndarray, material_codes: np.ndarray, material_names: Sequence[str],
+                hole_counts: np.ndarray, prices: PriceTable = PriceTable(),
+                limits: FabricationLimits = FabricationLimits()) -> np.ndarray:
+    """Cost raw panel arrays; returns a COST_DTYPE record per panel
+
+    sizes is (N, 3) box dimensions, material_codes indexes material_names
+    and hole_counts gives each panel's holes (PanelSet layout).
+    """
+    dims = flat_dimensions(sizes)
+    thickness, width, length = dims[:, 0], dims[:, 1], dims[:, 2]
+    hole_counts = np.asarray(hole_counts, dtype=np.int64)
+    density, price_per_lb = prices.material_arrays(material_names)
+    codes = np.asarray(material_codes, dtype=np.int64)
+
+    table = np.zeros(len(dims), dtype=COST_DTYPE)
+    table['panel'] = np.arange(len(dims))
+    table['material_thickness'] = thickness
+    table['sheet_area'] = length * width
+    table['holes'] = hole_counts
+
+    radius = limits.hole_diameter / 2
+    net_area = length * width - hole_counts * np.pi * radius ** 2
+    table['mass'] = net_area * thickness * density[codes]
+    table['cut_length'] = 2 * (length + width) + hole_counts * 2 * np.pi * radius
+
+    table['material_cost'] = length * width * thickness * density[codes] * price_per_lb[codes]
+    thickness_factor = np.maximum(thickness / prices.reference_thickness, 1.0)
+    table['cut_cost'] = (table['cut_length'] * prices.cut_per_inch * thickness_factor
+                         + (hole_counts + 1) * prices.pierce + prices.part_fee)
+    table['cost'] = table['material_cost'] + table['cut_cost']
+    return table
+
+
+def cost_panels(panels: Panels, prices: PriceTable = PriceTable(),
+                limits: FabricationLimits = FabricationLimits()) -> np.ndarray:
+    """Cost a PanelSet (or list of Panel)"""
+    panels = as_panel_set(panels)
+    return cost_arrays(panels.sizes, panels.material_codes, panels.material_names,
+                       panels.hole_counts, prices, limits)
+
+
+def assembly_costs(table: np.ndarray, assembly_index: np.ndarray, count: int = None) -> np.ndarray:
+    """Sum a COST_DTYPE table into ASSEMBLY_COST_DTYPE rows by assembly_index"""
+    assembly_index = np.asarray(assembly_index, dtype=np.int64)
+    if count is None:
+        count = int(assembly_index.max()) + 1 if len(assembly_index) else 0
+    totals = np.zeros(count, dtype=ASSEMBLY_COST_DTYPE)
+    totals['assembly'] = np.arange(count)
+    totals['panels'] = np.bincount(assembly_index, minlength=count)
+    for name in _SUMMED:
+        totals[name] = np.bincount(assembly_index, weights=table[name], minlength=count)
+    return totals
+
+
+def cost_variants(variants: List[PanelSet], prices: PriceTable = PriceTable(),
+                  limits: FabricationLimits = FabricationLimits()) -> Tuple[np.ndarray, np.ndarray]:
+    """Cost many assemblies in one pass
+
+    Returns the per-panel table for all variants stacked together and one
+    ASSEMBLY_COST_DTYPE row per variant. Only the columns costing reads are
+    stacked, each with one np.concatenate, so the per-variant Python work is
+    a material-list lookup and never touches panel names.
+    """
+    if not variants:
+        return np.zeros(0, dtype=COST_DTYPE), np.zeros(0, dtype=ASSEMBLY_COST_DTYPE)
+
+    # Each distinct material list gets a slice of remap taking its codes to
+    # indices into the merged material_names
+    material_names: List[str] = []
+    remap: List[int] = []
+    remap_start: Dict[Tuple[str, ...], int] = {}
+    starts = []
+    for variant in variants:
+        key = tuple(variant.material_names)
+        start = remap_start.get(key)
+        if start is None:
+            start = remap_start[key] = len(remap)
+            for material in key:
+                if material not in material_names:
+                    material_names.append(material)
+                remap.append(material_names.index(material))
+        starts.append(start)
+
+    counts = np.array([len(v) for v in variants], dtype=np.int64)
+    sizes = np.concatenate([v.sizes for v in variants]).reshape(-1, 3)
+    codes = np.asarray(remap, dtype=np.int64)[
+        np.repeat(starts, counts) + np.concatenate([v.material_codes for v in variants])]
+    # Differences of the stacked hole_start arrays, minus the one spanning
+    # each pair of neighbouring variants
+    hole_start = np.concatenate([v.hole_start for v in variants])
+    hole_counts = np.delete(np.diff(hole_start), np.cumsum(counts + 1)[:-1] - 1)
+
+    table = cost_arrays(sizes, codes, material_names, hole_counts, prices, limits)
+    variant_index = np.repeat(np.arange(len(variants)), counts)
+    return table, assembly_costs(table, variant_index, len(variants))
+
+
+def rank_assemblies(totals: np.ndarray, key: str = 'cost') -> np.ndarray:
+    """Assembly indices from cheapest (or lightest, etc.) to dearest"""
+    return totals['assembly'][np.argsort(totals[key], kind='stable')]
+
+
+def describe_costs(panels: Panels, table: np.ndarray) -> List[str]:
+    """Human-readable line per panel plus a total"""
+    panels = as_panel_set(panels)
+    lines = [f"{panels.names[row['panel']]}: {row['mass']:.2f} lb, {row['sheet_area']:.0f} in², "
+             f"{row['cut_length']:.1f}\" cut, {row['holes']} holes, ${row['cost']:.2f}"
+             for row in table]
+    lines.append(f"Total: {table['mass'].sum():.2f} lb, {table['sheet_area'].sum():.0f} in², "
+                 f"{table['cut_length'].sum():.1f}\" cut, {table['holes'].sum()} holes, "
+                 f"${table['cost'].sum():.2f}")
+    return lines
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['cost'] + sys.argv[1:]))
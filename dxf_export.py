@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+DXF Export of Flat Patterns for SendCutSend
+Writes panel outlines and holes as R12 ASCII DXF, one file per panel or per
+nested stock sheet, with cut geometry and annotations on separate layers
+"""
+
+import os
+import re
+from typing import List, Sequence, TextIO
+
+import numpy as np
+
+from svg_bench_drawer import Panels, PanelSet, as_panel_set
+from fabrication import FabricationLimits, flat_dimensions, flat_hole_positions
+from nesting import NestingResult, StockSheet, placed_holes
+
+
+CUT_LAYER = 'CUT'
+ANNOTATION_LAYER = 'ANNOTATION'
+
+# Layer name -> AutoCAD colour index (7 = white/black, 3 = green)
+LAYERS = {CUT_LAYER: 7, ANNOTATION_LAYER: 3}
+
+# Characters buffered before each write to disk
+WRITE_BUFFER = 1 << 20
+
+# Entities formatted per batch; bounds the temporary strings for large sheets
+ENTITY_BATCH = 4096
+
+_CIRCLE = "0\nCIRCLE\n8\n%s\n10\n%.6f\n20\n%.6f\n30\n0.0\n40\n%.6f\n"
+_VERTEX = "0\nVERTEX\n8\n%s\n10\n%.6f\n20\n%.6f\n30\n0.0\n"
+_RECTANGLE = ("0\nPOLYLINE\n8\n%s\n66\n1\n10\n0.0\n20\n0.0\n30\n0.0\n70\n1\n"
+              + _VERTEX * 4 + "0\nSEQEND\n8\n%s\n")
+
+
+class DXFWriter:
+    """Streams DXF group codes to a file in large buffered writes
+
+    Entities are appended as text and handed to the file once WRITE_BUFFER
+    characters have accumulated, so memory stays flat however many entities
+    a drawing holds.
+    """
+
+    def __init__(self, file: TextIO, buffer_size: int = WRITE_BUFFER):
+        self.file = file
+        self.buffer_size = buffer_size
+        self._chunks: List[str] = []
+        self._size = 0
+
+    def write(self, text: str):
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._chunks:
+            self.file.write(''.join(self._chunks))
+            self._chunks = []
+            self._size = 0
+
+    def begin(self, extent_min: Sequence[float], extent_max: Sequence[float]):
+        """Header and the layer table, then open the entities section
+
+        R12 has no units header variable; coordinates are in inches.
+        """
+        self.write("0\nSECTION\n2\nHEADER\n9\n$ACADVER\n1\nAC1009\n"
+                   f"9\n$EXTMIN\n10\n{extent_min[0]:.6f}\n20\n{extent_min[1]:.6f}\n30\n0.0\n"
+                   f"9\n$EXTMAX\n10\n{extent_max[0]:.6f}\n20\n{extent_max[1]:.6f}\n30\n0.0\n"
+                   "0\nENDSEC\n")
+        self.write("0\nSECTION\n2\nTABLES\n"
+                   "0\nTABLE\n2\nLTYPE\n70\n1\n"
+                   "0\nLTYPE\n2\nCONTINUOUS\n70\n0\n3\nSolid line\n72\n65\n73\n0\n40\n0.0\n"
+                   "0\nENDTAB\n"
+                   f"0\nTABLE\n2\nLAYER\n70\n{len(LAYERS)}\n")
+        for name, color in LAYERS.items():
+            self.write(f"0\nLAYER\n2\n{name}\n70\n0\n62\n{color}\n6\nCONTINUOUS\n")
+        self.write("0\nENDTAB\n0\nENDSEC\n0\nSECTION\n2\nENTITIES\n")
+
+    def end(self):
+        """Close the entities section and flush"""
+        self.write("0\nENDSEC\n0\nEOF\n")
+        self.flush()
+
+    def rectangles(self, x: np.ndarray, y: np.ndarray, length: np.ndarray, width: np.ndarray,
+                   layer: str = CUT_LAYER):
+        """Closed axis-aligned rectangles with lower-left corners (x, y)"""
+        x1 = np.asarray(x) + length
+        y1 = np.asarray(y) + width
+        rows = np.stack(np.broadcast_arrays(x, y, x1, y, x1, y1, x, y1), axis=-1)
+        for start in range(0, len(rows), ENTITY_BATCH):
+            self.write(''.join(_RECTANGLE % (layer, layer, ax, ay, layer, bx, by, layer, cx, cy,
+                                             layer, dx, dy, layer)
+                               for ax, ay, bx, by, cx, cy, dx, dy
+                               in rows[start:start + ENTITY_BATCH].tolist()))
+
+    def circles(self, x: np.ndarray, y: np.ndarray, radius: float, layer: str = CUT_LAYER):
+        """Circles of one radius centred on (x, y)"""
+        rows = np.stack(np.broadcast_arrays(x, y), axis=-1)
+        for start in range(0, len(rows), ENTITY_BATCH):
+            self.write(''.join(_CIRCLE % (layer, cx, cy, radius)
+                               for cx, cy in rows[start:start + ENTITY_BATCH].tolist()))
+
+    def text(self, x: float, y: float, height: float, value: str, layer: str = ANNOTATION_LAYER):
+        """Single-line text with its lower-left corner at (x, y)"""
+        value = ' '.join(str(value).split())
+        self.write(f"0\nTEXT\n8\n{layer}\n10\n{x:.6f}\n20\n{y:.6f}\n30\n0.0\n40\n{height:.6f}\n1\n{value}\n")
+
+
+def _file_slug(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-').lower() or 'panel'
+
+
+def write_panel_dxf(file: TextIO, panels: PanelSet, index: int,
+                    limits: FabricationLimits = FabricationLimits()):
+    """One panel's flat pattern: outline and holes on CUT, label on ANNOTATION
+
+    The flat pattern sits in the first quadrant with its longer side along x.
+    """
+    thickness, width, length = flat_dimensions(panels.sizes[index])[0].tolist()
+    start, stop = panels.hole_start[index], panels.hole_start[index + 1]
+    holes = flat_hole_positions(panels.sizes[index:index + 1], np.zeros(stop - start, dtype=np.int64),
+                                panels.hole_offsets[start:stop])
+    label_height = 0.25
+
+    writer = DXFWriter(file)
+    writer.begin((0.0, 0.0), (length, width + 2 * label_height))
+    writer.rectangles(np.zeros(1), np.zeros(1), length, width)
+    writer.circles(holes[:, 0], holes[:, 1], limits.hole_diameter / 2)
+    writer.text(0.0, width + label_height, label_height,
+                f"{panels.names[index]} - {panels.material_names[panels.material_codes[index]]} "
+                f"{thickness}\"")
+    writer.end()
+
+
+def write_sheet_dxf(file: TextIO, panels: PanelSet, result: NestingResult, sheet: StockSheet,
+                    limits: FabricationLimits = FabricationLimits()):
+    """One nested sheet: parts and holes on CUT, sheet border and part names on ANNOTATION"""
+    parts = np.array(sheet.parts, dtype=np.int64)
+    rows = result.placements[parts]
+    hx, hy = placed_holes(panels, result, parts)
+
+    writer = DXFWriter(file)
+    writer.begin((0.0, 0.0), (sheet.length, sheet.width))
+    writer.rectangles(np.zeros(1), np.zeros(1), sheet.length, sheet.width, ANNOTATION_LAYER)
+    writer.rectangles(rows['x'], rows['y'], rows['length'], rows['width'])
+    writer.circles(hx, hy, limits.hole_diameter / 2)
+    heights = np.clip(rows['width'] / 4, 0.1, 0.5)
+    for part, x, y, height in zip(parts.tolist(), rows['x'].tolist(), rows['y'].tolist(),
+                                  heights.tolist()):
+        writer.text(x + height / 2, y + height / 2, height, panels.names[part])
+    writer.end()
+
+
+def export_panels(panels: Panels, output_dir: str, prefix: str = "panel",
+                  limits: FabricationLimits = FabricationLimits()) -> List[str]:
+    """Write one DXF per panel; returns the file names"""
+    panels = as_panel_set(panels)
+    os.makedirs(output_dir, exist_ok=True)
+    names = []
+    for index, name in enumerate(panels.names):
+        filename = f"{prefix}-{index + 1:04d}-{_file_slug(name)}.dxf"
+        with open(os.path.join(output_dir, filename), 'w') as f:
+            write_panel_dxf(f, panels, index, limits)
+        names.append(filename)
+    return names
+
+
+def export_sheets(panels: Panels, result: NestingResult, output_dir: str, prefix: str = "sheet",
+                  limits: FabricationLimits = FabricationLimits()) -> List[str]:
+    """Write one DXF per nested stock sheet; returns the file names"""
+    panels = as_panel_set(panels)
+    os.makedirs(output_dir, exist_ok=True)
+    names = []
+    for sheet in result.sheets:
+        filename = f"{prefix}-{sheet.index + 1:03d}.dxf"
+        with open(os.path.join(output_dir, filename), 'w') as f:
+            write_sheet_dxf(f, panels, result, sheet, limits)
+        names.append(filename)
+    return names
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['dxf'] + sys.argv[1:]))
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Fabrication Constraint Checker for SendCutSend
+Checks panel size, hole edge distance and hole-to-hole spacing for whole
+panel tables (or stacked sweep variants) in vectorized NumPy passes
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from svg_bench_drawer import Panels, PanelSet, as_panel_set
+
+
+@dataclass
+class FabricationLimits:
+    """SendCutSend limits (see bench-design-concepts.md)"""
+    max_length: float = 44.0  # Longer flat-pattern side
+    max_width: float = 30.0   # Shorter flat-pattern side
+    hole_diameter: float = 0.25
+    # Minimum web from hole edge to part edge, in multiples of material thickness
+    edge_distance_factor: float = 1.0
+    # Minimum web between neighbouring hole edges, in multiples of material thickness
+    hole_spacing_factor: float = 1.0
+
+
+VIOLATION_DTYPE = np.dtype([
+    ('panel', np.int64),
+    ('flat_length', np.float64),
+    ('flat_width', np.float64),
+    ('material_thickness', np.float64),
+    ('oversize', np.bool_),
+    ('min_edge_distance', np.float64),  # Web to nearest edge, inf without holes
+    ('edge_violations', np.int64),
+    ('min_hole_spacing', np.float64),   # Web to nearest hole, inf with < 2 holes
+    ('spacing_violations', np.int64),
+    ('ok', np.bool_),
+])
+
+# Bound on (holes x holes) pair distances evaluated per block
+_PAIR_BLOCK = 1 << 22
+
+
+def flat_axes(sizes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split (N, 3) box sizes into thickness axis and the two in-plane axes
+
+    The thinnest dimension is the sheet thickness; the remaining two are
+    the flat pattern, returned longer side first.
+    """
+    order = np.argsort(sizes, axis=1, kind='stable')
+    return order[:, 0], order[:, 2], order[:, 1]
+
+
+def flat_dimensions(sizes: np.ndarray) -> np.ndarray:
+    """(N, 3) sorted dimensions: thickness, flat width, flat length"""
+    return np.sort(np.asarray(sizes, dtype=float).reshape(-1, 3), axis=1)
+
+
+def flat_hole_positions(sizes: np.ndarray, hole_panels: np.ndarray,
+                        hole_offsets: np.ndarray) -> np.ndarray:
+    """(M, 2) hole positions in each panel's flat pattern (length, width)"""
+    _, length_axis, width_axis = flat_axes(sizes)
+    rows = np.arange(len(hole_panels))
+    return np.stack([hole_offsets[rows, length_axis[hole_panels]],
+                     hole_offsets[rows, width_axis[hole_panels]]], axis=-1)
+
+
+def _min_hole_spacing(flat_holes: np.ndarray, hole_start: np.ndarray) -> np.ndarray:
+    """Minimum centre-to-centre distance between holes of each panel
+
+    Panels are processed in blocks of similar hole count, padding each
+    block to its largest panel, so a few hole-heavy panels do not inflate
+    the work for the rest.
+    """
+    counts = np.diff(hole_start)
+    spacing = np.full(len(counts), np.inf)
+    candidates = np.flatnonzero(counts >= 2)
+    if not len(candidates):
+        return spacing
+
+    candidates = candidates[np.argsort(counts[candidates], kind='stable')]
+    i = 0
+    while i < len(candidates):
+        k = int(counts[candidates[i]])
+        block_len = max(1, _PAIR_BLOCK // (k * (k - 1) // 2))
+        block = candidates[i:i + block_len]
+        # Counts are ascending; cap the block at twice the smallest count
+        block = block[:np.searchsorted(counts[block], 2 * k, side='right')]
+        k = int(counts[block].max())
+
+        # Each unordered pair once; pairs touching padding are masked out
+        first, second = np.triu_indices(k, 1)
+        index = np.minimum(hole_start[block, None] + np.arange(k), len(flat_holes) - 1)
+        coords = flat_holes[index]
+        delta = coords[:, first] - coords[:, second]
+        dist2 = delta[..., 0] ** 2 + delta[..., 1] ** 2
+        dist2[second[None, :] >= counts[block, None]] = np.inf
+        spacing[block] = np.sqrt(dist2.min(axis=1))
+        i += len(block)
+    return spacing
+
+
+def check_arrays(sizes: np.ndarray, hole_offsets: np.ndarray, hole_start: np.ndarray,
+                 limits: FabricationLimits = FabricationLimits()) -> np.ndarray:
+    """Check raw panel arrays; returns a VIOLATION_DTYPE record per panel
+
+    sizes is (N, 3) box dimensions, hole_offsets is (M, 3) hole centres
+    relative to their panel, and hole_start[i]:hole_start[i+1] selects the
+    holes of panel i (PanelSet layout).
+    """
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 3)
+    hole_offsets = np.asarray(hole_offsets, dtype=float).reshape(-1, 3)
+    hole_start = np.asarray(hole_start, dtype=np.int64)
+    n = len(sizes)
+
+    table = np.zeros(n, dtype=VIOLATION_DTYPE)
+    table['panel'] = np.arange(n)
+    dims = flat_dimensions(sizes)
+    thickness = dims[:, 0]
+    table['material_thickness'] = thickness
+    table['flat_width'] = dims[:, 1]
+    table['flat_length'] = dims[:, 2]
+    table['oversize'] = (dims[:, 2] > limits.max_length) | (dims[:, 1] > limits.max_width)
+
+    radius = limits.hole_diameter / 2
+    table['min_edge_distance'] = np.inf
+    table['min_hole_spacing'] = np.inf
+
+    counts = np.diff(hole_start)
+    if len(hole_offsets):
+        hole_panels = np.repeat(np.arange(n), counts)
+        flat = flat_hole_positions(sizes, hole_panels, hole_offsets)
+        extent = np.stack([dims[hole_panels, 2], dims[hole_panels, 1]], axis=-1)
+
+        # Web from hole edge to the nearest of the four flat-pattern edges
+        edge = np.minimum(flat, extent - flat).min(axis=1) - radius
+        has_holes = counts > 0
+        table['min_edge_distance'][has_holes] = np.minimum.reduceat(edge, hole_start[:-1][has_holes])
+        edge_bad = edge < limits.edge_distance_factor * thickness[hole_panels]
+        table['edge_violations'] = np.bincount(hole_panels, weights=edge_bad, minlength=n)
+
+        spacing = _min_hole_spacing(flat, hole_start) - 2 * radius
+        table['min_hole_spacing'] = spacing
+        # A single close pair is reported per panel
+        table['spacing_violations'] = spacing < limits.hole_spacing_factor * thickness
+
+    table['ok'] = ~table['oversize'] & (table['edge_violations'] == 0) & (table['spacing_violations'] == 0)
+    return table
+
+
+def check_panels(panels: Panels, limits: FabricationLimits = FabricationLimits()) -> np.ndarray:
+    """Check a PanelSet (or list of Panel) against fabrication limits"""
+    panels = as_panel_set(panels)
+    return check_arrays(panels.sizes, panels.hole_offsets, panels.hole_start, limits)
+
+
+def check_variants(variants: List[PanelSet],
+                   limits: FabricationLimits = FabricationLimits()) -> Tuple[np.ndarray, np.ndarray]:
+    """Check many assemblies in one pass
+
+    Returns the per-panel table for all variants stacked together and a
+    boolean array that is True for variants whose panels all pass.
+    """
+    stacked = PanelSet.concatenate(variants)
+    table = check_panels(stacked, limits)
+    variant_index = np.repeat(np.arange(len(variants)), [len(v) for v in variants])
+    failures = np.bincount(variant_index, weights=~table['ok'], minlength=len(variants))
+    return table, failures == 0
+
+
+def describe_violations(panels: Panels, table: np.ndarray,
+                        limits: FabricationLimits = FabricationLimits()) -> List[str]:
+    """Human-readable lines for every failing panel"""
+    panels = as_panel_set(panels)
+    lines = []
+    for row in table[~table['ok']]:
+        name = panels.names[row['panel']]
+        if row['oversize']:
+            lines.append(f"{name}: {row['flat_length']:.2f}\" × {row['flat_width']:.2f}\" "
+                         f"exceeds {limits.max_length:.0f}\" × {limits.max_width:.0f}\" sheet limit")
+        if row['edge_violations']:
+            lines.append(f"{name}: {row['edge_violations']} hole(s) closer than "
+                         f"{limits.edge_distance_factor * row['material_thickness']:.3f}\" to an edge "
+                         f"(min {row['min_edge_distance']:.3f}\")")
+        if row['spacing_violations']:
+            lines.append(f"{name}: holes {row['min_hole_spacing']:.3f}\" apart, need "
+                         f"{limits.hole_spacing_factor * row['material_thickness']:.3f}\"")
+    return lines
+
+
+if __name__ == "__main__":
+    from svg_bench_drawer import create_concept_4_slab_legs, create_concept_2_u_modules
+
+    for title, factory in [("Concept 4: Thin Slab Legs", create_concept_4_slab_legs),
+                           ("Concept 2: Interlocking U-Modules", create_concept_2_u_modules)]:
+        panels = PanelSet.from_panels(factory())
+        table = check_panels(panels)
+        print(f"{title}: {int(table['ok'].sum())}/{len(panels)} panels within limits")
+        for line in describe_violations(panels, table):
+            print(f"  ✗ {line}")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Gallery Builder for Bench Concepts
+Generates every concept viewer against one shared plotly.js bundle and
+regenerates the concept sections of comparison.html from the concept list
+"""
+
+import argparse
+import os
+from dataclasses import dataclass
+from typing import List
+
+from bench_model import CONCEPTS as MODEL_CONCEPTS, BenchModel, build_model
+
+
+COMPARISON_BEGIN = '        <!-- BEGIN GENERATED CONCEPTS: regenerate with `python3 gallery.py` -->'
+COMPARISON_END = '        <!-- END GENERATED CONCEPTS -->'
+
+
+@dataclass
+class GalleryConcept:
+    """A concept as shown on the comparison page"""
+    slug: str  # bench_model concept and output file prefix, e.g. "concept-4"
+    meta: str
+    drawing_notes: str
+    viewer_notes: str
+
+    @property
+    def title(self) -> str:
+        return MODEL_CONCEPTS[self.slug].title
+
+    def model(self) -> BenchModel:
+        return build_model(self.slug)
+
+    @property
+    def short_name(self) -> str:
+        return self.title.split(':')[0]
+
+    @property
+    def drawing_file(self) -> str:
+        return f"{self.slug}-drawings.svg"
+
+    @property
+    def viewer_file(self) -> str:
+        return f"{self.slug}-3d.html"
+
+
+CONCEPTS = [
+    GalleryConcept(
+        slug="concept-4",
+        meta="Fukasawa-inspired Minimalism / No Bending Required / 3 Flat Panels",
+        drawing_notes="Dimensioned / Flat Patterns / Production Ready",
+        viewer_notes="Rotatable / Exploded View / Assembly Guide",
+    ),
+    GalleryConcept(
+        slug="concept-2",
+        meta="Modular Design / 6 Bends Total / Scalable Units",
+        drawing_notes="Multi-View / Bend Lines / DXF Export Ready",
+        viewer_notes="Spatial Context / Module Separation / Form Validation",
+    ),
+]
+
+
+def plotlyjs_asset_name() -> str:
+    """Versioned file name for the shared plotly.js bundle"""
+    from plotly.offline import get_plotlyjs_version
+    return f"plotly-{get_plotlyjs_version()}.min.js"
+
+
+def write_plotlyjs_asset(output_dir: str) -> str:
+    """Write the shared plotly.js bundle once and return its file name"""
+    from plotly.offline import get_plotlyjs
+
+    name = plotlyjs_asset_name()
+    path = os.path.join(output_dir, name)
+    if not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(get_plotlyjs())
+    return name
+
+
+def render_concept_section(concept: GalleryConcept) -> str:
+    """HTML section showing one concept's drawing and viewer side by side"""
+    return f'''        <section>
+            <div class="concept-header">{concept.title}</div>
+            <div class="concept-meta">{concept.meta}</div>
+
+            <div class="side-by-side">
+                <div class="visualization-panel">
+                    <h3>SVG Technical Drawing</h3>
+                    <div class="svg-container">
+                        <object data="{concept.drawing_file}" type="image/svg+xml" width="100%">
+                            <p>SVG not supported. <a href="{concept.drawing_file}">Download SVG</a></p>
+                        </object>
+                    </div>
+                    <div class="panel-notes">
+                        {concept.drawing_notes}
+                    </div>
+                </div>
+
+                <div class="visualization-panel">
+                    <h3>Interactive 3D Model</h3>
+                    <div class="iframe-container">
+                        <iframe src="{concept.viewer_file}"></iframe>
+                    </div>
+                    <div class="panel-notes">
+                        {concept.viewer_notes}
+                    </div>
+                </div>
+            </div>
+        </section>
+'''
+
+
+def render_downloads_section(concepts: List[GalleryConcept]) -> str:
+    """HTML section linking every concept's outputs"""
+    links = [f'                <a href="{c.drawing_file}" download class="btn">'
+             f'Download {c.short_name} SVG</a>' for c in concepts]
+    links += [f'                <a href="{c.viewer_file}" class="btn">'
+              f'Open {c.short_name} 3D</a>' for c in concepts]
+    links_html = '\n'.join(links)
+    return f'''        <section class="downloads">
+            <h3>Downloads and Links</h3>
+            <div class="download-links">
+{links_html}
+            </div>
+        </section>'''
+
+
+def render_comparison(template: str, concepts: List[GalleryConcept]) -> str:
+    """Replace the generated block of a comparison.html template"""
+    try:
+        head, rest = template.split(COMPARISON_BEGIN + '\n', 1)
+        _, tail = rest.split(COMPARISON_END, 1)
+    except ValueError:
+        raise ValueError("comparison.html is missing the generated-concepts markers")
+
+    sections = '\n'.join(render_concept_section(c) for c in concepts)
+    return (head + COMPARISON_BEGIN + '\n' + sections + '\n'
+            + render_downloads_section(concepts) + '\n' + COMPARISON_END + tail)
+
+
+def write_comparison(concepts: List[GalleryConcept], output_dir: str) -> bool:
+    """Regenerate comparison.html in output_dir
+
+    An existing comparison.html in output_dir is used as the template,
+    falling back to the one next to this script. The file is only
+    rewritten when its content changes; returns True if it was written.
+    """
+    output_path = os.path.join(output_dir, 'comparison.html')
+    template_path = output_path
+    if not os.path.exists(template_path):
+        template_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'comparison.html')
+    with open(template_path, encoding='utf-8') as f:
+        template = f.read()
+
+    html = render_comparison(template, concepts)
+    if template_path == output_path and html == template:
+        return False
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    return True
+
+
+def build_gallery(concepts: List[GalleryConcept] = CONCEPTS, output_dir: str = '.',
+                  drawings: bool = True, comparison: bool = True,
+                  batched: bool = False, cache=None) -> List[str]:
+    """Generate every concept viewer (and drawing) sharing one plotly.js
+
+    Outputs already current in the optional render cache are skipped.
+    Returns the list of files written.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    asset = plotlyjs_asset_name()
+    written = [asset] if not os.path.exists(os.path.join(output_dir, asset)) else []
+    write_plotlyjs_asset(output_dir)
+
+    for concept in concepts:
+        # One model per concept feeds both outputs
+        model = concept.model()
+        if drawings and model.render_drawing(
+                os.path.join(output_dir, concept.drawing_file), cache=cache):
+            written.append(concept.drawing_file)
+
+        if model.write_viewer(
+                os.path.join(output_dir, concept.viewer_file),
+                cache=cache,
+                batched=batched,
+                include_plotlyjs=asset):
+            written.append(concept.viewer_file)
+
+    if comparison and write_comparison(concepts, output_dir):
+        written.append('comparison.html')
+
+    return written
+
+
+def add_gallery_arguments(parser: argparse.ArgumentParser):
+    """Arguments shared by the gallery script and the bench CLI"""
+    parser.add_argument('--output-dir', default='.', help="Directory to write into")
+    parser.add_argument('--no-drawings', action='store_true', help="Skip the SVG drawings")
+    parser.add_argument('--no-comparison', action='store_true',
+                        help="Do not regenerate comparison.html")
+    parser.add_argument('--batched', action='store_true',
+                        help="Draw each viewer state as a single mesh trace")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-render even if the render cache is up to date")
+
+
+def main(args: argparse.Namespace):
+    from render_cache import RenderCache
+    cache = None if args.no_cache else RenderCache()
+
+    print("Building concept gallery...")
+    written = build_gallery(CONCEPTS, args.output_dir,
+                            drawings=not args.no_drawings,
+                            comparison=not args.no_comparison,
+                            batched=args.batched,
+                            cache=cache)
+    for name in written:
+        print(f"✓ Saved {name}")
+    if not written:
+        print("✓ Everything up to date")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build every concept against a shared plotly.js")
+    add_gallery_arguments(parser)
+    main(parser.parse_args())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Binary glTF (GLB) Export of Bench Assemblies
+Writes panel box meshes as packed float32/uint16 buffers with a named node
+per panel, and the assembled and exploded states as separate scenes
+"""
+
+import json
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from svg_bench_drawer import Panels, as_panel_set
+from bench_model import BOX_TRIANGLES
+
+
+GLB_MAGIC = 0x46546C67   # "glTF"
+GLB_VERSION = 2
+JSON_CHUNK = 0x4E4F534A  # "JSON"
+BIN_CHUNK = 0x004E4942   # "BIN\0"
+
+# Component types and buffer targets from the glTF 2.0 specification
+FLOAT = 5126
+UNSIGNED_SHORT = 5123
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+INCHES_TO_METRES = 0.0254
+
+# glTF is y-up; the bench model is z-up. -90° about x takes +z to +y.
+Z_UP_TO_Y_UP = [-0.5 ** 0.5, 0.0, 0.0, 0.5 ** 0.5]
+
+# Base colour (linear RGBA), metallic and roughness per material name
+MATERIAL_FINISHES = {
+    '304 Stainless Steel': ([0.80, 0.80, 0.82, 1.0], 1.0, 0.35),
+    '5052 Aluminum': ([0.91, 0.92, 0.92, 1.0], 1.0, 0.45),
+    'Cold Rolled Steel': ([0.45, 0.46, 0.48, 1.0], 1.0, 0.55),
+}
+DEFAULT_FINISH = ([0.69, 0.69, 0.69, 1.0], 0.5, 0.5)
+
+
+def _pad(data: bytes, fill: bytes) -> bytes:
+    """Pad to the 4-byte alignment GLB chunks require"""
+    return data + fill * (-len(data) % 4)
+
+
+def build_gltf(panels: Panels, explode: Optional[np.ndarray] = None,
+               name: str = "Bench") -> Tuple[Dict[str, Any], bytes]:
+    """glTF document and binary buffer for a panel table
+
+    Panels with the same size and material share one mesh whose vertices
+    are relative to the panel corner, so a node per panel only carries a
+    name and a translation. Vertices are float32 and the box indices,
+    shared by every mesh, uint16. Scene 0 is assembled; with explode,
+    (N, 3) offsets, scene 1 is exploded. A root node per scene converts
+    inches to metres and z-up to glTF's y-up.
+    """
+    panels = as_panel_set(panels)
+    n = len(panels)
+    key = np.column_stack([panels.sizes, panels.material_codes])
+    if n:
+        _, first, mesh_index = np.unique(key, axis=0, return_index=True, return_inverse=True)
+        mesh_index = mesh_index.reshape(-1)
+    else:
+        first, mesh_index = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    # Corner-relative box vertices of one representative panel per mesh
+    local = (panels.corners[first] - panels.positions[first, None, :]).astype(np.float32)
+    indices = BOX_TRIANGLES.astype(np.uint16).reshape(-1)
+    index_bytes = _pad(indices.tobytes(), b'\0')
+    binary = index_bytes + local.tobytes()
+
+    vertex_size = 8 * 3 * 4
+    accessors = [{'bufferView': 0, 'componentType': UNSIGNED_SHORT,
+                  'count': int(indices.size), 'type': 'SCALAR'}]
+    lows, highs = local.min(axis=1).tolist(), local.max(axis=1).tolist()
+    accessors += [{'bufferView': 1, 'byteOffset': m * vertex_size, 'componentType': FLOAT,
+                   'count': 8, 'type': 'VEC3', 'min': low, 'max': high}
+                  for m, (low, high) in enumerate(zip(lows, highs))]
+
+    materials = []
+    for material_name in panels.material_names:
+        color, metallic, roughness = MATERIAL_FINISHES.get(material_name, DEFAULT_FINISH)
+        materials.append({'name': material_name, 'doubleSided': True,
+                          'pbrMetallicRoughness': {'baseColorFactor': color,
+                                                   'metallicFactor': metallic,
+                                                   'roughnessFactor': roughness}})
+
+    codes = panels.material_codes[first].tolist()
+    sizes = panels.sizes[first].tolist()
+    meshes = [{'name': f"{s[0]:g} × {s[1]:g} × {s[2]:g} {panels.material_names[code]}",
+               'primitives': [{'attributes': {'POSITION': m + 1}, 'indices': 0,
+                               'material': code}]}
+              for m, (s, code) in enumerate(zip(sizes, codes))]
+
+    states = [('assembled', panels.positions)]
+    if explode is not None:
+        states.append(('exploded', panels.positions + np.asarray(explode, dtype=float).reshape(-1, 3)))
+
+    nodes: List[Dict[str, Any]] = []
+    scenes = []
+    names = panels.names
+    mesh_list = mesh_index.tolist()
+    for state, positions in states:
+        root = len(nodes)
+        children = list(range(root + 1, root + 1 + n))
+        nodes.append({'name': f"{name} ({state})", 'rotation': Z_UP_TO_Y_UP,
+                      'scale': [INCHES_TO_METRES] * 3, 'children': children})
+        nodes.extend({'name': panel_name, 'mesh': mesh, 'translation': translation}
+                     for panel_name, mesh, translation in zip(names, mesh_list, positions.tolist()))
+        scenes.append({'name': state.capitalize(), 'nodes': [root]})
+
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'bench gltf_export'},
+        'scene': 0,
+        'scenes': scenes,
+        'nodes': nodes,
+        'meshes': meshes,
+        'materials': materials,
+        'accessors': accessors,
+        'bufferViews': [
+            {'buffer': 0, 'byteOffset': 0, 'byteLength': int(indices.nbytes),
+             'target': ELEMENT_ARRAY_BUFFER},
+            {'buffer': 0, 'byteOffset': len(index_bytes), 'byteLength': int(local.nbytes),
+             'byteStride': 12, 'target': ARRAY_BUFFER},
+        ],
+        'buffers': [{'byteLength': len(binary)}],
+    }
+    return gltf, binary
+
+
+def glb_bytes(gltf: Dict[str, Any], binary: bytes) -> bytes:
+    """Pack a glTF document and its buffer into a GLB container"""
+    json_chunk = _pad(json.dumps(gltf, separators=(',', ':'), ensure_ascii=False).encode('utf-8'), b' ')
+    bin_chunk = _pad(binary, b'\0')
+    length = 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+    return b''.join([
+        struct.pack('<III', GLB_MAGIC, GLB_VERSION, length),
+        struct.pack('<II', len(json_chunk), JSON_CHUNK), json_chunk,
+        struct.pack('<II', len(bin_chunk), BIN_CHUNK), bin_chunk,
+    ])
+
+
+def read_glb(data: bytes) -> Tuple[Dict[str, Any], bytes]:
+    """Split a GLB container back into its glTF document and buffer"""
+    magic, version, length = struct.unpack_from('<III', data, 0)
+    if magic != GLB_MAGIC or version != GLB_VERSION:
+        raise ValueError("Not a glTF 2.0 binary file")
+    json_length, _ = struct.unpack_from('<II', data, 12)
+    gltf = json.loads(data[20:20 + json_length].decode('utf-8'))
+    offset = 20 + json_length
+    binary = b''
+    if offset < length:
+        bin_length, _ = struct.unpack_from('<II', data, offset)
+        binary = data[offset + 8:offset + 8 + bin_length]
+    return gltf, binary
+
+
+def write_glb(filename: str, panels: Panels, explode: Optional[np.ndarray] = None,
+              name: str = "Bench") -> int:
+    """Write a GLB file; returns its size in bytes"""
+    data = glb_bytes(*build_gltf(panels, explode, name))
+    with open(filename, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['gltf'] + sys.argv[1:]))
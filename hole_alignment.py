@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Hole Alignment Checker for Through-Bolted Panels
+Matches every fastener hole to a coaxial partner on a mating panel with a
+sorted-key spatial hash and reports unmatched or misaligned holes
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from svg_bench_drawer import Panels, as_panel_set
+from fabrication import flat_axes
+
+
+MATCHED, MISALIGNED, UNMATCHED = 0, 1, 2
+STATUS_NAMES = ('matched', 'misaligned', 'unmatched')
+
+HOLE_DTYPE = np.dtype([
+    ('hole', np.int64),       # Row in the PanelSet hole table
+    ('panel', np.int64),
+    ('x', np.float64),        # World position
+    ('y', np.float64),
+    ('z', np.float64),
+    ('axis', np.int8),        # Bolt axis: the panel's thickness axis
+    ('status', np.int8),      # MATCHED, MISALIGNED or UNMATCHED
+    ('partner', np.int64),    # Nearest coaxial hole on another panel, -1 if none
+    ('offset', np.float64),   # Off-axis distance to the partner, inf if none
+    ('axial', np.float64),    # Distance along the axis to the partner, inf if none
+])
+
+# For each bolt axis: the two off-axis coordinates, then the axis itself
+_AXIS_FRAMES = np.array([[1, 2, 0], [0, 2, 1], [0, 1, 2]])
+
+# Neighbouring cells of a 3 x 3 x 3 block
+_NEIGHBOURS = np.stack(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1], indexing='ij'), -1).reshape(-1, 3)
+
+
+def _hash_pairs(cells: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """All (i, j), i != j, whose integer cells are equal or adjacent
+
+    cells is (M, 4): a group id followed by three cell coordinates. Each
+    cell becomes one int64 key; the sorted keys act as the hash table and
+    every neighbour lookup is a vectorized searchsorted.
+    """
+    cells = cells - cells.min(axis=0) + [0, 1, 1, 1]
+    extent = cells.max(axis=0) + [1, 2, 2, 2]
+    strides = np.array([extent[1] * extent[2] * extent[3], extent[2] * extent[3], extent[3], 1])
+    keys = cells @ strides
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    first, second = [], []
+    for offset in (_NEIGHBOURS @ strides[1:]).tolist():
+        lo = np.searchsorted(sorted_keys, keys + offset, side='left')
+        counts = np.searchsorted(sorted_keys, keys + offset, side='right') - lo
+        i = np.repeat(np.arange(len(keys)), counts)
+        j = order[np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(lo, counts)]
+        first.append(i)
+        second.append(j)
+    i, j = np.concatenate(first), np.concatenate(second)
+    keep = i != j
+    return i[keep], j[keep]
+
+
+def align_arrays(world: np.ndarray, axes: np.ndarray, hole_panels: np.ndarray,
+                 tolerance: float = 0.02, search_radius: float = 0.5,
+                 max_axial: float = 1.0) -> np.ndarray:
+    """Match holes to coaxial partners on other panels
+
+    world is (M, 3) hole centres, axes the bolt axis (0-2) of each hole and
+    hole_panels its panel. Two holes are partners when they share an axis,
+    lie within max_axial of each other along it and belong to different
+    panels. A hole is MATCHED when its nearest partner is within tolerance
+    off-axis, MISALIGNED when the nearest is within search_radius, and
+    UNMATCHED otherwise. Returns a HOLE_DTYPE record per hole.
+    """
+    world = np.asarray(world, dtype=float).reshape(-1, 3)
+    axes = np.asarray(axes, dtype=np.int64)
+    hole_panels = np.asarray(hole_panels, dtype=np.int64)
+    m = len(world)
+
+    table = np.zeros(m, dtype=HOLE_DTYPE)
+    table['hole'] = np.arange(m)
+    table['panel'] = hole_panels
+    table['x'], table['y'], table['z'] = world.T
+    table['axis'] = axes
+    table['status'] = UNMATCHED
+    table['partner'] = -1
+    table['offset'] = np.inf
+    table['axial'] = np.inf
+    if m < 2:
+        return table
+
+    # Coordinates in each hole's bolt frame: (off-axis u, v, along-axis w)
+    local = np.take_along_axis(world, _AXIS_FRAMES[axes], axis=1)
+    cells = np.floor(local / [search_radius, search_radius, max_axial]).astype(np.int64)
+    i, j = _hash_pairs(np.column_stack([axes, cells]))
+
+    offset = np.hypot(local[i, 0] - local[j, 0], local[i, 1] - local[j, 1])
+    axial = np.abs(local[i, 2] - local[j, 2])
+    keep = ((axes[i] == axes[j]) & (hole_panels[i] != hole_panels[j]) &
+            (offset <= search_radius) & (axial <= max_axial))
+    i, j, offset, axial = i[keep], j[keep], offset[keep], axial[keep]
+
+    # Nearest partner per hole: first row of each hole after sorting by offset
+    order = np.lexsort((axial, offset, i))
+    i, j, offset, axial = i[order], j[order], offset[order], axial[order]
+    first = np.flatnonzero(np.r_[True, i[1:] != i[:-1]]) if len(i) else np.zeros(0, dtype=np.int64)
+    holes = i[first]
+    table['partner'][holes] = j[first]
+    table['offset'][holes] = offset[first]
+    table['axial'][holes] = axial[first]
+    table['status'][holes] = np.where(offset[first] <= tolerance, MATCHED, MISALIGNED)
+    return table
+
+
+def check_hole_alignment(panels: Panels, tolerance: float = 0.02, search_radius: float = 0.5,
+                         max_axial: float = 1.0) -> np.ndarray:
+    """Alignment table for every hole of a PanelSet (or list of Panel)"""
+    panels = as_panel_set(panels)
+    hole_panels = panels.hole_panels
+    thickness_axis = flat_axes(panels.sizes)[0]
+    return align_arrays(panels.world_holes(), thickness_axis[hole_panels], hole_panels,
+                        tolerance, search_radius, max_axial)
+
+
+def describe_alignment(panels: Panels, table: np.ndarray) -> List[str]:
+    """Human-readable line per misaligned or unmatched hole"""
+    panels = as_panel_set(panels)
+    names = panels.names
+    lines = []
+    for row in table[table['status'] != MATCHED]:
+        where = (f"{names[row['panel']]} hole at ({row['x']:.3f}, {row['y']:.3f}, {row['z']:.3f}) "
+                 f"along {'xyz'[row['axis']]}")
+        if row['status'] == MISALIGNED:
+            partner = table[row['partner']]
+            lines.append(f"{where}: {row['offset']:.3f}\" off axis from {names[partner['panel']]} hole")
+        else:
+            lines.append(f"{where}: no coaxial hole on a mating panel")
+    return lines
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['holes'] + sys.argv[1:]))
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Panel Interference Checker
+Finds panels that intersect, touch or sit just apart in an assembly, using
+a sort-and-sweep broad phase over the panel boxes
+"""
+
+from typing import List
+
+import numpy as np
+
+from svg_bench_drawer import CONTACT_TOLERANCE, Panels, as_panel_set, overlapping_pairs
+
+
+# Pair classification, worst first
+OVERLAP, CONTACT, GAP = 0, 1, 2
+KIND_NAMES = ('overlap', 'contact', 'gap')
+
+# Contact type by the number of axes on which two boxes just touch
+CONTACT_NAMES = {1: 'face', 2: 'edge', 3: 'corner'}
+
+INTERFERENCE_DTYPE = np.dtype([
+    ('a', np.int64),            # Panel indices, a < b
+    ('b', np.int64),
+    ('kind', np.int8),          # OVERLAP, CONTACT or GAP
+    ('distance', np.float64),   # Gap between the boxes; negative is penetration depth
+    ('axis', np.int8),          # Axis of the gap, contact or shallowest penetration
+    ('touching_axes', np.int8), # Contacts: 1 face, 2 edge, 3 corner
+    ('area', np.float64),       # Contacts: shared face area (0 for edges and corners)
+    ('volume', np.float64),     # Overlaps: intersection volume
+])
+
+
+def interference_arrays(positions: np.ndarray, sizes: np.ndarray, max_gap: float = 0.25,
+                        tolerance: float = CONTACT_TOLERANCE) -> np.ndarray:
+    """Classify every pair of boxes that overlap, touch or lie within max_gap
+
+    positions and sizes are (N, 3) box corners and dimensions. Boxes are
+    grown by max_gap / 2 for the broad phase, swept along the axis where
+    they are most spread out; the candidate pairs are then classified from
+    their per-axis separations. Returns an INTERFERENCE_DTYPE record per
+    pair, sorted by kind then panel.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 3)
+    lo, hi = positions, positions + sizes
+    if len(positions) < 2:
+        return np.zeros(0, dtype=INTERFERENCE_DTYPE)
+
+    # Sweep along the axis with the fewest boxes stacked over any point
+    spread = np.ptp(positions, axis=0) / np.maximum(sizes.mean(axis=0), tolerance)
+    axes = np.roll(np.arange(3), -int(np.argmax(spread)))
+    pad = max_gap / 2 + tolerance
+    a, b = overlapping_pairs(lo[:, axes] - pad, hi[:, axes] + pad)
+    a, b = np.minimum(a, b), np.maximum(a, b)
+
+    # Per-axis separation: positive is a gap, negative an overlap; extent is
+    # the length of the shared interval
+    separation = np.maximum(lo[a] - hi[b], lo[b] - hi[a])
+    extent = np.minimum(hi[a], hi[b]) - np.maximum(lo[a], lo[b])
+    apart = separation > tolerance
+    distance = np.sqrt((np.where(apart, separation, 0.0) ** 2).sum(axis=1))
+    touching = np.abs(separation) <= tolerance
+    overlap = separation < -tolerance
+
+    kind = np.full(len(a), GAP, dtype=np.int8)
+    kind[~apart.any(axis=1)] = CONTACT
+    kind[overlap.all(axis=1)] = OVERLAP
+    keep = (kind != GAP) | (distance <= max_gap + tolerance)
+
+    table = np.zeros(int(keep.sum()), dtype=INTERFERENCE_DTYPE)
+    table['a'], table['b'], table['kind'] = a[keep], b[keep], kind[keep]
+    separation, extent, kind = separation[keep], extent[keep], kind[keep]
+    depth = -separation
+    table['distance'] = np.where(kind == OVERLAP, -depth.min(axis=1), distance[keep])
+    table['axis'] = np.where(kind == OVERLAP, depth.argmin(axis=1), separation.argmax(axis=1))
+    table['touching_axes'] = np.where(kind == CONTACT, touching[keep].sum(axis=1), 0)
+    shared = np.where(touching[keep], 1.0, np.clip(extent, 0.0, None))
+    table['area'] = np.where((kind == CONTACT) & (table['touching_axes'] == 1), shared.prod(axis=1), 0.0)
+    table['volume'] = np.where(kind == OVERLAP, np.clip(extent, 0.0, None).prod(axis=1), 0.0)
+    return table[np.lexsort((table['b'], table['a'], table['kind']))]
+
+
+def check_interference(panels: Panels, max_gap: float = 0.25,
+                       tolerance: float = CONTACT_TOLERANCE) -> np.ndarray:
+    """Interference table for a PanelSet (or list of Panel)"""
+    panels = as_panel_set(panels)
+    return interference_arrays(panels.positions, panels.sizes, max_gap, tolerance)
+
+
+def describe_interference(panels: Panels, table: np.ndarray) -> List[str]:
+    """Human-readable line per pair"""
+    panels = as_panel_set(panels)
+    names = panels.names
+    lines = []
+    for row in table:
+        pair = f"{names[row['a']]} / {names[row['b']]}"
+        axis = 'xyz'[row['axis']]
+        if row['kind'] == OVERLAP:
+            lines.append(f"✗ {pair}: overlap {-row['distance']:.3f}\" deep along {axis}, "
+                         f"{row['volume']:.3f} in³")
+        elif row['kind'] == CONTACT:
+            contact = CONTACT_NAMES[int(row['touching_axes'])]
+            area = f", {row['area']:.2f} in²" if row['area'] else ""
+            lines.append(f"✓ {pair}: {contact} contact{area}")
+        else:
+            lines.append(f"· {pair}: {row['distance']:.3f}\" gap along {axis}")
+    return lines
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['interference'] + sys.argv[1:]))
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Flat-Pattern Nesting for SendCutSend Stock Sheets
+Packs panel flat patterns onto 44" x 30" sheets with a skyline bin packer
+(rotation allowed), reports utilization and renders one SVG per sheet
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from svg_bench_drawer import Panels, PanelSet, SVGDrawing, as_panel_set
+from fabrication import FabricationLimits, flat_dimensions, flat_hole_positions
+
+
+PLACEMENT_DTYPE = np.dtype([
+    ('part', np.int64),      # Index into the nested panel table
+    ('sheet', np.int64),     # Index into NestingResult.sheets, -1 if unplaced
+    ('x', np.float64),       # Lower-left corner on the sheet (inches)
+    ('y', np.float64),
+    ('length', np.float64),  # Extent along the sheet's long side as placed
+    ('width', np.float64),   # Extent along the sheet's short side as placed
+    ('rotated', np.bool_),   # Flat pattern turned 90 degrees
+])
+
+# Open sheets tried before starting a new one; older sheets count as full
+OPEN_SHEETS = 4
+
+
+@dataclass
+class StockSheet:
+    """One stock sheet of a single material and thickness"""
+    index: int
+    material: str
+    thickness: float
+    length: float
+    width: float
+    parts: List[int] = field(default_factory=list)
+    used_area: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        return self.used_area / (self.length * self.width)
+
+
+@dataclass
+class NestingResult:
+    """Sheets used and where each part went"""
+    sheets: List[StockSheet]
+    placements: np.ndarray  # PLACEMENT_DTYPE, one row per part
+
+    @property
+    def unplaced(self) -> np.ndarray:
+        """Indices of parts too large for the stock sheet"""
+        return self.placements['part'][self.placements['sheet'] < 0]
+
+    @property
+    def utilization(self) -> float:
+        """Used area over the area of all sheets"""
+        if not self.sheets:
+            return 0.0
+        return sum(s.used_area for s in self.sheets) / sum(s.length * s.width for s in self.sheets)
+
+
+class Skyline:
+    """Skyline of one sheet: [x, y, width] segments covering its length
+
+    Parts are placed bottom-left: at the position where their top edge ends
+    lowest, preferring the leftmost such position.
+    """
+
+    def __init__(self, length: float, width: float):
+        self.length = length
+        self.width = width
+        self.segments = [[0.0, 0.0, length]]
+
+    def _fit(self, index: int, w: float, h: float) -> float:
+        """Lowest y for a w x h part starting at segment index, or -1"""
+        segments = self.segments
+        x = segments[index][0]
+        if x + w > self.length + 1e-9:
+            return -1.0
+        y = 0.0
+        remaining = w
+        while remaining > 1e-9:
+            seg_y = segments[index][1]
+            if seg_y > y:
+                y = seg_y
+                if y + h > self.width + 1e-9:
+                    return -1.0
+            remaining -= segments[index][2]
+            index += 1
+        return y if y + h <= self.width + 1e-9 else -1.0
+
+    def find(self, w: float, h: float, rotate: bool) -> Tuple[float, int, float, bool]:
+        """Best (top, segment, y, rotated) for the part; top is inf if it does not fit"""
+        best = (np.inf, -1, 0.0, False)
+        for rotated, (pw, ph) in ((False, (w, h)), (True, (h, w))):
+            if rotated and (not rotate or w == h):
+                continue
+            for index in range(len(self.segments)):
+                y = self._fit(index, pw, ph)
+                if y >= 0 and y + ph < best[0] - 1e-9:
+                    best = (y + ph, index, y, rotated)
+        return best
+
+    def place(self, index: int, w: float, h: float, y: float):
+        """Raise the skyline under a w x h part placed at segment index, height y"""
+        segments = self.segments
+        x = segments[index][0]
+        segments.insert(index, [x, y + h, w])
+        end = x + w
+        i = index + 1
+        # Trim or drop the segments now under the part
+        while i < len(segments) and segments[i][0] < end - 1e-9:
+            seg_end = segments[i][0] + segments[i][2]
+            if seg_end <= end + 1e-9:
+                del segments[i]
+            else:
+                segments[i][2] = seg_end - end
+                segments[i][0] = end
+                break
+        # Merge neighbours at equal height
+        i = max(index - 1, 0)
+        while i < len(segments) - 1:
+            if abs(segments[i][1] - segments[i + 1][1]) <= 1e-9:
+                segments[i][2] += segments[i + 1][2]
+                del segments[i + 1]
+            else:
+                i += 1
+
+
+def nest_arrays(lengths: np.ndarray, widths: np.ndarray, groups: List[Tuple[str, float]],
+                group_index: np.ndarray, sheet_length: float = 44.0, sheet_width: float = 30.0,
+                spacing: float = 0.25, rotate: bool = True) -> NestingResult:
+    """Pack rectangles (flat length x width) onto sheets, one run per group
+
+    groups lists the (material, thickness) of each group and group_index
+    gives each part's group. Parts are kept spacing apart; parts larger
+    than the sheet in both orientations are left unplaced.
+    """
+    lengths = np.asarray(lengths, dtype=float)
+    widths = np.asarray(widths, dtype=float)
+    n = len(lengths)
+    placements = np.zeros(n, dtype=PLACEMENT_DTYPE)
+    placements['part'] = np.arange(n)
+    placements['sheet'] = -1
+    placements['length'] = lengths
+    placements['width'] = widths
+    sheets: List[StockSheet] = []
+
+    # Spacing is added to every part and to the sheet so the last part in
+    # a row or column may touch the sheet edge
+    padded_l = lengths + spacing
+    padded_w = widths + spacing
+    bin_l = sheet_length + spacing
+    bin_w = sheet_width + spacing
+
+    # Largest first: by long side, then area
+    order = np.lexsort((-(lengths * widths), -np.maximum(lengths, widths), group_index))
+    open_sheets: List[Tuple[StockSheet, Skyline]] = []
+    current_group = -1
+    for part in order.tolist():
+        group = int(group_index[part])
+        if group != current_group:
+            open_sheets = []
+            current_group = group
+        w, h = float(padded_l[part]), float(padded_w[part])
+        if not ((w <= bin_l and h <= bin_w) or (rotate and h <= bin_l and w <= bin_w)):
+            continue
+
+        found = None
+        for sheet, skyline in reversed(open_sheets):
+            top, index, y, rotated = skyline.find(w, h, rotate)
+            if index >= 0:
+                found = sheet, skyline, index, y, rotated
+                break
+        if found is None:
+            material, thickness = groups[group]
+            sheet = StockSheet(len(sheets), material, thickness, sheet_length, sheet_width)
+            skyline = Skyline(bin_l, bin_w)
+            sheets.append(sheet)
+            open_sheets.append((sheet, skyline))
+            if len(open_sheets) > OPEN_SHEETS:
+                open_sheets.pop(0)
+            top, index, y, rotated = skyline.find(w, h, rotate)
+            found = sheet, skyline, index, y, rotated
+
+        sheet, skyline, index, y, rotated = found
+        pw, ph = (h, w) if rotated else (w, h)
+        row = placements[part]
+        row['sheet'] = sheet.index
+        row['x'] = skyline.segments[index][0]
+        row['y'] = y
+        row['rotated'] = rotated
+        if rotated:
+            row['length'], row['width'] = widths[part], lengths[part]
+        skyline.place(index, pw, ph, y)
+        sheet.parts.append(part)
+        sheet.used_area += lengths[part] * widths[part]
+
+    return NestingResult(sheets, placements)
+
+
+def nest_panels(panels: Panels, limits: FabricationLimits = FabricationLimits(),
+                spacing: float = 0.25, rotate: bool = True) -> NestingResult:
+    """Nest the flat patterns of a PanelSet (or list of Panel) by material and thickness"""
+    panels = as_panel_set(panels)
+    dims = flat_dimensions(panels.sizes)
+    keys = list(zip(panels.materials, dims[:, 0].tolist()))
+    groups: Dict[Tuple[str, float], int] = {}
+    group_index = np.array([groups.setdefault(key, len(groups)) for key in keys], dtype=np.int64)
+    return nest_arrays(dims[:, 2], dims[:, 1], list(groups), group_index,
+                       limits.max_length, limits.max_width, spacing, rotate)
+
+
+def placed_holes(panels: PanelSet, result: NestingResult,
+                 parts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(M,) sheet x, y of the holes of the given parts, turned with each part"""
+    hole_panels = panels.hole_panels
+    on_sheet = np.isin(hole_panels, parts)
+    flat = flat_hole_positions(panels.sizes[hole_panels[on_sheet]],
+                               np.arange(on_sheet.sum()), panels.hole_offsets[on_sheet])
+    placed = result.placements[hole_panels[on_sheet]]
+    flat_length = np.where(placed['rotated'], placed['width'], placed['length'])
+    hx = np.where(placed['rotated'], placed['x'] + flat[:, 1], placed['x'] + flat[:, 0])
+    hy = np.where(placed['rotated'], placed['y'] + flat_length - flat[:, 0], placed['y'] + flat[:, 1])
+    return hx, hy
+
+
+def draw_sheet(svg: SVGDrawing, panels: PanelSet, result: NestingResult, sheet: StockSheet,
+               x0: float, y0: float, scale: float, labels: bool = True):
+    """Draw one sheet's layout with its corner at (x0, y0)"""
+    svg.rect(x0, y0, sheet.length * scale, sheet.width * scale,
+             fill="none", stroke="black", stroke_width=1)
+
+    parts = np.array(sheet.parts, dtype=np.int64)
+    rows = result.placements[parts]
+    for part, x, y, length, width in zip(parts.tolist(), rows['x'].tolist(), rows['y'].tolist(),
+                                         rows['length'].tolist(), rows['width'].tolist()):
+        svg.rect(x0 + x * scale, y0 + y * scale, length * scale, width * scale,
+                 fill="white", stroke="black", stroke_width=0.5)
+
+    # Holes in each part's flat pattern, turned with the part
+    hx, hy = placed_holes(panels, result, parts)
+    for x, y in zip((x0 + hx * scale).tolist(), (y0 + hy * scale).tolist()):
+        svg.circle(x, y, 0.125 * scale, fill="white", stroke="black", stroke_width=0.5)
+
+    if labels:
+        for part, x, y, length, width in zip(parts.tolist(), rows['x'].tolist(), rows['y'].tolist(),
+                                             rows['length'].tolist(), rows['width'].tolist()):
+            if width * scale >= 10:
+                svg.text(x0 + (x + length / 2) * scale, y0 + (y + width / 2) * scale + 3,
+                         panels.names[part], font_size=7, anchor="middle")
+
+
+def write_sheet_layouts(panels: Panels, result: NestingResult, output_dir: str,
+                        prefix: str = "sheet", scale: float = 20.0,
+                        compact: bool = True) -> List[str]:
+    """Write one SVG layout per stock sheet; returns the file names"""
+    panels = as_panel_set(panels)
+    os.makedirs(output_dir, exist_ok=True)
+    margin = 40
+    names = []
+    for sheet in result.sheets:
+        width = int(sheet.length * scale + 2 * margin)
+        height = int(sheet.width * scale + 2 * margin + 20)
+        svg = SVGDrawing(width, height, compact=compact)
+        svg.text(margin, 24,
+                 f"Sheet {sheet.index + 1}: {sheet.material} {sheet.thickness}\" - "
+                 f"{sheet.length:.0f}\" × {sheet.width:.0f}\" - {len(sheet.parts)} parts, "
+                 f"{sheet.utilization:.1%} utilization", font_size=12)
+        draw_sheet(svg, panels, result, sheet, margin, margin + 20, scale)
+        name = f"{prefix}-{sheet.index + 1:03d}.svg"
+        with open(os.path.join(output_dir, name), 'w') as f:
+            svg.write_to(f)
+        names.append(name)
+    return names
+
+
+def describe_nesting(panels: Panels, result: NestingResult) -> List[str]:
+    """Human-readable report: one line per sheet plus unplaced parts"""
+    panels = as_panel_set(panels)
+    lines = [f"Sheet {s.index + 1}: {s.material} {s.thickness}\" - {len(s.parts)} parts, "
+             f"{s.utilization:.1%} utilization" for s in result.sheets]
+    for part in result.unplaced.tolist():
+        row = result.placements[part]
+        lines.append(f"✗ {panels.names[part]}: {row['length']:.2f}\" × {row['width']:.2f}\" "
+                     f"does not fit a stock sheet")
+    return lines
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['nest'] + sys.argv[1:]))
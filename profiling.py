@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Stage Profiler for Drawing Pipelines
+Records wall time, SVG elements and characters emitted, peak allocation
+and panel counts per named stage, and exports JSON or a Chrome trace
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageRecord:
+    """One completed stage"""
+    name: str
+    depth: int               # Nesting level, 0 for outermost stages
+    start_us: float          # Since the profiler was created
+    duration_ms: float
+    elements: int            # SVG elements emitted during the stage
+    chars: int               # Characters of SVG emitted (bytes for ASCII output)
+    panels: Optional[int]    # Panels the stage drew, if it takes a panel table
+    peak_kib: Optional[float] = None  # Peak traced allocation above the stage start
+
+    @property
+    def elements_per_panel(self) -> Optional[float]:
+        return self.elements / self.panels if self.panels else None
+
+
+class StageProfiler:
+    """Collects StageRecords from nested stage() blocks
+
+    With memory=True, tracemalloc runs while any stage is open; it slows
+    allocation-heavy code severalfold, so keep it off when only timing.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.memory = memory
+        self.records: List[StageRecord] = []
+        self._origin = time.perf_counter()
+        self._peaks: List[int] = []  # Running absolute peak per open stage
+        self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str, drawing: Any = None, panels: Optional[int] = None) -> Iterator[None]:
+        """Time a block; drawing is the SVGDrawing whose output is counted"""
+        depth = len(self._peaks)
+        elements = drawing.emitted if drawing is not None else 0
+        chars = drawing.emitted_chars if drawing is not None else 0
+        base = 0
+        if self.memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            base, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+        self._peaks.append(base)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            peak_kib = None
+            running = self._peaks.pop()
+            if self.memory:
+                peak = max(tracemalloc.get_traced_memory()[1], running)
+                peak_kib = (peak - base) / 1024
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                elif self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+            self.records.append(StageRecord(
+                name, depth, (start - self._origin) * 1e6, (end - start) * 1e3,
+                (drawing.emitted - elements) if drawing is not None else 0,
+                (drawing.emitted_chars - chars) if drawing is not None else 0,
+                panels, peak_kib))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Records in completion order (children before their parent)"""
+        return {'memory': self.memory,
+                'stages': [dict(asdict(r), elements_per_panel=r.elements_per_panel)
+                           for r in self.records]}
+
+    def write_json(self, filename: str):
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Complete ("X") events for chrome://tracing, Perfetto or speedscope"""
+        events = []
+        for r in sorted(self.records, key=lambda r: (r.start_us, r.depth)):
+            args = {'elements': r.elements, 'chars': r.chars}
+            if r.panels is not None:
+                args['panels'] = r.panels
+            if r.peak_kib is not None:
+                args['peak_kib'] = round(r.peak_kib, 1)
+            events.append({'name': r.name, 'ph': 'X', 'pid': 1, 'tid': 1,
+                           'ts': round(r.start_us, 1), 'dur': round(r.duration_ms * 1e3, 1),
+                           'args': args})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_trace(self, filename: str):
+        with open(filename, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self) -> List[str]:
+        """Indented table of stages in start order"""
+        lines = [f"{'stage':<32} {'ms':>9} {'elements':>9} {'chars':>10} {'panels':>7}"
+                 + (f" {'peak KiB':>9}" if self.memory else "")]
+        for r in sorted(self.records, key=lambda r: (r.start_us, r.depth)):
+            line = (f"{'  ' * r.depth + r.name:<32} {r.duration_ms:9.2f} {r.elements:9d} "
+                    f"{r.chars:10d} {'' if r.panels is None else r.panels:>7}")
+            if self.memory:
+                line += f" {r.peak_kib:9.1f}"
+            lines.append(line)
+        return lines
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Render Cache
+Skips regenerating SVG/HTML outputs whose geometry, drawing parameters and
+tool version have not changed since the last run
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+# Bump when output formats change in a way the source digest would not catch
+TOOL_VERSION = "1.0"
+
+# Renderer sources mixed into every key so code edits invalidate the cache
+TOOL_SOURCES = ["svg_bench_drawer.py", "bench_3d_viewer.py", "bench_model.py", "render_cache.py",
+                "contact_graph.py", "interference.py"]
+
+DEFAULT_CACHE_DIR = ".render-cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_tool_digest: Optional[str] = None
+
+
+def tool_version() -> str:
+    """TOOL_VERSION plus a digest of the renderer sources"""
+    global _tool_digest
+    if _tool_digest is None:
+        h = hashlib.sha256()
+        here = os.path.dirname(os.path.abspath(__file__))
+        for name in TOOL_SOURCES:
+            path = os.path.join(here, name)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    h.update(f.read())
+        _tool_digest = h.hexdigest()[:16]
+    return f"{TOOL_VERSION}+{_tool_digest}"
+
+
+def _update_array(h, values: Any):
+    """Hash an array by dtype, shape and little-endian bytes"""
+    array = np.ascontiguousarray(values)
+    if array.dtype.kind == 'f':
+        array = array.astype('<f8')
+    elif array.dtype.kind in 'iu':
+        array = array.astype('<i8')
+    h.update(f"{array.dtype.str}{array.shape}".encode())
+    h.update(array.tobytes())
+
+
+def _update_strings(h, values: List[str]):
+    h.update(json.dumps(list(values)).encode())
+
+
+def panel_set_digest(panels) -> str:
+    """Digest of the canonical geometry of a PanelSet (or list of Panel)"""
+    from svg_bench_drawer import as_panel_set
+
+    panels = as_panel_set(panels)
+    h = hashlib.sha256(b"panels")
+    _update_strings(h, panels.names)
+    _update_strings(h, panels.materials)
+    _update_array(h, panels.positions)
+    _update_array(h, panels.sizes)
+    _update_array(h, panels.hole_offsets)
+    _update_array(h, panels.hole_start)
+    return h.hexdigest()
+
+
+def mesh_digest(meshes: List[Dict]) -> str:
+    """Digest of a list of mesh dicts from create_box_mesh"""
+    h = hashlib.sha256(b"meshes")
+    _update_strings(h, [m['name'] for m in meshes])
+    _update_strings(h, [m['color'] for m in meshes])
+    for mesh in meshes:
+        for key in ('x', 'y', 'z', 'i', 'j', 'k'):
+            _update_array(h, mesh[key])
+    return h.hexdigest()
+
+
+def cache_key(kind: str, geometry: List[str], params: Dict[str, Any]) -> str:
+    """Key for one artifact from geometry digests and render parameters"""
+    payload = {
+        'kind': kind,
+        'tool': tool_version(),
+        'geometry': list(geometry),
+        'params': params,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def drawing_cache_key(concept_name: str, panels, params: Dict[str, Any]) -> str:
+    """Key for an SVG drawing sheet"""
+    return cache_key('svg', [panel_set_digest(panels)],
+                     dict(params, concept_name=concept_name))
+
+
+def viewer_cache_key(concept_name: str, assembled: List[Dict], exploded: List[Dict],
+                     params: Dict[str, Any]) -> str:
+    """Key for an interactive 3D viewer page
+
+    Includes the installed plotly version, whose plotly.js pages may embed.
+    Read from package metadata so a cache hit does not import plotly.
+    """
+    from importlib.metadata import version
+
+    return cache_key('viewer', [mesh_digest(assembled), mesh_digest(exploded)],
+                     dict(params, concept_name=concept_name, plotly=version('plotly')))
+
+
+def _file_digest(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class RenderCache:
+    """On-disk artifact cache keyed by cache_key()
+
+    Artifacts are stored once per content digest under blobs/, and
+    index.json maps each key to its blob along with the output file stat
+    recorded when it was stored. When total blob size exceeds max_bytes the
+    least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.blob_dir = os.path.join(directory, 'blobs')
+        self.index_path = os.path.join(directory, 'index.json')
+        self.entries: Dict[str, Dict[str, Any]] = self._load_index()
+        self.hits = 0
+        self.misses = 0
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.index_path) as f:
+                return json.load(f).get('entries', {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'entries': self.entries}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest)
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Make output_path current from the cache; False on a miss
+
+        Nothing is written when output_path already holds the cached
+        content; otherwise the cached blob is copied into place.
+        """
+        entry = self.entries.get(key)
+        if entry is None or not os.path.exists(self._blob_path(entry['digest'])):
+            return False
+
+        if not self._output_current(entry, output_path):
+            shutil.copyfile(self._blob_path(entry['digest']), output_path)
+            stat = os.stat(output_path)
+            entry['outputs'][os.path.abspath(output_path)] = [stat.st_size, stat.st_mtime_ns]
+
+        entry['last_used'] = time.time()
+        self._save_index()
+        return True
+
+    def _output_current(self, entry: Dict[str, Any], output_path: str) -> bool:
+        try:
+            stat = os.stat(output_path)
+        except OSError:
+            return False
+        recorded = entry['outputs'].get(os.path.abspath(output_path))
+        if recorded == [stat.st_size, stat.st_mtime_ns]:
+            return True
+        return stat.st_size == entry['size'] and _file_digest(output_path) == entry['digest']
+
+    def store(self, key: str, output_path: str):
+        """Record a freshly rendered output_path under key"""
+        digest = _file_digest(output_path)
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(self.blob_dir, exist_ok=True)
+            shutil.copyfile(output_path, blob_path)
+
+        stat = os.stat(output_path)
+        self.entries[key] = {
+            'digest': digest,
+            'size': stat.st_size,
+            'last_used': time.time(),
+            'outputs': {os.path.abspath(output_path): [stat.st_size, stat.st_mtime_ns]},
+        }
+        self.evict()
+        self._save_index()
+
+    def render(self, key: str, output_path: str, render: Callable[[], Any]) -> bool:
+        """Call render() to produce output_path unless the cache has it
+
+        Returns True if render() ran.
+        """
+        if self.fetch(key, output_path):
+            self.hits += 1
+            return False
+        self.misses += 1
+        render()
+        self.store(key, output_path)
+        return True
+
+    def total_bytes(self) -> int:
+        """Size of all blobs referenced by the index"""
+        sizes = {entry['digest']: entry['size'] for entry in self.entries.values()}
+        return sum(sizes.values())
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        refs = Counter(entry['digest'] for entry in self.entries.values())
+        total = self.total_bytes()
+        by_age = sorted(self.entries.items(), key=lambda item: item[1]['last_used'])
+        for key, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            del self.entries[key]
+            refs[entry['digest']] -= 1
+            if refs[entry['digest']] == 0:
+                total -= entry['size']
+                try:
+                    os.remove(self._blob_path(entry['digest']))
+                except OSError:
+                    pass
+
+    def clear(self):
+        """Remove every cached artifact"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.entries = {}
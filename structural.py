@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Seat Deflection and Stress Analysis
+Treats each seat panel as a beam on its supporting panels and evaluates
+mid-span deflection, bending stress and safety factor for every seat and
+load case at once with NumPy broadcasting
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from svg_bench_drawer import CONTACT_TOLERANCE, Panels, PanelSet, as_panel_set
+from fabrication import flat_axes
+from interference import CONTACT, interference_arrays
+
+
+@dataclass
+class MaterialStrength:
+    """Elastic modulus and yield strength"""
+    modulus: float         # psi
+    yield_strength: float  # psi
+
+
+MATERIAL_STRENGTHS = {
+    '304 Stainless Steel': MaterialStrength(28.0e6, 31200.0),  # Annealed
+    '5052 Aluminum': MaterialStrength(10.2e6, 28000.0),        # H32
+    'Cold Rolled Steel': MaterialStrength(29.7e6, 41000.0),    # 1008
+}
+
+
+@dataclass
+class LoadCase:
+    """Live load on a seat: a point load at mid-span plus a load spread along the seat"""
+    name: str
+    point_load: float = 0.0        # lb
+    distributed_load: float = 0.0  # lb in total, uniform over the seat length
+
+
+DEFAULT_LOAD_CASES = [
+    LoadCase("Seated adult", point_load=250.0),
+    LoadCase("Three adults", distributed_load=750.0),
+    LoadCase("Adult standing (2× impact)", point_load=500.0),
+]
+
+SPAN_DTYPE = np.dtype([
+    ('seat', np.int64),            # Panel index of the seat
+    ('assembly', np.int64),
+    ('axis', np.int8),             # Span axis (0 = x, 1 = y)
+    ('length', np.float64),        # Seat length along the span axis
+    ('span', np.float64),          # Between the outermost supports
+    ('overhang_min', np.float64),  # Shorter and longer overhang past the supports
+    ('overhang_max', np.float64),
+    ('width', np.float64),         # Seat width across the span
+    ('thickness', np.float64),
+    ('material', np.uint16),       # Code into the PanelSet's material_names
+])
+
+RESULT_DTYPE = np.dtype([
+    ('deflection', np.float64),     # Mid-span sag (in)
+    ('stress', np.float64),         # Peak bending stress (psi)
+    ('safety_factor', np.float64),  # Yield strength over peak stress
+])
+
+
+def beam_response(span: np.ndarray, overhang_min: np.ndarray, overhang_max: np.ndarray,
+                  width: np.ndarray, thickness: np.ndarray, modulus: np.ndarray,
+                  yield_strength: np.ndarray, point_load: np.ndarray,
+                  distributed_load: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Deflection, stress and safety factor of a rectangular beam on two supports
+
+    Every argument broadcasts, so (seats, 1) geometry against (1, cases)
+    loads gives a (seats, cases) answer. distributed_load is in lb per inch
+    and covers the overhangs as well as the span. Small-deflection theory:
+    results far beyond yield mean "fails", not an accurate sag.
+    """
+    inertia = width * thickness ** 3 / 12
+    section = width * thickness ** 2 / 6
+    stiffness = modulus * inertia
+
+    # Overhang loads relieve mid-span sag; the shorter overhang is the safe bound
+    deflection = (point_load * span ** 3 / (48 * stiffness)
+                  + distributed_load * span ** 2 * (5 * span ** 2 - 24 * overhang_min ** 2) / (384 * stiffness))
+    mid_moment = point_load * span / 4 + distributed_load * (span ** 2 / 8 - overhang_min ** 2 / 2)
+    support_moment = distributed_load * overhang_max ** 2 / 2
+    stress = np.maximum(np.abs(mid_moment), support_moment) / section
+    with np.errstate(divide='ignore'):
+        safety_factor = yield_strength / stress
+    return deflection, stress, safety_factor
+
+
+def seat_spans(panels: Panels, assembly_index: np.ndarray = None,
+               tolerance: float = CONTACT_TOLERANCE) -> np.ndarray:
+    """Find seats and their supports; returns a SPAN_DTYPE record per seat
+
+    A seat is a horizontal panel (thinnest along z) resting on at least two
+    panels whose tops touch its underside. The span runs along its longer
+    side between the outermost support centres. With assembly_index, the
+    panels of stacked assemblies (e.g. sweep variants) are kept apart so
+    one contact pass serves them all.
+    """
+    panels = as_panel_set(panels)
+    positions, sizes = panels.positions, panels.sizes
+    n = len(panels)
+    if assembly_index is None:
+        assembly_index = np.zeros(n, dtype=np.int64)
+    assembly_index = np.asarray(assembly_index, dtype=np.int64)
+    if n < 2:
+        return np.zeros(0, dtype=SPAN_DTYPE)
+
+    # Move assemblies apart along x so their panels can never touch
+    stride = np.ptp(positions[:, 0]) + sizes[:, 0].max() + 1.0
+    shifted = positions.copy()
+    shifted[:, 0] += assembly_index * stride
+    table = interference_arrays(shifted, sizes, max_gap=0.0, tolerance=tolerance)
+    table = table[(table['kind'] == CONTACT) & (table['touching_axes'] == 1) & (table['axis'] == 2)]
+
+    # Orient each contact as (seat above, support below)
+    a, b = table['a'], table['b']
+    a_above = positions[a, 2] > positions[b, 2]
+    seat, support = np.where(a_above, a, b), np.where(a_above, b, a)
+    horizontal = flat_axes(sizes)[0] == 2
+    keep = horizontal[seat]
+    seat, support = seat[keep], support[keep]
+
+    # Span along the seat's longer horizontal side
+    axis = np.where(sizes[:, 0] >= sizes[:, 1], 0, 1)
+    span_axis = axis[seat]
+    lo = np.maximum(positions[seat, span_axis], positions[support, span_axis])
+    hi = np.minimum(positions[seat, span_axis] + sizes[seat, span_axis],
+                    positions[support, span_axis] + sizes[support, span_axis])
+    centre = (lo + hi) / 2
+
+    first = np.full(n, np.inf)
+    last = np.full(n, -np.inf)
+    np.minimum.at(first, seat, centre)
+    np.maximum.at(last, seat, centre)
+    seats = np.flatnonzero(np.bincount(seat, minlength=n) >= 2)
+
+    spans = np.zeros(len(seats), dtype=SPAN_DTYPE)
+    seat_axis = axis[seats]
+    start = positions[seats, seat_axis]
+    length = sizes[seats, seat_axis]
+    left = first[seats] - start
+    right = start + length - last[seats]
+    spans['seat'] = seats
+    spans['assembly'] = assembly_index[seats]
+    spans['axis'] = seat_axis
+    spans['length'] = length
+    spans['span'] = last[seats] - first[seats]
+    spans['overhang_min'] = np.minimum(left, right)
+    spans['overhang_max'] = np.maximum(left, right)
+    spans['width'] = sizes[seats, 1 - seat_axis]
+    spans['thickness'] = sizes[seats, 2]
+    spans['material'] = panels.material_codes[seats]
+    return spans
+
+
+def analyse_spans(spans: np.ndarray, material_names: Sequence[str],
+                  load_cases: Sequence[LoadCase] = DEFAULT_LOAD_CASES) -> np.ndarray:
+    """(seats, load cases) RESULT_DTYPE table for SPAN_DTYPE seats"""
+    missing = [name for name in material_names if name not in MATERIAL_STRENGTHS]
+    if missing:
+        raise ValueError(f"No strength data for material(s) {', '.join(missing)}; "
+                         f"known: {', '.join(sorted(MATERIAL_STRENGTHS))}")
+    modulus = np.array([MATERIAL_STRENGTHS[name].modulus for name in material_names])
+    yield_strength = np.array([MATERIAL_STRENGTHS[name].yield_strength for name in material_names])
+    codes = spans['material'].astype(np.int64)
+
+    column = (slice(None), None)
+    point = np.array([case.point_load for case in load_cases])[None, :]
+    total = np.array([case.distributed_load for case in load_cases])[None, :]
+    deflection, stress, safety = beam_response(
+        spans['span'][column], spans['overhang_min'][column], spans['overhang_max'][column],
+        spans['width'][column], spans['thickness'][column],
+        modulus[codes][column], yield_strength[codes][column],
+        point, total / spans['length'][column])
+
+    results = np.zeros(deflection.shape, dtype=RESULT_DTYPE)
+    results['deflection'] = deflection
+    results['stress'] = stress
+    results['safety_factor'] = safety
+    return results
+
+
+def analyse_panels(panels: Panels, load_cases: Sequence[LoadCase] = DEFAULT_LOAD_CASES
+                   ) -> Tuple[np.ndarray, np.ndarray]:
+    """Seat spans and their (seats, load cases) results for one assembly"""
+    panels = as_panel_set(panels)
+    spans = seat_spans(panels)
+    return spans, analyse_spans(spans, panels.material_names, load_cases)
+
+
+def analyse_variants(variants: List[PanelSet], load_cases: Sequence[LoadCase] = DEFAULT_LOAD_CASES
+                     ) -> Tuple[np.ndarray, np.ndarray]:
+    """Seat spans and results for many assemblies in one pass
+
+    spans['assembly'] gives each seat's variant; a variant's weakest case is
+    the minimum safety factor over its seats.
+    """
+    stacked = PanelSet.concatenate(variants)
+    variant_index = np.repeat(np.arange(len(variants)), [len(v) for v in variants])
+    spans = seat_spans(stacked, variant_index)
+    return spans, analyse_spans(spans, stacked.material_names, load_cases)
+
+
+def describe_results(panels: Panels, spans: np.ndarray, results: np.ndarray,
+                     load_cases: Sequence[LoadCase] = DEFAULT_LOAD_CASES,
+                     min_safety: float = 2.0) -> List[str]:
+    """Human-readable line per seat and load case"""
+    panels = as_panel_set(panels)
+    lines = []
+    for span, row in zip(spans, results):
+        lines.append(f"{panels.names[span['seat']]}: {span['span']:.2f}\" span, "
+                     f"{span['thickness']}\" × {span['width']:.2f}\" section, "
+                     f"{span['overhang_min']:.2f}-{span['overhang_max']:.2f}\" overhangs")
+        for case, result in zip(load_cases, row):
+            mark = '✓' if result['safety_factor'] >= min_safety else '✗'
+            lines.append(f"  {mark} {case.name}: {result['deflection']:.3f}\" sag, "
+                         f"{result['stress']:,.0f} psi, safety factor {result['safety_factor']:.2f}")
+    return lines
+
+
+if __name__ == "__main__":
+    import sys
+    from bench import main
+
+    sys.exit(main(['structure'] + sys.argv[1:]))
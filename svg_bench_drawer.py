@@ -4,10 +4,17 @@ SVG Technical Drawing Generator for Metal Bench Designs
 Creates orthographic, isometric, exploded, and flat pattern views
 """
 
+import functools
+import heapq
+import inspect
 import math
-from typing import List, Tuple, Dict, Any
+import os
+from contextlib import contextmanager, nullcontext
+from typing import List, Tuple, Dict, Any, Iterator, Optional, Sequence, Union
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class Point3D:
@@ -75,31 +82,651 @@ class Panel:
         ]
 
 
-class SVGDrawing:
-    """SVG drawing builder"""
+# Corner ordering shared with Panel.get_corners: bottom face 0-3, top face 4-7.
+# Each row selects which of (width, depth, thickness) is added to the position.
+CORNER_MASK = np.array([
+    [False, False, False],
+    [True, False, False],
+    [True, True, False],
+    [False, True, False],
+    [False, False, True],
+    [True, False, True],
+    [True, True, True],
+    [False, True, True],
+])
+
+FACE_BOTTOM = [0, 1, 2, 3]
+
+# Corner indices of the six box faces: -X, +X, -Y, +Y, -Z, +Z
+BOX_FACES = np.array([
+    [0, 3, 7, 4],
+    [1, 2, 6, 5],
+    [0, 1, 5, 4],
+    [3, 2, 6, 7],
+    [0, 1, 2, 3],
+    [4, 5, 6, 7],
+])
+FACE_AXES = np.array([0, 0, 1, 1, 2, 2])
+FACE_SIGNS = np.array([-1, 1, -1, 1, -1, 1])
+
+# Tolerance (inches) for treating box faces as touching
+CONTACT_TOLERANCE = 1e-6
+
+
+def box_corners(positions: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Get (N, 8, 3) corner array for N boxes given (N, 3) positions and sizes"""
+    positions = np.asarray(positions, dtype=float).reshape(-1, 1, 3)
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 1, 3)
+    # np.where rather than position + mask * size so untouched coordinates
+    # are copied exactly, matching Panel.get_corners
+    return np.where(CORNER_MASK, positions + sizes, positions)
+
+
+def panel_arrays(panels: 'Panels') -> Tuple[np.ndarray, np.ndarray]:
+    """Get (N, 3) position and size arrays for a list of panels"""
+    if isinstance(panels, PanelSet):
+        return panels.positions.copy(), panels.sizes.copy()
+    positions = np.array([[p.position.x, p.position.y, p.position.z]
+                          for p in panels], dtype=float).reshape(-1, 3)
+    sizes = np.array([[p.width, p.depth, p.thickness]
+                      for p in panels], dtype=float).reshape(-1, 3)
+    return positions, sizes
+
+
+def panel_corners(panels: 'Panels') -> np.ndarray:
+    """Get (N, 8, 3) corner array for a whole list of panels"""
+    if isinstance(panels, PanelSet):
+        return panels.corners
+    return box_corners(*panel_arrays(panels))
+
+
+class PanelSet:
+    """Struct-of-arrays panel table
+
+    Stores positions and sizes as (N, 3) float arrays, materials as integer
+    codes into a small category list, and all holes as one flattened (M, 3)
+    table indexed by hole_start (hole_start[i]:hole_start[i+1] are the holes
+    of panel i). Corners are computed on first use and cached.
+    """
+
+    def __init__(self, names: List[str], positions: np.ndarray, sizes: np.ndarray,
+                 material_codes: np.ndarray, material_names: List[str],
+                 hole_offsets: np.ndarray = None, hole_start: np.ndarray = None):
+        self.names = list(names)
+        self.positions = np.ascontiguousarray(positions, dtype=float).reshape(-1, 3)
+        self.sizes = np.ascontiguousarray(sizes, dtype=float).reshape(-1, 3)
+        self.material_codes = np.asarray(material_codes, dtype=np.uint16)
+        self.material_names = list(material_names)
+        if hole_offsets is None:
+            hole_offsets = np.empty((0, 3))
+            hole_start = np.zeros(len(self.names) + 1, dtype=np.int64)
+        self.hole_offsets = np.ascontiguousarray(hole_offsets, dtype=float).reshape(-1, 3)
+        self.hole_start = np.asarray(hole_start, dtype=np.int64)
+        self._corners = None
+
+    @classmethod
+    def from_panels(cls, panels: List[Panel]) -> 'PanelSet':
+        """Build a PanelSet from Panel objects"""
+        positions, sizes = panel_arrays(panels)
+        material_names: List[str] = []
+        material_lookup: Dict[str, int] = {}
+        codes = []
+        for panel in panels:
+            if panel.material not in material_lookup:
+                material_lookup[panel.material] = len(material_names)
+                material_names.append(panel.material)
+            codes.append(material_lookup[panel.material])
+
+        hole_counts = [len(panel.holes) for panel in panels]
+        hole_start = np.zeros(len(panels) + 1, dtype=np.int64)
+        np.cumsum(hole_counts, out=hole_start[1:])
+        hole_offsets = np.array([[h.x, h.y, h.z] for panel in panels for h in panel.holes],
+                                dtype=float).reshape(-1, 3)
+
+        return cls([panel.name for panel in panels], positions, sizes,
+                   codes, material_names, hole_offsets, hole_start)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> Panel:
+        """Materialize a single Panel (for code that still wants objects)"""
+        x, y, z = self.positions[index].tolist()
+        w, d, t = self.sizes[index].tolist()
+        return Panel(
+            self.names[index], w, d, t, Point3D(x, y, z),
+            [Point3D(*h) for h in self.holes(index).tolist()],
+            self.materials[index]
+        )
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def widths(self) -> np.ndarray:
+        return self.sizes[:, 0]
+
+    @property
+    def depths(self) -> np.ndarray:
+        return self.sizes[:, 1]
+
+    @property
+    def thicknesses(self) -> np.ndarray:
+        return self.sizes[:, 2]
+
+    @property
+    def materials(self) -> List[str]:
+        """Material name per panel"""
+        return [self.material_names[code] for code in self.material_codes.tolist()]
+
+    @property
+    def corners(self) -> np.ndarray:
+        """(N, 8, 3) corner array, computed once"""
+        if self._corners is None:
+            self._corners = box_corners(self.positions, self.sizes)
+        return self._corners
+
+    @property
+    def hole_counts(self) -> np.ndarray:
+        return np.diff(self.hole_start)
+
+    @property
+    def hole_panels(self) -> np.ndarray:
+        """Owning panel index for every row of the hole table"""
+        return np.repeat(np.arange(len(self)), self.hole_counts)
+
+    def holes(self, index: int) -> np.ndarray:
+        """(k, 3) hole offsets of one panel, relative to its position"""
+        return self.hole_offsets[self.hole_start[index]:self.hole_start[index + 1]]
+
+    def world_holes(self) -> np.ndarray:
+        """(M, 3) hole positions in world coordinates"""
+        return self.positions[self.hole_panels] + self.hole_offsets
+
+    def translated(self, offsets: np.ndarray) -> 'PanelSet':
+        """Copy with every panel moved by (N, 3) or (3,) offsets"""
+        return PanelSet(self.names, self.positions + offsets, self.sizes,
+                        self.material_codes, self.material_names,
+                        self.hole_offsets, self.hole_start)
+
+    def to_panels(self) -> List[Panel]:
+        return list(self)
+
+    @classmethod
+    def concatenate(cls, panel_sets: List['PanelSet']) -> 'PanelSet':
+        """Stack several PanelSets (e.g. sweep variants) into one table"""
+        material_names: List[str] = []
+        material_lookup: Dict[str, int] = {}
+        names: List[str] = []
+        codes = []
+        for panel_set in panel_sets:
+            remap = []
+            for material in panel_set.material_names:
+                if material not in material_lookup:
+                    material_lookup[material] = len(material_names)
+                    material_names.append(material)
+                remap.append(material_lookup[material])
+            codes.append(np.asarray(remap, dtype=np.uint16)[panel_set.material_codes])
+            names.extend(panel_set.names)
+
+        hole_counts = np.concatenate([ps.hole_counts for ps in panel_sets]) if panel_sets else []
+        hole_start = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(hole_counts, out=hole_start[1:])
+
+        def stack(arrays: List[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+            return np.concatenate(arrays) if arrays else np.empty(shape)
+
+        return cls(
+            names,
+            stack([ps.positions for ps in panel_sets], (0, 3)),
+            stack([ps.sizes for ps in panel_sets], (0, 3)),
+            stack(codes, (0,)),
+            material_names,
+            stack([ps.hole_offsets for ps in panel_sets], (0, 3)),
+            hole_start,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in the array columns"""
+        return (self.positions.nbytes + self.sizes.nbytes + self.material_codes.nbytes
+                + self.hole_offsets.nbytes + self.hole_start.nbytes)
+
+
+Panels = Union[List[Panel], PanelSet]
+
+
+def as_panel_set(panels: Panels) -> PanelSet:
+    """Return panels as a PanelSet, converting a list of Panel if needed"""
+    if isinstance(panels, PanelSet):
+        return panels
+    return PanelSet.from_panels(panels)
+
+
+class IsometricProjector:
+    """Batch isometric projection using precomputed rotation matrices"""
+
+    def __init__(self, angle_y: float = math.radians(45),
+                 angle_x: float = math.radians(35.264)):
+        cos_y, sin_y = math.cos(angle_y), math.sin(angle_y)
+        cos_x, sin_x = math.cos(angle_x), math.sin(angle_x)
+        self.rotation_y = np.array([
+            [cos_y, 0.0, sin_y],
+            [0.0, 1.0, 0.0],
+            [-sin_y, 0.0, cos_y],
+        ])
+        self.rotation_x = np.array([
+            [1.0, 0.0, 0.0],
+            [0.0, cos_x, -sin_x],
+            [0.0, sin_x, cos_x],
+        ])
+        self.matrix = self.rotation_x @ self.rotation_y
+
+    def rotate(self, points: np.ndarray) -> np.ndarray:
+        """Rotate (..., 3) points into view space"""
+        points = np.asarray(points, dtype=float)
+        x, y, z = points[..., 0], points[..., 1], points[..., 2]
+        ry, rx = self.rotation_y, self.rotation_x
+        # Evaluated per stage in the same order as Point3D.rotate_y/rotate_x
+        # (not as one matmul) so the result matches to_isometric bit for bit
+        x1 = x * ry[0, 0] + z * ry[0, 2]
+        z1 = x * ry[2, 0] + z * ry[2, 2]
+        y2 = y * rx[1, 1] + z1 * rx[1, 2]
+        z2 = y * rx[2, 1] + z1 * rx[2, 2]
+        return np.stack([x1, y2, z2], axis=-1)
+
+    def project(self, points: np.ndarray, scale: float = 1.0) -> np.ndarray:
+        """Project (..., 3) points to (..., 2) SVG coordinates"""
+        rotated = self.rotate(points)
+        # Flip Y for SVG coordinates
+        return np.stack([rotated[..., 0] * scale, -rotated[..., 1] * scale], axis=-1)
+
+    @property
+    def view_direction(self) -> np.ndarray:
+        """Unit vector in world space pointing from the scene towards the viewer"""
+        return self.matrix[2]
+
+
+ISOMETRIC = IsometricProjector()
+
+
+def visible_faces(view_direction: np.ndarray) -> np.ndarray:
+    """Indices into BOX_FACES of the faces whose outward normal faces the viewer
+
+    Boxes are axis-aligned and the projection is orthographic, so the same
+    faces are front-facing for every box and back faces are culled in bulk.
+    """
+    facing = FACE_SIGNS * np.asarray(view_direction)[FACE_AXES]
+    return np.flatnonzero(facing > 0)
+
+
+def overlapping_pairs(lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index pairs (a, b) of 2D or 3D boxes whose [lo, hi] bounds overlap
+
+    Sort-and-sweep on the first axis: after sorting by lower bound, each
+    box only needs pairing with the run of following boxes that start
+    before it ends; those candidates are then filtered on the other axes.
+    """
+    order = np.argsort(lo[:, 0], kind='stable')
+    lo_x = lo[order, 0]
+    end = np.searchsorted(lo_x, hi[order, 0], side='right')
+    first = np.arange(1, len(order) + 1)
+    counts = np.maximum(end - first, 0)
+    a = np.repeat(np.arange(len(order)), counts)
+    b = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(first, counts)
+    a, b = order[a], order[b]
+    keep = ((lo[a, 1:] <= hi[b, 1:]) & (lo[b, 1:] <= hi[a, 1:])).all(axis=1)
+    return a[keep], b[keep]
+
+
+def _screen_bounds(positions: np.ndarray, sizes: np.ndarray,
+                   projector: IsometricProjector) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, 2) lower and upper screen bounds of each box's projection"""
+    projected = projector.project(box_corners(positions, sizes))
+    return projected.min(axis=1), projected.max(axis=1)
+
+
+def depth_order(positions: np.ndarray, sizes: np.ndarray,
+                projector: IsometricProjector = ISOMETRIC) -> np.ndarray:
+    """Painter's algorithm order (farthest first) for N axis-aligned boxes
+
+    Only boxes whose screen bounds overlap are compared. Two disjoint boxes
+    are separated along some world axis, and which side of that axis faces
+    the viewer decides which box is drawn first; the resulting constraints
+    are topologically sorted, preferring the farther centre among ready
+    boxes. Intersecting boxes get no constraint, and cyclic overlaps are
+    broken at the farthest remaining box.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 3)
+    n = len(positions)
+    view = projector.view_direction
+    depth = projector.rotate(positions + sizes / 2)[:, 2]
+    if n < 2:
+        return np.arange(n)
+
+    a, b = overlapping_pairs(*_screen_bounds(positions, sizes, projector))
+    lo, hi = positions, positions + sizes
+    below = hi[a] <= lo[b] + CONTACT_TOLERANCE  # a on the low side of b, per axis
+    above = hi[b] <= lo[a] + CONTACT_TOLERANCE
+    towards = view > 0
+    # a is behind b if b sits on the viewer's side of a separating axis
+    a_behind = ((below & towards) | (above & ~towards)) & (view != 0)
+    b_behind = ((above & towards) | (below & ~towards)) & (view != 0)
+    a_first = a_behind.any(axis=1) & ~b_behind.any(axis=1)
+    b_first = b_behind.any(axis=1) & ~a_behind.any(axis=1)
+    before = np.concatenate([a[a_first], b[b_first]])
+    after = np.concatenate([b[a_first], a[b_first]])
+
+    successors: List[List[int]] = [[] for _ in range(n)]
+    for u, v in zip(before.tolist(), after.tolist()):
+        successors[u].append(v)
+    indegree = np.bincount(after, minlength=n).tolist()
+
+    by_depth = np.argsort(depth, kind='stable').tolist()
+    keys = depth.tolist()
+    ready = [(keys[i], i) for i in range(n) if indegree[i] == 0]
+    heapq.heapify(ready)
+    placed = [False] * n
+    order = []
+    cursor = 0
+    while len(order) < n:
+        if not ready:
+            # Cycle: release the farthest box not yet drawn
+            while placed[by_depth[cursor]]:
+                cursor += 1
+            ready.append((keys[by_depth[cursor]], by_depth[cursor]))
+        _, i = heapq.heappop(ready)
+        if placed[i]:
+            continue
+        placed[i] = True
+        order.append(i)
+        for j in successors[i]:
+            indegree[j] -= 1
+            if indegree[j] == 0 and not placed[j]:
+                heapq.heappush(ready, (keys[j], j))
+    return np.array(order, dtype=np.int64)
+
+
+def covered_faces(positions: np.ndarray, sizes: np.ndarray, faces: np.ndarray,
+                  projector: IsometricProjector = ISOMETRIC) -> np.ndarray:
+    """(N, len(faces)) mask of faces pressed flat against a neighbouring box
+
+    A face is covered when another box touches it and spans the whole face,
+    e.g. the top of a leg under the seat; such faces can never be seen.
+    """
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    sizes = np.asarray(sizes, dtype=float).reshape(-1, 3)
+    covered = np.zeros((len(positions), len(faces)), dtype=bool)
+    if len(positions) < 2:
+        return covered
+
+    a, b = overlapping_pairs(*_screen_bounds(positions, sizes, projector))
+    lo, hi = positions, positions + sizes
+    for column, face in enumerate(faces):
+        axis, sign = FACE_AXES[face], FACE_SIGNS[face]
+        others = [k for k in range(3) if k != axis]
+        for box, other in ((a, b), (b, a)):
+            if sign > 0:
+                touching = np.abs(hi[box, axis] - lo[other, axis]) <= CONTACT_TOLERANCE
+            else:
+                touching = np.abs(lo[box, axis] - hi[other, axis]) <= CONTACT_TOLERANCE
+            spans = ((lo[other][:, others] <= lo[box][:, others] + CONTACT_TOLERANCE) &
+                     (hi[other][:, others] >= hi[box][:, others] - CONTACT_TOLERANCE)).all(axis=1)
+            covered[box[touching & spans], column] = True
+    return covered
+
+
+def _format_number(value: float, precision: int) -> str:
+    """Shortest decimal text for value rounded to precision places"""
+    text = f"{value:.{precision}f}"
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+# Bounding box as (min_x, min_y, max_x, max_y)
+BBox = Tuple[float, float, float, float]
+
+# Open style layers kept before the oldest is written out
+_MAX_OPEN_LAYERS = 32
+# Primitives merged into a single path at most
+_MAX_LAYER_PARTS = 4096
+
+
+class _Layer:
+    """One output element in compact mode: a merged path or a fixed element
+
+    A path layer collects subpaths of one style. Filled primitives are only
+    merged when their bounds do not overlap an existing member, because a
+    merged path paints every fill before any stroke.
+    """
+
+    def __init__(self, style: Tuple = None, attrs: str = '', element: str = None):
+        self.style = style
+        self.attrs = attrs
+        self.element = element
+        self.parts: List[str] = []
+        self.boxes = np.empty((16, 4))
+        self.box_count = 0
+        self.bounds = [math.inf, math.inf, -math.inf, -math.inf]
+
+    def intersects(self, bbox: BBox) -> bool:
+        x0, y0, x1, y1 = self.bounds
+        return bbox[0] < x1 and x0 < bbox[2] and bbox[1] < y1 and y0 < bbox[3]
+
+    def accepts(self, bbox: BBox, filled: bool) -> bool:
+        if len(self.parts) >= _MAX_LAYER_PARTS:
+            return False
+        if not filled or not self.intersects(bbox):
+            return True
+        b = self.boxes[:self.box_count]
+        return not np.any((bbox[0] < b[:, 2]) & (b[:, 0] < bbox[2]) &
+                          (bbox[1] < b[:, 3]) & (b[:, 1] < bbox[3]))
+
+    def add(self, d: str, bbox: BBox):
+        self.parts.append(d)
+        if self.box_count == len(self.boxes):
+            self.boxes = np.concatenate([self.boxes, np.empty_like(self.boxes)])
+        self.boxes[self.box_count] = bbox
+        self.box_count += 1
+        self.extend(bbox)
+
+    def extend(self, bbox: BBox):
+        b = self.bounds
+        self.bounds = [min(b[0], bbox[0]), min(b[1], bbox[1]), max(b[2], bbox[2]), max(b[3], bbox[3])]
+
+    def render(self) -> str:
+        if self.element is not None:
+            return self.element
+        return f'<path d="{"".join(self.parts)}" {self.attrs}/>'
 
-    def __init__(self, width: int = 1200, height: int = 1600):
+
+class SVGDrawing:
+    """SVG drawing builder
+
+    By default elements are buffered and rendered with to_svg(). Pass a
+    sink (an open text file, a generator primed to receive chunks via
+    send(), or any callable taking a string) to stream instead: the header
+    and <defs> are written before the first element, each element is
+    written as soon as it is added, and close() ends the document.
+
+    With compact=True coordinates are rounded to precision decimal places,
+    lines, rectangles and polygons of the same style are merged into one
+    <path> per layer (starting a new layer wherever merging would change
+    what is painted over what), and circles and symbol() groups are
+    defined once and placed with <use>.
+    """
+
+    def __init__(self, width: int = 1200, height: int = 1600, sink: Any = None,
+                 compact: bool = False, precision: int = 2):
         self.width = width
         self.height = height
         self.elements: List[str] = []
         self.defs: List[str] = []
+        self.sink = sink
+        self.compact = compact
+        self.precision = precision
+        self._write = _sink_writer(sink) if sink is not None else None
+        self._started = False
+        self._closed = False
+        self._layers: List[_Layer] = []
+        self._symbols: Dict[Any, str] = {}
+        self._symbol_bounds: Dict[str, BBox] = {}
+        self._owner = self
+        self._extent = _Layer()
+        # Running output totals, read by profiling.StageProfiler
+        self.emitted = 0
+        self.emitted_chars = 0
+
+    @property
+    def streaming(self) -> bool:
+        return self._write is not None
 
     def add_def(self, def_element: str):
         """Add SVG definition (marker, pattern, etc)"""
+        if self._started:
+            raise RuntimeError("SVG defs must be added before the first element when streaming")
         self.defs.append(def_element)
 
-    def add_element(self, element: str):
-        """Add SVG element"""
-        self.elements.append(element)
+    def add_element(self, element: str, bbox: BBox = None):
+        """Add SVG element
+
+        In compact mode bbox is the area the element paints; elements
+        without one are treated as covering the whole drawing.
+        """
+        if not self.compact:
+            self._emit(element)
+        elif bbox is None:
+            self.flush()
+            self._extent.extend((-math.inf, -math.inf, math.inf, math.inf))
+            self._emit(element)
+        else:
+            self._push_layer(_Layer(element=element)).extend(bbox)
+            self._extent.extend(bbox)
+
+    def _emit(self, element: str):
+        """Write or buffer one finished element"""
+        self.emitted += 1
+        self.emitted_chars += len(element)
+        if self._write is None:
+            self.elements.append(element)
+        elif self._started:
+            self._write('\n' + element)
+        else:
+            self._write(self._header())
+            self._write(element)
+            self._started = True
+
+    def _push_layer(self, layer: _Layer) -> _Layer:
+        self._layers.append(layer)
+        if len(self._layers) > _MAX_OPEN_LAYERS:
+            self._emit(self._layers.pop(0).render())
+        return layer
+
+    def _add_path(self, d: str, bbox: BBox, fill: str, stroke: str,
+                  stroke_width: float, opacity: float = 1.0, stroke_dasharray: str = None):
+        """Merge a subpath into the latest layer of its style it can join"""
+        style = (fill, stroke, stroke_width, opacity, stroke_dasharray)
+        half = stroke_width / 2
+        bbox = (bbox[0] - half, bbox[1] - half, bbox[2] + half, bbox[3] + half)
+        target = None
+        for layer in reversed(self._layers):
+            if layer.style == style:
+                target = layer
+                break
+            if layer.intersects(bbox):
+                break
+        if target is None or not target.accepts(bbox, fill != 'none'):
+            attrs = f'fill="{fill}" stroke="{stroke}" stroke-width="{stroke_width}"'
+            if opacity != 1:
+                attrs += f' opacity="{opacity}"'
+            if stroke_dasharray:
+                attrs += f' stroke-dasharray="{stroke_dasharray}"'
+            target = self._push_layer(_Layer(style, attrs))
+        target.add(d, bbox)
+        self._extent.extend(bbox)
+
+    def _num(self, value: float) -> str:
+        return _format_number(value, self.precision)
+
+    def _path_data(self, points: List[Tuple[float, float]], closed: bool) -> str:
+        """Subpath through points using relative moves between rounded coordinates"""
+        scale = 10 ** self.precision
+        xs = [round(x * scale) for x, _ in points]
+        ys = [round(y * scale) for _, y in points]
+        d = [f"M{self._num(xs[0] / scale)},{self._num(ys[0] / scale)}"]
+        if len(points) > 1:
+            d.append("l" + " ".join(
+                f"{self._num((xs[i] - xs[i - 1]) / scale)},{self._num((ys[i] - ys[i - 1]) / scale)}"
+                for i in range(1, len(points))))
+        if closed:
+            d.append("z")
+        return "".join(d)
+
+    def flush(self):
+        """Write out every open compact-mode layer"""
+        for layer in self._layers:
+            self._emit(layer.render())
+        self._layers = []
+
+    @contextmanager
+    def symbol(self, symbol_id: str) -> Iterator['SVGDrawing']:
+        """Collect drawing calls into a <symbol> placed later with use()
+
+        Draw into the yielded drawing relative to the symbol origin.
+        """
+        child = SVGDrawing(self.width, self.height, compact=True, precision=self.precision)
+        child._symbols = self._symbols
+        child._symbol_bounds = self._symbol_bounds
+        child._owner = self._owner
+        yield child
+        child.flush()
+        self._symbol_bounds[symbol_id] = tuple(child._extent.bounds)
+        self._define(f'<symbol id="{symbol_id}" overflow="visible">\n'
+                     + '\n'.join(child.elements) + '\n</symbol>')
+
+    def _define(self, element: str):
+        """Write a non-rendering definition ahead of any open layers
+
+        <use> may reference a symbol defined later in the document, so the
+        definition's position does not matter.
+        """
+        self._owner._emit(element)
+
+    def has_symbol(self, symbol_id: str) -> bool:
+        return symbol_id in self._symbol_bounds
+
+    def use(self, symbol_id: str, x: float, y: float):
+        """Place an instance of a symbol with its origin at (x, y)"""
+        x0, y0, x1, y1 = self._symbol_bounds[symbol_id]
+        self.add_element(f'<use href="#{symbol_id}" x="{self._num(x)}" y="{self._num(y)}"/>',
+                         bbox=(x + x0, y + y0, x + x1, y + y1))
 
     def line(self, x1: float, y1: float, x2: float, y2: float,
              stroke: str = "black", stroke_width: float = 1,
              stroke_dasharray: str = None, opacity: float = 1.0,
              marker_start: str = None, marker_end: str = None):
         """Draw line"""
+        bbox = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        if self.compact and not (marker_start or marker_end):
+            self._add_path(self._path_data([(x1, y1), (x2, y2)], closed=False), bbox,
+                           "none", stroke, stroke_width, opacity, stroke_dasharray)
+            return
         dash = f'stroke-dasharray="{stroke_dasharray}"' if stroke_dasharray else ''
         marker_s = f'marker-start="{marker_start}"' if marker_start else ''
         marker_e = f'marker-end="{marker_end}"' if marker_end else ''
+        if self.compact:
+            # Markers sit on a path's first and last vertex, so these stay separate
+            attrs = ' '.join(a for a in (dash, marker_s, marker_e) if a)
+            pad = 5 + stroke_width
+            self.add_element(
+                f'<line x1="{self._num(x1)}" y1="{self._num(y1)}" '
+                f'x2="{self._num(x2)}" y2="{self._num(y2)}" stroke="{stroke}" '
+                f'stroke-width="{stroke_width}" {attrs}/>',
+                bbox=(bbox[0] - pad, bbox[1] - pad, bbox[2] + pad, bbox[3] + pad))
+            return
         self.add_element(
             f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
             f'stroke="{stroke}" stroke-width="{stroke_width}" '
@@ -110,6 +737,11 @@ class SVGDrawing:
              fill: str = "none", stroke: str = "black",
              stroke_width: float = 1, opacity: float = 1.0):
         """Draw rectangle"""
+        if self.compact:
+            d = (f"M{self._num(x)},{self._num(y)}h{self._num(width)}"
+                 f"v{self._num(height)}h{self._num(-width)}z")
+            self._add_path(d, (x, y, x + width, y + height), fill, stroke, stroke_width, opacity)
+            return
         self.add_element(
             f'<rect x="{x}" y="{y}" width="{width}" height="{height}" '
             f'fill="{fill}" stroke="{stroke}" stroke-width="{stroke_width}" '
@@ -120,6 +752,17 @@ class SVGDrawing:
                fill: str = "none", stroke: str = "black",
                stroke_width: float = 1):
         """Draw circle"""
+        if self.compact:
+            key = ('circle', r, fill, stroke, stroke_width)
+            symbol_id = self._symbols.get(key)
+            if symbol_id is None:
+                symbol_id = self._symbols[key] = f"c{len(self._symbols)}"
+                half = r + stroke_width / 2
+                self._symbol_bounds[symbol_id] = (-half, -half, half, half)
+                self._define(f'<symbol id="{symbol_id}" overflow="visible"><circle r="{r}" '
+                             f'fill="{fill}" stroke="{stroke}" stroke-width="{stroke_width}"/></symbol>')
+            self.use(symbol_id, cx, cy)
+            return
         self.add_element(
             f'<circle cx="{cx}" cy="{cy}" r="{r}" '
             f'fill="{fill}" stroke="{stroke}" stroke-width="{stroke_width}"/>'
@@ -129,16 +772,54 @@ class SVGDrawing:
                 fill: str = "none", stroke: str = "black",
                 stroke_width: float = 1, opacity: float = 1.0):
         """Draw polygon"""
+        if self.compact:
+            xs = [x for x, _ in points]
+            ys = [y for _, y in points]
+            self._add_path(self._path_data(points, closed=True),
+                           (min(xs), min(ys), max(xs), max(ys)),
+                           fill, stroke, stroke_width, opacity)
+            return
         pts = " ".join(f"{x},{y}" for x, y in points)
         self.add_element(
             f'<polygon points="{pts}" fill="{fill}" stroke="{stroke}" '
             f'stroke-width="{stroke_width}" opacity="{opacity}"/>'
         )
 
+    def polygons(self, polygons: List[List[Tuple[float, float]]],
+                 fill: str = "none", stroke: str = "black",
+                 stroke_width: float = 1, opacity: float = 1.0):
+        """Draw polygons whose interiors do not overlap (e.g. faces of one box)
+
+        In compact mode they are merged as a unit, so filled polygons that
+        only share edges still end up in the same path.
+        """
+        if not self.compact:
+            for points in polygons:
+                self.polygon(points, fill, stroke, stroke_width, opacity)
+            return
+        xs = [x for points in polygons for x, _ in points]
+        ys = [y for points in polygons for _, y in points]
+        if xs:
+            d = "".join(self._path_data(points, closed=True) for points in polygons)
+            self._add_path(d, (min(xs), min(ys), max(xs), max(ys)),
+                           fill, stroke, stroke_width, opacity)
+
     def text(self, x: float, y: float, text: str,
              font_size: int = 12, anchor: str = "start",
              font_weight: str = "normal", fill: str = "black"):
         """Draw text"""
+        if self.compact:
+            # font-family is set once on the root; SVG defaults are omitted
+            attrs = f'font-size="{font_size}"'
+            if anchor != "start":
+                attrs += f' text-anchor="{anchor}"'
+            if font_weight != "normal":
+                attrs += f' font-weight="{font_weight}"'
+            if fill != "black":
+                attrs += f' fill="{fill}"'
+            self.add_element(f'<text x="{self._num(x)}" y="{self._num(y)}" {attrs}>{text}</text>',
+                             bbox=_text_bounds(x, y, text, font_size, anchor))
+            return
         self.add_element(
             f'<text x="{x}" y="{y}" font-family="Arial, sans-serif" '
             f'font-size="{font_size}" text-anchor="{anchor}" '
@@ -189,6 +870,15 @@ class SVGDrawing:
         if angle > 90 or angle < -90:
             angle += 180
 
+        if self.compact:
+            # Any rotation stays inside the circle around the midpoint
+            reach = _text_width(label, 8) / 2 + 8
+            self.add_element(
+                f'<text x="{self._num(mid_x)}" y="{self._num(mid_y - 3)}" '
+                f'font-size="8" text-anchor="middle" transform="rotate({self._num(angle)} {self._num(mid_x)} '
+                f'{self._num(mid_y)})">{label}</text>',
+                bbox=(mid_x - reach, mid_y - reach, mid_x + reach, mid_y + reach))
+            return
         self.add_element(
             f'<text x="{mid_x}" y="{mid_y - 3}" '
             f'font-family="Arial, sans-serif" font-size="8" text-anchor="middle" '
@@ -210,28 +900,126 @@ class SVGDrawing:
             </marker>
         ''')
 
-    def to_svg(self) -> str:
-        """Generate complete SVG"""
+    def _header(self) -> str:
+        """Document text preceding the first element"""
         defs_section = f'<defs>\n{" ".join(self.defs)}\n</defs>' if self.defs else ''
-        elements_section = '\n'.join(self.elements)
-
+        font = '\n     font-family="Arial, sans-serif"' if self.compact else ''
         return f'''<?xml version="1.0" encoding="UTF-8"?>
 <svg width="{self.width}" height="{self.height}"
      xmlns="http://www.w3.org/2000/svg"
-     viewBox="0 0 {self.width} {self.height}">
+     viewBox="0 0 {self.width} {self.height}"{font}>
     {defs_section}
-    {elements_section}
-</svg>'''
+    '''
+
+    def _footer(self) -> str:
+        """Document text following the last element"""
+        return '\n</svg>'
+
+    def to_svg(self) -> str:
+        """Generate complete SVG"""
+        if self.streaming:
+            raise RuntimeError("to_svg() is not available for a streaming SVGDrawing")
+        self.flush()
+        return self._header() + '\n'.join(self.elements) + self._footer()
+
+    def write_to(self, f):
+        """Write the buffered SVG to a text file chunk by chunk"""
+        if self.streaming:
+            raise RuntimeError("write_to() is not available for a streaming SVGDrawing")
+        self.flush()
+        f.write(self._header())
+        for i, element in enumerate(self.elements):
+            if i:
+                f.write('\n')
+            f.write(element)
+        f.write(self._footer())
+
+    def close(self):
+        """Finish a streamed document (no-op when buffering)"""
+        if self._write is None or self._closed:
+            return
+        self.flush()
+        if not self._started:
+            self._write(self._header())
+            self._started = True
+        self._write(self._footer())
+        self._closed = True
+
+
+def _text_width(text: str, font_size: float) -> float:
+    """Generous estimate of rendered text width"""
+    return 0.7 * font_size * len(text)
+
+
+def _text_bounds(x: float, y: float, text: str, font_size: float, anchor: str) -> BBox:
+    """Estimated area painted by a text element anchored at (x, y)"""
+    width = _text_width(text, font_size)
+    left = {'start': x, 'middle': x - width / 2, 'end': x - width}.get(anchor, x - width)
+    return (left - 1, y - font_size, left + width + 1, y + font_size / 2)
+
+
+def _iter_rows(*columns: np.ndarray, block_size: int = 4096):
+    """Yield (index, *rows) over parallel arrays as Python floats
+
+    Arrays are converted to lists one block at a time so the Python
+    float objects alive at once stay bounded regardless of panel count.
+    """
+    n = len(columns[0])
+    for start in range(0, n, block_size):
+        blocks = [c[start:start + block_size].tolist() for c in columns]
+        for offset, rows in enumerate(zip(*blocks)):
+            yield (start + offset, *rows)
+
+
+def _sink_writer(sink: Any):
+    """Get a write(str) callable for a file handle, generator or callable sink"""
+    if hasattr(sink, 'write'):
+        return sink.write
+    if hasattr(sink, 'send'):
+        if inspect.getgeneratorstate(sink) == inspect.GEN_CREATED:
+            next(sink)
+        return sink.send
+    if callable(sink):
+        return sink
+    raise TypeError(f"Unsupported SVG sink: {sink!r}")
+
+
+def _stage(name: str):
+    """Run a BenchDrawing method as a profiler stage when profiling is on"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.profiler is None:
+                return method(self, *args, **kwargs)
+            panels = kwargs.get('panels', args[0] if args else None)
+            count = len(panels) if isinstance(panels, (list, PanelSet)) else None
+            with self.profiler.stage(name, self.svg, count):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
 
 
 class BenchDrawing:
-    """Generate technical drawings for bench designs"""
+    """Generate technical drawings for bench designs
+
+    Pass a profiling.StageProfiler as profiler to record each drawing
+    stage; without one the stage hooks cost a single attribute check.
+    """
 
-    def __init__(self, concept_name: str):
+    def __init__(self, concept_name: str, sink: Any = None,
+                 compact: bool = False, precision: int = 2, profiler: Any = None):
         self.concept_name = concept_name
-        self.svg = SVGDrawing(1200, 1600)
+        self.profiler = profiler
+        self.svg = SVGDrawing(1200, 1600, sink=sink, compact=compact, precision=precision)
         self.svg.add_arrow_markers()
 
+    def stage(self, name: str, panels: int = None):
+        """Context manager timing a block as a profiler stage (no-op when not profiling)"""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.stage(name, self.svg, panels)
+
+    @_stage('title_block')
     def draw_title_block(self, y_offset: int = 50):
         """Draw title block"""
         self.svg.text(50, y_offset, self.concept_name,
@@ -243,9 +1031,11 @@ class BenchDrawing:
                      stroke="black", stroke_width=0.5)
         return y_offset + 50
 
-    def draw_orthographic_views(self, panels: List[Panel],
+    @_stage('orthographic')
+    def draw_orthographic_views(self, panels: Panels,
                                 y_offset: int, scale: float = 2.0):
         """Draw top, front, and side views"""
+        panels = as_panel_set(panels)
         x_start = 100
         spacing = 350
 
@@ -255,93 +1045,85 @@ class BenchDrawing:
         y_offset += 25
 
         # Calculate bounding box of entire assembly
-        all_corners = []
-        for panel in panels:
-            all_corners.extend(panel.get_corners())
-
-        min_x = min(p.x for p in all_corners)
-        max_x = max(p.x for p in all_corners)
-        min_y = min(p.y for p in all_corners)
-        max_y = max(p.y for p in all_corners)
-        min_z = min(p.z for p in all_corners)
-        max_z = max(p.z for p in all_corners)
+        corners = panel_corners(panels)
+        min_x, min_y, min_z = corners.reshape(-1, 3).min(axis=0).tolist()
 
         # TOP VIEW (looking down -Z)
         self.svg.text(x_start + 50, y_offset, "Top View",
                      font_size=10, font_weight="normal", fill="black")
         y_offset += 20
 
-        for panel in panels:
-            corners = panel.get_corners()
-            # Project to XY plane
-            rect_points = [
-                (x_start + (corners[0].x - min_x) * scale,
-                 y_offset + (corners[0].y - min_y) * scale),
-                (x_start + (corners[1].x - min_x) * scale,
-                 y_offset + (corners[1].y - min_y) * scale),
-                (x_start + (corners[2].x - min_x) * scale,
-                 y_offset + (corners[2].y - min_y) * scale),
-                (x_start + (corners[3].x - min_x) * scale,
-                 y_offset + (corners[3].y - min_y) * scale),
-            ]
-            self.svg.polygon(rect_points, fill="white", stroke="black", stroke_width=0.5)
+        # Project to XY plane
+        top_x = x_start + (corners[:, FACE_BOTTOM, 0] - min_x) * scale
+        top_y = y_offset + (corners[:, FACE_BOTTOM, 1] - min_y) * scale
+
+        for i, xs, ys in _iter_rows(top_x, top_y):
+            self.svg.polygon(list(zip(xs, ys)),
+                             fill="white", stroke="black", stroke_width=0.5)
 
             # Draw holes
-            for hole in panel.holes:
-                hole_world = Point3D(
-                    panel.position.x + hole.x,
-                    panel.position.y + hole.y,
-                    panel.position.z + hole.z
-                )
-                hx = x_start + (hole_world.x - min_x) * scale
-                hy = y_offset + (hole_world.y - min_y) * scale
-                self.svg.circle(hx, hy, 2, fill="white", stroke="black", stroke_width=1)
+            holes = panels.holes(i)
+            if len(holes):
+                hole_world = panels.positions[i, :2] + holes[:, :2]
+                hx = (x_start + (hole_world[:, 0] - min_x) * scale).tolist()
+                hy = (y_offset + (hole_world[:, 1] - min_y) * scale).tolist()
+                for x, y in zip(hx, hy):
+                    self.svg.circle(x, y, 2, fill="white", stroke="black", stroke_width=1)
 
         # FRONT VIEW (looking from +Y)
         front_x = x_start + spacing
         self.svg.text(front_x + 50, y_offset - 20, "Front View",
                      font_size=10, font_weight="normal", fill="black")
 
-        for panel in panels:
-            corners = panel.get_corners()
-            # Project to XZ plane
-            rect_points = [
-                (front_x + (corners[0].x - min_x) * scale,
-                 y_offset + 250 - (corners[0].z - min_z) * scale),
-                (front_x + (corners[1].x - min_x) * scale,
-                 y_offset + 250 - (corners[1].z - min_z) * scale),
-                (front_x + (corners[5].x - min_x) * scale,
-                 y_offset + 250 - (corners[5].z - min_z) * scale),
-                (front_x + (corners[4].x - min_x) * scale,
-                 y_offset + 250 - (corners[4].z - min_z) * scale),
-            ]
-            self.svg.polygon(rect_points, fill="white", stroke="black", stroke_width=0.5)
+        # Project to XZ plane
+        front = [0, 1, 5, 4]
+        front_px = front_x + (corners[:, front, 0] - min_x) * scale
+        front_py = y_offset + 250 - (corners[:, front, 2] - min_z) * scale
+        for _, xs, ys in _iter_rows(front_px, front_py):
+            self.svg.polygon(list(zip(xs, ys)), fill="white", stroke="black", stroke_width=0.5)
 
         # SIDE VIEW (looking from +X)
         side_x = x_start + spacing * 2
         self.svg.text(side_x + 50, y_offset - 20, "Right Side View",
                      font_size=10, font_weight="normal", fill="black")
 
-        for panel in panels:
-            corners = panel.get_corners()
-            # Project to YZ plane
-            rect_points = [
-                (side_x + (corners[0].y - min_y) * scale,
-                 y_offset + 250 - (corners[0].z - min_z) * scale),
-                (side_x + (corners[3].y - min_y) * scale,
-                 y_offset + 250 - (corners[3].z - min_z) * scale),
-                (side_x + (corners[7].y - min_y) * scale,
-                 y_offset + 250 - (corners[7].z - min_z) * scale),
-                (side_x + (corners[4].y - min_y) * scale,
-                 y_offset + 250 - (corners[4].z - min_z) * scale),
-            ]
-            self.svg.polygon(rect_points, fill="white", stroke="black", stroke_width=0.5)
+        # Project to YZ plane
+        side = [0, 3, 7, 4]
+        side_px = side_x + (corners[:, side, 1] - min_y) * scale
+        side_py = y_offset + 250 - (corners[:, side, 2] - min_z) * scale
+        for _, xs, ys in _iter_rows(side_px, side_py):
+            self.svg.polygon(list(zip(xs, ys)), fill="white", stroke="black", stroke_width=0.5)
 
         return y_offset + 270
 
-    def draw_isometric_view(self, panels: List[Panel],
+    def _draw_iso_boxes(self, positions: np.ndarray, sizes: np.ndarray,
+                        x_center: float, y_center: float,
+                        scale: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Draw boxes with hidden faces removed; returns projected corner x, y
+
+        Back faces and faces pressed against a neighbour are skipped, and
+        the remaining faces are painted box by box in depth order.
+        """
+        iso = ISOMETRIC.project(box_corners(positions, sizes), scale)
+        iso_x = x_center + iso[..., 0]
+        iso_y = y_center + iso[..., 1]
+
+        faces = visible_faces(ISOMETRIC.view_direction)
+        drawn = ~covered_faces(positions, sizes, faces)
+        order = depth_order(positions, sizes)
+        face_corners = BOX_FACES[faces]
+        for _, xs, ys, show in _iter_rows(iso_x[order][:, face_corners],
+                                          iso_y[order][:, face_corners],
+                                          drawn[order]):
+            self.svg.polygons([list(zip(fx, fy)) for fx, fy, visible in zip(xs, ys, show) if visible],
+                              fill="white", stroke="black", stroke_width=0.5)
+        return iso_x, iso_y
+
+    @_stage('isometric')
+    def draw_isometric_view(self, panels: Panels,
                            y_offset: int, scale: float = 2.5):
         """Draw isometric 3D projection"""
+        panels = as_panel_set(panels)
         self.svg.text(50, y_offset, "ISOMETRIC VIEW",
                      font_size=12, font_weight="normal")
         y_offset += 25
@@ -349,59 +1131,35 @@ class BenchDrawing:
         x_center = 400
         y_center = y_offset + 150
 
-        # Draw each panel in isometric
-        for panel in panels:
-            corners = panel.get_corners()
-
-            # Convert to isometric projection
-            iso_points = [c.to_isometric(scale) for c in corners]
-
-            # Draw visible faces (simple back-to-front)
-            # Bottom face (0,1,2,3)
-            face_bottom = [
-                (x_center + iso_points[0][0], y_center + iso_points[0][1]),
-                (x_center + iso_points[1][0], y_center + iso_points[1][1]),
-                (x_center + iso_points[2][0], y_center + iso_points[2][1]),
-                (x_center + iso_points[3][0], y_center + iso_points[3][1]),
-            ]
-            self.svg.polygon(face_bottom, fill="white", stroke="black",
-                           stroke_width=0.5, opacity=1.0)
-
-            # Top face (4,5,6,7)
-            face_top = [
-                (x_center + iso_points[4][0], y_center + iso_points[4][1]),
-                (x_center + iso_points[5][0], y_center + iso_points[5][1]),
-                (x_center + iso_points[6][0], y_center + iso_points[6][1]),
-                (x_center + iso_points[7][0], y_center + iso_points[7][1]),
-            ]
-            self.svg.polygon(face_top, fill="white", stroke="black",
-                           stroke_width=0.5)
-
-            # Right face (1,2,6,5)
-            face_right = [
-                (x_center + iso_points[1][0], y_center + iso_points[1][1]),
-                (x_center + iso_points[2][0], y_center + iso_points[2][1]),
-                (x_center + iso_points[6][0], y_center + iso_points[6][1]),
-                (x_center + iso_points[5][0], y_center + iso_points[5][1]),
-            ]
-            self.svg.polygon(face_right, fill="white", stroke="black",
-                           stroke_width=0.5, opacity=1.0)
+        # Draw front-facing, uncovered faces in depth order
+        self._draw_iso_boxes(panels.positions, panels.sizes, x_center, y_center, scale)
 
         # Add material notes
         materials_y = y_center + 200
         self.svg.text(x_center + 250, materials_y, "Materials",
                      font_size=10, font_weight="normal", fill="black")
-        for i, panel in enumerate(panels):
+        for i, (name, material, thickness) in enumerate(
+                zip(panels.names, panels.materials, panels.thicknesses.tolist())):
             self.svg.text(x_center + 250, materials_y + 16 + i*14,
-                         f"{panel.name}: {panel.material} {panel.thickness}\"",
+                         f"{name}: {material} {thickness}\"",
                          font_size=9, fill="black")
 
         return y_offset + 320
 
-    def draw_exploded_view(self, panels: List[Panel],
+    @_stage('exploded')
+    def draw_exploded_view(self, panels: Panels,
                           y_offset: int, scale: float = 2.5,
-                          explode_distance: float = 5.0):
-        """Draw exploded assembly view"""
+                          explode_distance: Optional[float] = None,
+                          offsets: np.ndarray = None,
+                          connections: Optional[Sequence[Tuple[int, int]]] = None):
+        """Draw exploded assembly view
+
+        offsets gives each panel's (N, 3) explode translation, e.g. from a
+        BenchModel, and connections the (a, b) panel pairs joined by dashed
+        assembly lines. Either defaults to the panels' contact graph (see
+        contact_graph.exploded_offsets), with explode_distance as its step.
+        """
+        panels = as_panel_set(panels)
         self.svg.text(50, y_offset, "EXPLODED ASSEMBLY",
                      font_size=12, font_weight="normal")
         y_offset += 25
@@ -409,67 +1167,63 @@ class BenchDrawing:
         x_center = 400
         y_center = y_offset + 150
 
-        # Explode panels along primary axis
-        exploded_panels = []
-        for i, panel in enumerate(panels):
-            # Move panel along Z axis for explosion
-            offset = explode_distance * (i - len(panels)//2)
-            exploded_pos = panel.position.translate(0, 0, offset)
-            exploded_panel = Panel(
-                panel.name, panel.width, panel.depth, panel.thickness,
-                exploded_pos, panel.holes, panel.material
-            )
-            exploded_panels.append(exploded_panel)
-
-        # Draw exploded panels
-        for panel in exploded_panels:
-            corners = panel.get_corners()
-            iso_points = [c.to_isometric(scale) for c in corners]
-
-            # Top face
-            face_top = [
-                (x_center + iso_points[4][0], y_center + iso_points[4][1]),
-                (x_center + iso_points[5][0], y_center + iso_points[5][1]),
-                (x_center + iso_points[6][0], y_center + iso_points[6][1]),
-                (x_center + iso_points[7][0], y_center + iso_points[7][1]),
-            ]
-            self.svg.polygon(face_top, fill="white", stroke="black",
-                           stroke_width=0.5)
-
-            # Right face
-            face_right = [
-                (x_center + iso_points[1][0], y_center + iso_points[1][1]),
-                (x_center + iso_points[2][0], y_center + iso_points[2][1]),
-                (x_center + iso_points[6][0], y_center + iso_points[6][1]),
-                (x_center + iso_points[5][0], y_center + iso_points[5][1]),
-            ]
-            self.svg.polygon(face_right, fill="white", stroke="black",
-                           stroke_width=0.5)
-
-            # Label
-            label_pos = iso_points[6]
-            self.svg.text(x_center + label_pos[0] + 10,
-                         y_center + label_pos[1],
-                         panel.name, font_size=8, fill="black")
-
-        # Draw assembly direction arrows
-        for i in range(len(exploded_panels) - 1):
-            p1 = exploded_panels[i].get_corners()[6]
-            p2 = exploded_panels[i+1].get_corners()[4]
-            iso1 = p1.to_isometric(scale)
-            iso2 = p2.to_isometric(scale)
-
+        positions, sizes = panel_arrays(panels)
+        if offsets is None or connections is None:
+            from contact_graph import connection_pairs, exploded_offsets
+
+            layout, edges = exploded_offsets(panels, explode_distance)
+            offsets = layout if offsets is None else offsets
+            connections = connection_pairs(edges) if connections is None else connections
+        positions += offsets
+
+        # Draw exploded panels, then label them on top
+        iso_x, iso_y = self._draw_iso_boxes(positions, sizes, x_center, y_center, scale)
+        for i, x, y in _iter_rows(iso_x[:, 6], iso_y[:, 6]):
+            self.svg.text(x + 10, y, panels.names[i], font_size=8, fill="black")
+
+        # Draw assembly lines between the centres of contacting panels
+        pairs = np.asarray(connections, dtype=np.int64).reshape(-1, 2)
+        centre_x, centre_y = iso_x.mean(axis=1), iso_y.mean(axis=1)
+        a, b = pairs[:, 0], pairs[:, 1]
+        for _, x1, y1, x2, y2 in _iter_rows(centre_x[a], centre_y[a], centre_x[b], centre_y[b]):
             self.svg.line(
-                x_center + iso1[0], y_center + iso1[1],
-                x_center + iso2[0], y_center + iso2[1],
+                x1, y1, x2, y2,
                 stroke="black", stroke_width=0.5,
                 stroke_dasharray="2,2", opacity=0.5
             )
 
         return y_offset + 320
 
-    def draw_flat_patterns(self, panels: List[Panel], y_offset: int, scale: float = 1.5):
+    @staticmethod
+    def _draw_flat_outline(svg: SVGDrawing, px: float, py: float, width: float, depth: float,
+                           holes: np.ndarray, scale: float):
+        """Draw one panel's outline, holes and dimensions with its corner at (px, py)"""
+        pw = width * scale
+        ph = depth * scale
+
+        svg.rect(px, py, pw, ph, fill="white",
+                 stroke="black", stroke_width=1)
+
+        # Draw holes
+        for hole_x, hole_y, _ in holes.tolist():
+            hx = px + hole_x * scale
+            hy = py + hole_y * scale
+            svg.circle(hx, hy, 2, fill="white",
+                       stroke="black", stroke_width=0.5)
+            # Hole dimension
+            svg.text(hx + 6, hy + 3, f"Ø0.25\"",
+                     font_size=7, fill="black")
+
+        # Dimensions
+        svg.dimension_line(px, py, px + pw, py,
+                           f"{width:.1f}\"", offset=-15)
+        svg.dimension_line(px, py, px, py + ph,
+                           f"{depth:.1f}\"", offset=-15)
+
+    @_stage('flat_patterns')
+    def draw_flat_patterns(self, panels: Panels, y_offset: int, scale: float = 1.5):
         """Draw flat patterns for cutting"""
+        panels = as_panel_set(panels)
         self.svg.text(50, y_offset, "FLAT PATTERNS",
                      font_size=12, font_weight="normal")
         self.svg.text(50, y_offset + 16,
@@ -480,37 +1234,43 @@ class BenchDrawing:
         x_offset = 100
         y_pos = y_offset
 
-        for panel in panels:
+        widths = panels.widths.tolist()
+        depths = panels.depths.tolist()
+        thicknesses = panels.thicknesses.tolist()
+        materials = panels.materials
+
+        # In compact mode identical flat patterns are drawn once as a symbol
+        shapes: Dict[Tuple, int] = {}
+        shape_ids = []
+        if self.svg.compact:
+            for i in range(len(panels)):
+                key = (widths[i], depths[i], panels.holes(i)[:, :2].tobytes())
+                shape_ids.append(shapes.setdefault(key, len(shapes)))
+        repeats = np.bincount(np.array(shape_ids, dtype=np.int64), minlength=len(shapes))
+
+        for i, name in enumerate(panels.names):
             # Draw panel outline
             px = x_offset
             py = y_pos
-            pw = panel.width * scale
-            ph = panel.depth * scale
-
-            self.svg.rect(px, py, pw, ph, fill="white",
-                         stroke="black", stroke_width=1)
-
-            # Draw holes
-            for hole in panel.holes:
-                hx = px + hole.x * scale
-                hy = py + hole.y * scale
-                self.svg.circle(hx, hy, 2, fill="white",
-                              stroke="black", stroke_width=0.5)
-                # Hole dimension
-                self.svg.text(hx + 6, hy + 3, f"Ø0.25\"",
-                            font_size=7, fill="black")
-
-            # Dimensions
-            self.svg.dimension_line(px, py, px + pw, py,
-                                   f"{panel.width:.1f}\"", offset=-15)
-            self.svg.dimension_line(px, py, px, py + ph,
-                                   f"{panel.depth:.1f}\"", offset=-15)
+            pw = widths[i] * scale
+            ph = depths[i] * scale
+
+            if shape_ids and repeats[shape_ids[i]] > 1:
+                symbol_id = f"flat-{shape_ids[i]}"
+                if not self.svg.has_symbol(symbol_id):
+                    with self.svg.symbol(symbol_id) as symbol:
+                        self._draw_flat_outline(symbol, 0, 0, widths[i], depths[i],
+                                                panels.holes(i), scale)
+                self.svg.use(symbol_id, px, py)
+            else:
+                self._draw_flat_outline(self.svg, px, py, widths[i], depths[i],
+                                        panels.holes(i), scale)
 
             # Label
-            self.svg.text(px + pw/2, py - 25, panel.name,
+            self.svg.text(px + pw/2, py - 25, name,
                          font_size=10, font_weight="normal", anchor="middle")
             self.svg.text(px + pw/2, py - 14,
-                         f"{panel.material} - {panel.thickness}\" thick",
+                         f"{materials[i]} - {thicknesses[i]}\" thick",
                          font_size=8, fill="black", anchor="middle")
 
             # Move to next panel position
@@ -521,37 +1281,120 @@ class BenchDrawing:
 
         return max(y_pos, y_offset + 300)
 
+    @_stage('save')
     def save(self, filename: str):
         """Save SVG to file"""
         with open(filename, 'w') as f:
-            f.write(self.svg.to_svg())
+            self.svg.write_to(f)
+
+    @_stage('close')
+    def close(self):
+        """Finish a streamed drawing"""
+        self.svg.close()
+
+
+@contextmanager
+def stream_drawing(concept_name: str, filename: str, compact: bool = False,
+                   precision: int = 2, profiler: Any = None) -> Iterator[BenchDrawing]:
+    """Open a BenchDrawing that writes elements straight to filename
+
+    With a profiler, the whole drawing is recorded as one stage named after
+    the concept, with the individual views nested inside it. Elements go to
+    a temporary file that replaces filename only once the drawing closes,
+    so a failed render leaves the previous drawing in place.
+    """
+    tmp_path = filename + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            drawing = BenchDrawing(concept_name, sink=f, compact=compact, precision=precision,
+                                   profiler=profiler)
+            with drawing.stage(concept_name):
+                yield drawing
+                drawing.close()
+        os.replace(tmp_path, filename)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def render_bench_drawing(concept_name: str, panels: Panels, filename: str,
+                         ortho_scale: float = 2.0, iso_scale: float = 2.5,
+                         explode_distance: Optional[float] = None, flat_scale: float = 1.5,
+                         cache: Any = None, compact: bool = False, precision: int = 2,
+                         exploded_offsets: np.ndarray = None,
+                         exploded_connections: Optional[Sequence[Tuple[int, int]]] = None,
+                         profiler: Any = None) -> bool:
+    """Stream the full drawing sheet for one concept to filename
+
+    compact selects SVGDrawing's compact output; exploded_offsets and
+    exploded_connections override the contact-graph explode layout and
+    assembly lines (see draw_exploded_view). profiler (a
+    profiling.StageProfiler) records every drawing stage. With a
+    render_cache.RenderCache, rendering is skipped when the same geometry
+    and parameters were already rendered. Returns True if the drawing was
+    rendered.
+    """
+    panels = as_panel_set(panels)
+    params = dict(ortho_scale=ortho_scale, iso_scale=iso_scale,
+                  explode_distance=explode_distance, flat_scale=flat_scale)
+    if compact:
+        params.update(compact=True, precision=precision)
+    if exploded_offsets is not None:
+        params['exploded_offsets'] = np.asarray(exploded_offsets, dtype=float).tolist()
+    if exploded_connections is not None:
+        params['exploded_connections'] = np.asarray(exploded_connections, dtype=np.int64).tolist()
+
+    def render():
+        with stream_drawing(concept_name, filename, compact, precision, profiler) as drawing:
+            y = drawing.draw_title_block()
+            y = drawing.draw_orthographic_views(panels, y, scale=ortho_scale)
+            y = drawing.draw_isometric_view(panels, y, scale=iso_scale)
+            y = drawing.draw_exploded_view(panels, y, scale=iso_scale,
+                                           explode_distance=explode_distance,
+                                           offsets=exploded_offsets,
+                                           connections=exploded_connections)
+            y = drawing.draw_flat_patterns(panels, y, scale=flat_scale)
+
+    if cache is None:
+        render()
+        return True
+
+    from render_cache import drawing_cache_key
+    return cache.render(drawing_cache_key(concept_name, panels, params), filename, render)
 
 
 # Concept-specific definitions
 
-def create_concept_4_slab_legs() -> List[Panel]:
-    """Create Concept 4: Thin Slab Legs panels"""
+def create_concept_4_slab_legs(length: float = 60.0, depth: float = 11.0,
+                               height: float = 16.0, seat_thickness: float = 0.125,
+                               leg_thickness: float = 0.250,
+                               leg_inset: float = 5.0) -> List[Panel]:
+    """Create Concept 4: Thin Slab Legs panels
+
+    height is the leg height (underside of the seat); leg_inset is measured
+    from each end of the seat to the outer face of the leg.
+    """
     panels = []
 
     # Seat panel: 60" x 11" x 0.125"
     # Position at Z = 16" (height of legs)
     seat = Panel(
         name="Seat Panel",
-        width=60.0,
-        depth=11.0,
-        thickness=0.125,
-        position=Point3D(0, 0, 16.0),
+        width=length,
+        depth=depth,
+        thickness=seat_thickness,
+        position=Point3D(0, 0, height),
         holes=[
             # 4 mounting holes per leg, 2" from edges
             Point3D(2, 2, 0),
-            Point3D(2, 9, 0),
+            Point3D(2, depth - 2, 0),
             Point3D(9, 2, 0),
-            Point3D(9, 9, 0),
+            Point3D(9, depth - 2, 0),
             # Right leg holes
-            Point3D(51, 2, 0),
-            Point3D(51, 9, 0),
-            Point3D(58, 2, 0),
-            Point3D(58, 9, 0),
+            Point3D(length - 9, 2, 0),
+            Point3D(length - 9, depth - 2, 0),
+            Point3D(length - 2, 2, 0),
+            Point3D(length - 2, depth - 2, 0),
         ],
         material="304 Stainless Steel"
     )
@@ -560,14 +1403,14 @@ def create_concept_4_slab_legs() -> List[Panel]:
     # Left leg: 0.25" thin x 11" deep x 16" tall (VERTICAL SLAB running front-to-back)
     left_leg = Panel(
         name="Left Leg",
-        width=0.250,       # X: 0.25" thin (perpendicular to bench length)
-        depth=11.0,        # Y: 11" deep (runs full seat depth, front to back)
-        thickness=16.0,    # Z: 16" tall (vertical height)
-        position=Point3D(5.0, 0, 0),  # 5" inset from left edge
+        width=leg_thickness,  # X: 0.25" thin (perpendicular to bench length)
+        depth=depth,          # Y: 11" deep (runs full seat depth, front to back)
+        thickness=height,     # Z: 16" tall (vertical height)
+        position=Point3D(leg_inset, 0, 0),  # 5" inset from left edge
         holes=[
             # Mounting holes at top edge for seat connection
-            Point3D(0.125, 2, 15.5),
-            Point3D(0.125, 9, 15.5),
+            Point3D(leg_thickness / 2, 2, height - 0.5),
+            Point3D(leg_thickness / 2, depth - 2, height - 0.5),
         ],
         material="304 Stainless Steel"
     )
@@ -576,14 +1419,14 @@ def create_concept_4_slab_legs() -> List[Panel]:
     # Right leg: 0.25" thin x 11" deep x 16" tall (VERTICAL SLAB running front-to-back)
     right_leg = Panel(
         name="Right Leg",
-        width=0.250,       # X: 0.25" thin (perpendicular to bench length)
-        depth=11.0,        # Y: 11" deep (runs full seat depth, front to back)
-        thickness=16.0,    # Z: 16" tall (vertical height)
-        position=Point3D(54.75, 0, 0),  # 5" inset from right edge (60 - 5 - 0.25)
+        width=leg_thickness,  # X: 0.25" thin (perpendicular to bench length)
+        depth=depth,          # Y: 11" deep (runs full seat depth, front to back)
+        thickness=height,     # Z: 16" tall (vertical height)
+        position=Point3D(length - leg_inset - leg_thickness, 0, 0),  # 5" inset from right edge (60 - 5 - 0.25)
         holes=[
             # Mounting holes at top edge for seat connection
-            Point3D(0.125, 2, 15.5),
-            Point3D(0.125, 9, 15.5),
+            Point3D(leg_thickness / 2, 2, height - 0.5),
+            Point3D(leg_thickness / 2, depth - 2, height - 0.5),
         ],
         material="304 Stainless Steel"
     )
@@ -592,24 +1435,32 @@ def create_concept_4_slab_legs() -> List[Panel]:
     return panels
 
 
-def create_concept_2_u_modules() -> List[Panel]:
-    """Create Concept 2: Three interlocking U-modules"""
+def create_concept_2_u_modules(module_count: int = 3, module_width: float = 21.0,
+                               depth: float = 12.0, height: float = 17.0,
+                               thickness: float = 0.100, foot_width: float = 3.0,
+                               foot_height: float = 3.0) -> List[Panel]:
+    """Create Concept 2: Three interlocking U-modules
+
+    height is the seat underside height; walls run from the top of the
+    feet up to the seat.
+    """
     panels = []
 
     # Each U-module is 21" wide x 12" deep x 17" tall
     # U-shape: bottom feet (3" tall) + vertical walls (14" tall) + seat on top
     # Flat pattern before bending: 21" x 31" (3" + 14" + 12" + 14" + 3" - some overlap)
+    wall_height = height - foot_height
 
-    for i in range(3):
-        x_pos = i * 21.0  # Position modules side by side
+    for i in range(module_count):
+        x_pos = i * module_width  # Position modules side by side
 
         # Seat portion of U (horizontal on top)
         seat = Panel(
             name=f"Module {i+1} - Seat",
-            width=21.0,       # X: 21" wide (full width of module)
-            depth=12.0,       # Y: 12" deep
-            thickness=0.100,  # Z: 0.1" thin horizontal panel
-            position=Point3D(x_pos, 0, 17.0),  # At top of U
+            width=module_width,  # X: 21" wide (full width of module)
+            depth=depth,         # Y: 12" deep
+            thickness=thickness, # Z: 0.1" thin horizontal panel
+            position=Point3D(x_pos, 0, height),  # At top of U
             holes=[],
             material="304 Stainless Steel"
         )
@@ -618,10 +1469,10 @@ def create_concept_2_u_modules() -> List[Panel]:
         # Left vertical wall of U (thin plate spanning full depth)
         left_wall = Panel(
             name=f"Module {i+1} - Left Wall",
-            width=0.100,      # X: 0.1" thin (vertical plate thickness)
-            depth=12.0,       # Y: 12" deep (spans full seat depth front-to-back)
-            thickness=14.0,   # Z: 14" tall (vertical height)
-            position=Point3D(x_pos, 0, 3.0),  # At left edge, starts above feet
+            width=thickness,       # X: 0.1" thin (vertical plate thickness)
+            depth=depth,           # Y: 12" deep (spans full seat depth front-to-back)
+            thickness=wall_height, # Z: 14" tall (vertical height)
+            position=Point3D(x_pos, 0, foot_height),  # At left edge, starts above feet
             holes=[],
             material="304 Stainless Steel"
         )
@@ -630,10 +1481,10 @@ def create_concept_2_u_modules() -> List[Panel]:
         # Right vertical wall of U (thin plate spanning full depth)
         right_wall = Panel(
             name=f"Module {i+1} - Right Wall",
-            width=0.100,      # X: 0.1" thin (vertical plate thickness)
-            depth=12.0,       # Y: 12" deep (spans full seat depth front-to-back)
-            thickness=14.0,   # Z: 14" tall (vertical height)
-            position=Point3D(x_pos + 20.9, 0, 3.0),  # At right edge (21 - 0.1), starts above feet
+            width=thickness,       # X: 0.1" thin (vertical plate thickness)
+            depth=depth,           # Y: 12" deep (spans full seat depth front-to-back)
+            thickness=wall_height, # Z: 14" tall (vertical height)
+            position=Point3D(x_pos + (module_width - thickness), 0, foot_height),  # At right edge (21 - 0.1), starts above feet
             holes=[],
             material="304 Stainless Steel"
         )
@@ -642,9 +1493,9 @@ def create_concept_2_u_modules() -> List[Panel]:
         # Left foot of U (horizontal base under left wall)
         left_foot = Panel(
             name=f"Module {i+1} - Left Foot",
-            width=3.0,        # X: 3" wide
-            depth=12.0,       # Y: 12" deep
-            thickness=3.0,    # Z: 3" tall base
+            width=foot_width,      # X: 3" wide
+            depth=depth,           # Y: 12" deep
+            thickness=foot_height, # Z: 3" tall base
             position=Point3D(x_pos, 0, 0),  # Aligned with left wall
             holes=[],
             material="304 Stainless Steel"
@@ -654,10 +1505,10 @@ def create_concept_2_u_modules() -> List[Panel]:
         # Right foot of U (horizontal base under right wall)
         right_foot = Panel(
             name=f"Module {i+1} - Right Foot",
-            width=3.0,        # X: 3" wide
-            depth=12.0,       # Y: 12" deep
-            thickness=3.0,    # Z: 3" tall base
-            position=Point3D(x_pos + 18.9, 0, 0),  # Aligned with right wall (21 - 3 + 0.9)
+            width=foot_width,      # X: 3" wide
+            depth=depth,           # Y: 12" deep
+            thickness=foot_height, # Z: 3" tall base
+            position=Point3D(x_pos + (module_width - foot_width), 0, 0),  # Flush under right wall (21 - 3)
             holes=[],
             material="304 Stainless Steel"
         )
@@ -667,32 +1518,30 @@ def create_concept_2_u_modules() -> List[Panel]:
 
 
 if __name__ == "__main__":
+    import argparse
+    from render_cache import RenderCache
+
+    parser = argparse.ArgumentParser(description="Generate SVG technical drawings")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-render even if the render cache is up to date")
+    parser.add_argument('--compact', action='store_true',
+                        help="Merge same-style shapes into paths and reuse repeated geometry")
+    parser.add_argument('--precision', type=int, default=2,
+                        help="Decimal places for coordinates in compact output")
+    args = parser.parse_args()
+    cache = None if args.no_cache else RenderCache()
+    options = dict(cache=cache, compact=args.compact, precision=args.precision)
+
+    from bench_model import build_model
+
     # Generate Concept 4 drawings
     print("Generating Concept 4 (Slab Legs) technical drawings...")
-    concept4 = BenchDrawing("Concept 4: Thin Slab Legs")
-    panels4 = create_concept_4_slab_legs()
-
-    y = concept4.draw_title_block()
-    y = concept4.draw_orthographic_views(panels4, y)
-    y = concept4.draw_isometric_view(panels4, y)
-    y = concept4.draw_exploded_view(panels4, y)
-    y = concept4.draw_flat_patterns(panels4, y)
-
-    concept4.save("concept-4-drawings.svg")
-    print("✓ Saved concept-4-drawings.svg")
+    rendered = build_model('concept-4').render_drawing("concept-4-drawings.svg", **options)
+    print("✓ Saved concept-4-drawings.svg" if rendered else "✓ concept-4-drawings.svg up to date")
 
     # Generate Concept 2 drawings
     print("\nGenerating Concept 2 (U-Modules) technical drawings...")
-    concept2 = BenchDrawing("Concept 2: Interlocking U-Modules")
-    panels2 = create_concept_2_u_modules()
-
-    y = concept2.draw_title_block()
-    y = concept2.draw_orthographic_views(panels2, y)
-    y = concept2.draw_isometric_view(panels2, y)
-    y = concept2.draw_exploded_view(panels2, y)
-    y = concept2.draw_flat_patterns(panels2, y)
-
-    concept2.save("concept-2-drawings.svg")
-    print("✓ Saved concept-2-drawings.svg")
+    rendered = build_model('concept-2').render_drawing("concept-2-drawings.svg", **options)
+    print("✓ Saved concept-2-drawings.svg" if rendered else "✓ concept-2-drawings.svg up to date")
 
     print("\n✓ SVG technical drawings complete!")